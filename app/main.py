@@ -37,7 +37,7 @@ from engine.fluids import HydroKernel
 from engine.erosion_process import ErosionProcess
 from engine.script_engine import ScriptExecutor
 from engine.system import EarthSystem
-from engine.ideal_landforms import IDEAL_LANDFORM_GENERATORS, ANIMATED_LANDFORM_GENERATORS, create_delta, create_alluvial_fan, create_meander, create_u_valley, create_v_valley, create_barchan_dune, create_coastal_cliff
+from engine.ideal_landforms import IDEAL_LANDFORM_GENERATORS, ANIMATED_LANDFORM_GENERATORS, render_frames, get_landform, create_delta, create_alluvial_fan, create_meander, create_u_valley, create_v_valley, create_barchan_dune, create_coastal_cliff
 
 # 페이지 설정
 st.set_page_config(
@@ -3146,14 +3146,8 @@ def main():
             
             # 동적 지형 생성 (IDEAL_LANDFORM_GENERATORS 사용)
             if landform_key in IDEAL_LANDFORM_GENERATORS:
-                generator = IDEAL_LANDFORM_GENERATORS[landform_key]
-                
-                # lambda인 경우 grid_size만 전달
-                try:
-                    elevation = generator(gallery_grid_size)
-                except TypeError:
-                    # stage 인자가 필요한 경우
-                    elevation = generator(gallery_grid_size, 1.0)
+                # 같은 지형/해상도는 캐시된 결과 재사용 (읽기 전용)
+                elevation = get_landform(landform_key, gallery_grid_size)
             else:
                 st.error(f"지형 '{landform_key}' 생성기를 찾을 수 없습니다.")
                 elevation = np.zeros((gallery_grid_size, gallery_grid_size))
@@ -3253,9 +3247,9 @@ def main():
                     key="gallery_stage_slider"
                 )
                 
-                # 해당 단계 지형 생성
+                # 해당 단계 지형 생성 (슬라이더 단계별로 캐시)
                 anim_func = ANIMATED_LANDFORM_GENERATORS[landform_key]
-                stage_elev = anim_func(gallery_grid_size, stage_value)
+                stage_elev = get_landform(landform_key, gallery_grid_size, stage_value)
                 
                 # 물 생성
                 stage_water = np.maximum(0, -stage_elev + 1.0)
@@ -3287,9 +3281,11 @@ def main():
                     stage_container = st.empty()
                     prog = st.progress(0)
                     
-                    for i in range(11):
-                        s = i / 10.0
-                        elev = anim_func(gallery_grid_size, s)
+                    # 11개 프레임을 미리 병렬 생성 (CPU 코어 수만큼 스레드)
+                    stages = [i / 10.0 for i in range(11)]
+                    frames = render_frames(anim_func, gallery_grid_size, stages, max_workers=None)
+                    
+                    for s, elev in zip(stages, frames):
                         water = np.maximum(0, -elev + 1.0)
                         water[elev > 2] = 0
                         
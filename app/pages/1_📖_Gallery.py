@@ -12,7 +12,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from engine.ideal_landforms import IDEAL_LANDFORM_GENERATORS, ANIMATED_LANDFORM_GENERATORS
+from engine.ideal_landforms import IDEAL_LANDFORM_GENERATORS, ANIMATED_LANDFORM_GENERATORS, get_landform
 from app.components.renderer import render_terrain_plotly
 from app.components.animation_renderer import create_animated_terrain_figure
 
@@ -129,11 +129,8 @@ with col_sel:
     
     # 동적 지형 생성
     if landform_key in IDEAL_LANDFORM_GENERATORS:
-        generator = IDEAL_LANDFORM_GENERATORS[landform_key]
-        try:
-            elevation = generator(gallery_grid_size)
-        except TypeError:
-            elevation = generator(gallery_grid_size, 1.0)
+        # 같은 지형/해상도는 캐시된 결과 재사용 (읽기 전용)
+        elevation = get_landform(landform_key, gallery_grid_size)
     else:
         st.error(f"지형 '{landform_key}' 생성기를 찾을 수 없습니다.")
         elevation = np.zeros((gallery_grid_size, gallery_grid_size))
@@ -103,8 +103,11 @@ class Water:
         """강수 추가 (m/s per cell)"""
         self.discharge += rate
     
-    def accumulate_flow(self):
-        """흐름 누적 계산 (간단한 D8 알고리즘)"""
+    def accumulate_flow(self, slope: np.ndarray = None):
+        """흐름 누적 계산 (간단한 D8 알고리즘)
+        
+        slope: 미리 계산한 경사도 (지형이 그대로인 동안 재사용 가능)
+        """
         h, w = self.terrain.height, self.terrain.width
         accumulated = self.discharge.copy()
         
@@ -133,7 +136,9 @@ class Water:
         self.discharge = accumulated
         
         # 유속 계산 (Manning 방정식 단순화)
-        slope = self.terrain.get_slope() + 0.001  # 0 방지
+        if slope is None:
+            slope = self.terrain.get_slope()
+        slope = slope + 0.001  # 0 방지
         self.velocity = 2.0 * np.sqrt(slope) * np.power(self.discharge + 0.1, 0.4)
 
 
@@ -13,6 +13,34 @@ import os
 from datetime import datetime
 from typing import Tuple, Dict, Optional, Any
 from io import BytesIO, StringIO
+from numba import jit
+
+
+@jit(nopython=True, cache=True)
+def _dem_stats_kernel(flat):
+    """
+    min/max/mean/분산을 한 번의 순회로 계산 (NaN 제외, Welford 누적)
+    """
+    n = 0
+    mn = np.inf
+    mx = -np.inf
+    mean = 0.0
+    m2 = 0.0
+    
+    for i in range(flat.size):
+        v = flat[i]
+        if np.isnan(v):
+            continue
+        n += 1
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        delta = v - mean
+        mean += delta / n
+        m2 += delta * (v - mean)
+    
+    return mn, mx, mean, m2, n
 
 
 def load_dem_csv(file_content: str, delimiter: str = ',') -> np.ndarray:
@@ -68,15 +96,21 @@ def load_dem_asc(file_content: str) -> Tuple[np.ndarray, Dict]:
         else:
             break
     
-    # 데이터 파싱
-    data_lines = lines[data_start:]
-    data = []
-    for line in data_lines:
-        row = [float(x) for x in line.strip().split()]
-        if row:
-            data.append(row)
-    
-    elevation = np.array(data)
+    # 데이터 파싱 (셀 단위 float() 변환 대신 np.loadtxt로 한 번에 파싱)
+    data_lines = [line for line in lines[data_start:] if line.strip()]
+    if not data_lines:
+        raise ValueError("ASC 파싱 오류: 데이터가 없습니다")
+
+    try:
+        # 숫자가 아닌 토큰이나 행마다 다른 열 개수는 ValueError
+        elevation = np.loadtxt(StringIO('\n'.join(data_lines)), dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        raise ValueError(f"ASC 파싱 오류: {e}")
+
+    nrows = int(header.get('nrows', elevation.shape[0]))
+    ncols = int(header.get('ncols', elevation.shape[1]))
+    if elevation.shape != (nrows, ncols):
+        raise ValueError(f"ASC 파싱 오류: 데이터 크기{elevation.shape}가 nrows x ncols({nrows} x {ncols})와 맞지 않습니다")
     
     # NODATA 처리
     nodata = header.get('nodata_value', -9999)
@@ -112,12 +146,14 @@ def save_dem_asc(
     yllcorner: float = 0.0,
     nodata: float = -9999
 ):
-    """DEM을 ESRI ASCII Grid로 저장"""
-    nrows, ncols = elevation.shape
+    """
+    DEM을 ESRI ASCII Grid로 저장
     
-    # NaN을 NODATA로 변환
-    data = elevation.copy()
-    data[np.isnan(data)] = nodata
+    NaN이 없으면 원본을 그대로 기록하고, 있으면 한 행 버퍼에서만
+    NODATA로 바꿔 기록하므로 전체 복사본을 만들지 않음
+    """
+    nan_mask = np.isnan(elevation)
+    nrows, ncols = elevation.shape
     
     with open(filepath, 'w') as f:
         f.write(f"ncols {ncols}\n")
@@ -127,8 +163,15 @@ def save_dem_asc(
         f.write(f"cellsize {cellsize}\n")
         f.write(f"nodata_value {nodata}\n")
         
-        for row in data:
-            f.write(' '.join(f'{x:.4f}' for x in row) + '\n')
+        if not nan_mask.any():
+            np.savetxt(f, elevation, fmt='%.4f', delimiter=' ')
+            return
+        
+        buf = np.empty((1, ncols), dtype=elevation.dtype)
+        for row, row_nan in zip(elevation, nan_mask):
+            np.copyto(buf[0], row)
+            np.copyto(buf[0], nodata, where=row_nan)
+            np.savetxt(f, buf, fmt='%.4f', delimiter=' ')
 
 
 def export_to_bytes_csv(elevation: np.ndarray) -> bytes:
@@ -215,19 +258,23 @@ def create_export_bundle(
 
 def get_dem_statistics(elevation: np.ndarray) -> Dict[str, float]:
     """DEM 기본 통계 계산"""
-    valid = elevation[~np.isnan(elevation)]
+    # 단일 순회 커널 (중앙값만 별도 계산)
+    mn, mx, mean, m2, n_valid = _dem_stats_kernel(np.ascontiguousarray(elevation, dtype=np.float64).ravel())
     
-    if len(valid) == 0:
+    if n_valid == 0:
         return {'error': 'No valid data'}
     
+    std = np.sqrt(m2 / n_valid)
+    median = np.nanmedian(elevation)
+    
     return {
-        'min': float(np.min(valid)),
-        'max': float(np.max(valid)),
-        'mean': float(np.mean(valid)),
-        'std': float(np.std(valid)),
-        'median': float(np.median(valid)),
-        'range': float(np.max(valid) - np.min(valid)),
-        'valid_cells': int(len(valid)),
+        'min': float(mn),
+        'max': float(mx),
+        'mean': float(mean),
+        'std': float(std),
+        'median': float(median),
+        'range': float(mx - mn),
+        'valid_cells': int(n_valid),
         'total_cells': int(elevation.size),
-        'nodata_cells': int(elevation.size - len(valid))
+        'nodata_cells': int(elevation.size - n_valid)
     }
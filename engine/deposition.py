@@ -5,6 +5,8 @@ Geo-Lab AI Engine: 퇴적 로직
 import numpy as np
 from typing import TYPE_CHECKING
 
+from .erosion import partition_percentile
+
 if TYPE_CHECKING:
     from .base import Terrain, Water
 
@@ -50,7 +52,8 @@ def settling_deposition(terrain: 'Terrain', water: 'Water',
 def alluvial_fan_deposition(terrain: 'Terrain', water: 'Water',
                             sediment_load: np.ndarray,
                             slope_threshold: float = 0.1,
-                            dt: float = 1.0) -> np.ndarray:
+                            dt: float = 1.0,
+                            slope: np.ndarray = None) -> np.ndarray:
     """
     선상지(Alluvial Fan) 퇴적
     급격한 경사 변화 지점(산지→평지)에서 부채꼴 퇴적
@@ -59,7 +62,8 @@ def alluvial_fan_deposition(terrain: 'Terrain', water: 'Water',
     --------
     deposition_amount : np.ndarray
     """
-    slope = terrain.get_slope()
+    if slope is None:
+        slope = terrain.get_slope()
     
     # 경사 변화율 계산
     slope_change = np.gradient(slope, axis=0) + np.gradient(slope, axis=1)
@@ -73,13 +77,59 @@ def alluvial_fan_deposition(terrain: 'Terrain', water: 'Water',
     return deposition
 
 
+def channel_distance(channel_mask: np.ndarray, cell_size: float = 1.0,
+                     max_cells: int = None) -> np.ndarray:
+    """
+    하도로부터의 거리 (Euclidean Distance Transform)
+    
+    EDT는 비용이 크므로 같은 스텝에서 한 번 계산해
+    levee_backswamp_deposition / overbank_deposition에 distance로 넘겨 재사용
+    
+    Parameters:
+    -----------
+    channel_mask : np.ndarray
+        하도 마스크 (True = 하도)
+    cell_size : float
+        셀 크기 (1.0이면 셀 단위 거리)
+    max_cells : int, optional
+        필요한 최대 거리 (셀). 지정하면 하도 영역 + max_cells 범위만 계산하고
+        그 밖은 np.inf로 채움 (범위 안의 값은 전체 계산과 동일)
+    """
+    from scipy.ndimage import distance_transform_edt
+    
+    if max_cells is None:
+        distance = distance_transform_edt(~channel_mask)
+    else:
+        h, w = channel_mask.shape
+        distance = np.full((h, w), np.inf)
+        rows = np.flatnonzero(channel_mask.any(axis=1))
+        if rows.size == 0:
+            return distance
+        cols = np.flatnonzero(channel_mask.any(axis=0))
+        
+        pad = int(np.ceil(max_cells))
+        y0, y1 = max(0, rows[0] - pad), min(h, rows[-1] + pad + 1)
+        x0, x1 = max(0, cols[0] - pad), min(w, cols[-1] + pad + 1)
+        distance[y0:y1, x0:x1] = distance_transform_edt(~channel_mask[y0:y1, x0:x1])
+    
+    if cell_size != 1.0:
+        distance *= cell_size
+    return distance
+
+
 def levee_backswamp_deposition(terrain: 'Terrain', water: 'Water',
                                 flood_level: float = 1.0,
-                                dt: float = 1.0) -> tuple:
+                                dt: float = 1.0,
+                                distance: np.ndarray = None) -> tuple:
     """
     자연제방(Levee) & 배후습지(Backswamp) 퇴적
     홍수 시 하천 가까이에 굵은 입자, 멀리에 미립 입자 퇴적
     
+    Parameters:
+    -----------
+    distance : np.ndarray, optional
+        channel_distance()로 미리 계산한 하도 거리 (셀 단위)
+    
     Returns:
     --------
     levee_deposition : np.ndarray
@@ -90,15 +140,16 @@ def levee_backswamp_deposition(terrain: 'Terrain', water: 'Water',
     h, w = terrain.height, terrain.width
     
     # 하천 위치 (높은 유량)
-    channel_mask = water.discharge > np.percentile(water.discharge, 80)
+    channel_mask = water.discharge > partition_percentile(water.discharge, 80)
     
     levee = np.zeros((h, w))
     backswamp = np.zeros((h, w))
     
     # 하천으로부터의 거리 계산 (간단한 확산)
-    from scipy.ndimage import distance_transform_edt
     if np.any(channel_mask):
-        distance = distance_transform_edt(~channel_mask)
+        if distance is None:
+            # 15셀 밖은 어느 띠에도 속하지 않으므로 그 범위만 계산
+            distance = channel_distance(channel_mask, max_cells=15)
         
         # 자연제방: 하천 바로 옆 (2-5셀)
         levee_zone = (distance > 1) & (distance < 5)
@@ -134,7 +185,7 @@ def delta_deposition(terrain: 'Terrain', water: 'Water',
     
     # 해수면 근처 (하구)
     estuary_zone = (terrain.elevation > sea_level - 5) & (terrain.elevation < sea_level + 10)
-    channel_mask = water.discharge > np.percentile(water.discharge, 70)
+    channel_mask = water.discharge > partition_percentile(water.discharge, 70)
     delta_zone = estuary_zone & channel_mask
     
     if not np.any(delta_zone):
@@ -155,9 +206,20 @@ def delta_deposition(terrain: 'Terrain', water: 'Water',
     elif w_ratio > 0.4:
         # 좌우로 퍼지게
         from scipy.ndimage import gaussian_filter
-        base = np.zeros((h, w))
-        base[delta_zone] = water.discharge[delta_zone] * 0.1
-        deposition = gaussian_filter(base, sigma=3) * w_ratio * dt
+        
+        # 삼각주 영역 주변만 잘라서 필터링 (나머지는 0이므로 결과도 0)
+        # 커널 반경의 2배만큼 여유를 두면 reflect 경계까지 전체 필터와 동일
+        sigma = 3
+        pad = 2 * int(4.0 * sigma + 0.5)
+        rows = np.flatnonzero(delta_zone.any(axis=1))
+        cols = np.flatnonzero(delta_zone.any(axis=0))
+        y0, y1 = max(0, rows[0] - pad), min(h, rows[-1] + pad + 1)
+        x0, x1 = max(0, cols[0] - pad), min(w, cols[-1] + pad + 1)
+        
+        sub_zone = delta_zone[y0:y1, x0:x1]
+        base = np.zeros(sub_zone.shape)
+        base[sub_zone] = water.discharge[y0:y1, x0:x1][sub_zone] * 0.1
+        deposition[y0:y1, x0:x1] = gaussian_filter(base, sigma=sigma) * w_ratio * dt
     
     # 조류 우세: 작은 섬 형태
     else:
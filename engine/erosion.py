@@ -3,17 +3,73 @@ Geo-Lab AI Engine: 침식 로직
 Stream Power Law 기반 하방/측방 침식 구현
 """
 import numpy as np
+from numba import jit
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import Terrain, Water
 
 
+@jit(nopython=True, cache=True)
+def _lateral_erosion_kernel(flow_x, flow_y, discharge, velocity, coef, out):
+    """
+    측방 침식 단일 패스 커널
+    곡률(np.gradient와 동일한 차분) → 침식량 → 하천 마스크/상한을
+    셀마다 한 번에 계산하여 중간 배열을 만들지 않음 (직렬)
+    """
+    h, w = discharge.shape
+    
+    for y in range(h):
+        for x in range(w):
+            q = discharge[y, x]
+            if not q > 0.1:
+                out[y, x] = 0.0
+                continue
+            
+            # 가장자리는 단측 차분, 내부는 중앙 차분
+            if x == 0:
+                cx = flow_x[y, 1] - flow_x[y, 0]
+            elif x == w - 1:
+                cx = flow_x[y, w - 1] - flow_x[y, w - 2]
+            else:
+                cx = 0.5 * (flow_x[y, x + 1] - flow_x[y, x - 1])
+            
+            if y == 0:
+                cy = flow_y[1, x] - flow_y[0, x]
+            elif y == h - 1:
+                cy = flow_y[h - 1, x] - flow_y[h - 2, x]
+            else:
+                cy = 0.5 * (flow_y[y + 1, x] - flow_y[y - 1, x])
+            
+            val = coef * q * velocity[y, x] * np.sqrt(cx * cx + cy * cy)
+            out[y, x] = min(max(val, 0.0), 5.0)
+
+
+def partition_percentile(values: np.ndarray, q: float) -> float:
+    """
+    단일 백분위수 계산 (np.percentile의 linear 보간과 동일한 값)
+    
+    필요한 두 순위만 np.partition으로 골라내므로
+    임계값 하나를 구할 때 전체 정렬/범용 분위수 처리 비용을 피함.
+    """
+    values = np.ravel(values)
+    n = values.size
+    if n == 0:
+        return np.nan
+    
+    pos = (n - 1) * q / 100.0
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, n - 1)
+    part = np.partition(values, (lo, hi))
+    return float(part[lo] + (part[hi] - part[lo]) * (pos - lo))
+
+
 def vertical_erosion(terrain: 'Terrain', water: 'Water', 
                      k_erosion: float = 0.0001,
                      m_exponent: float = 0.5,
                      n_exponent: float = 1.0,
-                     dt: float = 1.0) -> np.ndarray:
+                     dt: float = 1.0,
+                     slope: np.ndarray = None) -> np.ndarray:
     """
     하방 침식 (Vertical/Downcutting Erosion)
     Stream Power Law: E = K * A^m * S^n
@@ -32,6 +88,8 @@ def vertical_erosion(terrain: 'Terrain', water: 'Water',
         경사 지수 (보통 1.0)
     dt : float
         시간 단위 (년)
+    slope : np.ndarray, optional
+        미리 계산한 경사도 (같은 스텝에서 재사용, 없으면 새로 계산)
     
     Returns:
     --------
@@ -39,7 +97,8 @@ def vertical_erosion(terrain: 'Terrain', water: 'Water',
         각 셀의 침식량 (m)
     """
     # 경사 계산
-    slope = terrain.get_slope()
+    if slope is None:
+        slope = terrain.get_slope()
     
     # Stream Power Law
     # E = K * Q^m * S^n
@@ -84,11 +143,17 @@ def lateral_erosion(terrain: 'Terrain', water: 'Water',
         각 셀의 침식량 (m)
     """
     h, w = terrain.height, terrain.width
-    erosion = np.zeros((h, w))
     
     # 유로 곡률 계산 (흐름 방향의 2차 미분)
     flow_x, flow_y = water.flow_x, water.flow_y
     
+    if h > 1 and w > 1:
+        # 곡률/침식/마스크를 한 번의 순회로 계산 (중간 배열 없음)
+        erosion = np.empty((h, w))
+        _lateral_erosion_kernel(flow_x, flow_y, water.discharge, water.velocity,
+                                k_lateral * curvature_factor * dt, erosion)
+        return erosion
+    
     # 곡률 근사: 흐름 방향의 변화율
     curvature_x = np.gradient(flow_x, axis=1)
     curvature_y = np.gradient(flow_y, axis=0)
@@ -107,7 +172,8 @@ def lateral_erosion(terrain: 'Terrain', water: 'Water',
 
 def headward_erosion(terrain: 'Terrain', water: 'Water',
                      k_headward: float = 0.0002,
-                     dt: float = 1.0) -> np.ndarray:
+                     dt: float = 1.0,
+                     slope: np.ndarray = None) -> np.ndarray:
     """
     두부 침식 (Headward Erosion)
     하천의 상류 끝이 점점 뒤로 물러남
@@ -122,8 +188,9 @@ def headward_erosion(terrain: 'Terrain', water: 'Water',
     erosion = np.zeros((h, w))
     
     # 급경사 지점(Knickpoint) 찾기
-    slope = terrain.get_slope()
-    steep_mask = slope > np.percentile(slope[slope > 0], 90)  # 상위 10% 급경사
+    if slope is None:
+        slope = terrain.get_slope()
+    steep_mask = slope > partition_percentile(slope[slope > 0], 90)  # 상위 10% 급경사
     
     # 급경사 + 유량이 있는 곳에서 두부 침식 발생
     channel_mask = water.discharge > 0.5
@@ -149,13 +216,15 @@ def apply_erosion(terrain: 'Terrain', erosion_amount: np.ndarray,
     min_elevation : float
         최소 고도 (해수면)
     """
-    terrain.elevation -= erosion_amount
-    terrain.elevation = np.maximum(terrain.elevation, min_elevation)
+    # 새 배열을 만들지 않고 제자리(in-place)에서 갱신
+    np.subtract(terrain.elevation, erosion_amount, out=terrain.elevation)
+    np.maximum(terrain.elevation, min_elevation, out=terrain.elevation)
 
 
 def mass_wasting(terrain: 'Terrain', 
                  critical_slope: float = 0.7,  # ~35도
-                 transfer_rate: float = 0.3) -> np.ndarray:
+                 transfer_rate: float = 0.3,
+                 slope: np.ndarray = None) -> np.ndarray:
     """
     사면 붕괴 (Mass Wasting)
     V자곡 형성 시 양옆 사면이 무너지는 과정
@@ -168,7 +237,8 @@ def mass_wasting(terrain: 'Terrain',
     h, w = terrain.height, terrain.width
     change = np.zeros((h, w))
     
-    slope = terrain.get_slope()
+    if slope is None:
+        slope = terrain.get_slope()
     
     # 임계 경사 초과 지점에서 물질 이동
     unstable = slope > critical_slope
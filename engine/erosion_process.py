@@ -1,5 +1,67 @@
 import numpy as np
+from numba import jit
 from .grid import WorldGrid
+from .deposition import channel_distance
+
+
+@jit(nopython=True, cache=True)
+def _transport_kernel(order, pad_index, elev_padded, inside, discharge, slope, underwater, flow_dir,
+                      flux_padded, change, K, m, n, dt, use_flow_dir, w):
+    """
+    퇴적물 이송 커널 (평탄화된 1D 배열, SoA)
+    
+    셀 값은 ravel()된 배열에서 평탄 인덱스로, 이웃은 (h+2, w+2) 패딩 배열에서
+    미리 계산한 평탄 오프셋으로 접근 → 셀마다 행/열 계산과 경계 검사 불필요.
+    elev_padded: 가장자리에 +inf 한 칸 (최급경사 이웃으로 뽑히지 않음)
+    inside: 패딩 배열에서 격자 안쪽이면 True (flow_dir이 밖을 가리키는지 확인용)
+    pad_index: 평탄 인덱스 → 패딩 배열 평탄 인덱스
+    """
+    wp = w + 2
+    d8_dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
+    d8_dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+    offsets = d8_dr * wp + d8_dc
+    
+    for i in range(order.size):
+        idx = order[i]
+        p = pad_index[idx]
+        
+        q = discharge[idx]
+        s = slope[idx]
+        
+        # A. 운반 능력 (물 속에서는 유속 급감 -> Capacity 감소)
+        eff_slope = s * 0.01 if underwater[idx] else s
+        qs_cap = K * 500 * q ** m * eff_slope ** n
+        
+        # B. 현재 플럭스 / C. 침식 vs 퇴적
+        qs_in = flux_padded[p]
+        if qs_in > qs_cap:
+            change[idx] += qs_in - qs_cap
+            qs_out = qs_cap
+        else:
+            erosion_amount = K * q ** m * s ** n * dt
+            change[idx] -= erosion_amount
+            qs_out = qs_in + erosion_amount
+        
+        # D. 하류로 전달
+        target = -1
+        if use_flow_dir:
+            if q > 0:
+                t = p + offsets[flow_dir[idx]]
+                if inside[t]:
+                    target = t
+        else:
+            min_z = elev_padded[p]
+            for k in range(8):
+                t = p + offsets[k]
+                if elev_padded[t] < min_z:
+                    min_z = elev_padded[t]
+                    target = t
+        
+        if target != -1:
+            flux_padded[target] += qs_out
+        else:
+            # 갇힌 곳(Sink) -> 그 자리에 퇴적
+            change[idx] += qs_out
 
 class ErosionProcess:
     """
@@ -17,9 +79,46 @@ class ErosionProcess:
         self.n = n  # 경사 지수
         self.D = D  # 확산 계수 (사면)
         
-    def stream_power_erosion(self, discharge: np.ndarray, dt: float = 1.0) -> np.ndarray:
+        # 스텝마다 재사용하는 작업 버퍼 (패딩된 flux, 고도)
+        self._buffers = {}
+        # 패딩 배열 인덱스 표 (격자 크기가 같으면 재사용)
+        self._pad_tables = None
+        
+    def _padded_buffer(self, name: str, dtype, border: float) -> np.ndarray:
+        """
+        가장자리에 border 한 칸을 두른 (h+2, w+2) 작업 버퍼
+        
+        안쪽 값은 호출한 쪽에서 채움 (가장자리는 만들 때 한 번만 채움)
+        """
+        shape = (self.grid.height + 2, self.grid.width + 2)
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.full(shape, border, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+    
+    def _padded_tables(self):
+        """
+        패딩 배열용 인덱스 표 (격자 크기가 바뀔 때만 다시 만듦)
+        
+        Returns:
+            pad_index: 평탄 인덱스 → (h+2, w+2) 패딩 배열 평탄 인덱스
+            inside: 패딩 배열에서 격자 안쪽 여부 (평탄화)
+        """
+        shape = (self.grid.height, self.grid.width)
+        if self._pad_tables is None or self._pad_tables[0] != shape:
+            h, w = shape
+            pad_index = np.arange((h + 2) * (w + 2)).reshape(h + 2, w + 2)[1:-1, 1:-1].ravel()
+            inside = np.zeros((h + 2, w + 2), dtype=bool)
+            inside[1:-1, 1:-1] = True
+            self._pad_tables = (shape, pad_index, inside.ravel())
+        return self._pad_tables[1], self._pad_tables[2]
+        
+    def stream_power_erosion(self, discharge: np.ndarray, dt: float = 1.0,
+                             slope: np.ndarray = None) -> np.ndarray:
         """Stream Power Law 기반 하천 침식"""
-        slope, _ = self.grid.get_gradient()
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         
         # E = K * Q^m * S^n
         # (유량 Q를 유역면적 A 대신 사용)
@@ -74,7 +173,8 @@ class ErosionProcess:
     def overbank_deposition(self, discharge: np.ndarray, 
                             bankfull_capacity: float = 100.0,
                             decay_rate: float = 0.1,
-                            dt: float = 1.0) -> np.ndarray:
+                            dt: float = 1.0,
+                            distance: np.ndarray = None) -> np.ndarray:
         """
         범람원 퇴적 (Overbank Deposition)
         
@@ -86,12 +186,11 @@ class ErosionProcess:
             bankfull_capacity: 하도 용량 (초과 시 범람)
             decay_rate: 거리에 따른 퇴적 감쇠율
             dt: 시간 간격
+            distance: channel_distance()로 미리 계산한 하도 거리 (m, 없으면 새로 계산)
             
         Returns:
             deposition: 퇴적량 배열
         """
-        from scipy.ndimage import distance_transform_edt
-        
         h, w = self.grid.height, self.grid.width
         
         # 1. 범람 지점 식별 (용량 초과)
@@ -109,7 +208,8 @@ class ErosionProcess:
             return np.zeros((h, w))
             
         # Distance Transform (하도로부터의 거리)
-        distance = distance_transform_edt(~channel_mask) * self.grid.cell_size
+        if distance is None:
+            distance = channel_distance(channel_mask, self.grid.cell_size, max_cells=50)
         
         # 3. 퇴적량 계산 (지수 감쇠)
         # Deposition = overflow * exp(-k * distance)
@@ -140,7 +240,8 @@ class ErosionProcess:
         
         return deposition
 
-    def transport_and_deposit(self, discharge: np.ndarray, dt: float = 1.0, Kf: float = 0.01) -> np.ndarray:
+    def transport_and_deposit(self, discharge: np.ndarray, dt: float = 1.0, Kf: float = 0.01,
+                              slope: np.ndarray = None) -> np.ndarray:
         """
         퇴적물 운반 및 퇴적 (Sediment Transport & Deposition)
         
@@ -154,8 +255,10 @@ class ErosionProcess:
             discharge: 유량
             dt: 시간 간격
             Kf: 운반 효율 계수 (Transport Efficiency)
+            slope: 미리 계산한 경사도 (없으면 새로 계산)
         """
-        slope, _ = self.grid.get_gradient()
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         # 경사가 0이면 무한 퇴적 방지를 위해 최소값 설정
         slope = np.maximum(slope, 0.001)
         
@@ -180,9 +283,6 @@ class ErosionProcess:
         # Delta 시뮬레이션을 위한 접근:
         # 퇴적물 플럭스(Flux)를 하류로 밀어내는 로직 추가.
         
-        h, w = self.grid.height, self.grid.width
-        sediment_flux = np.zeros((h, w))
-        
         # 유량 순서대로 처리 (Upstream -> Downstream)
         # discharge가 낮은 곳(상류)에서 높은 곳(하류)으로? 
         # D8 흐름 방향을 다시 추적해야 정확함.
@@ -201,107 +301,67 @@ class ErosionProcess:
         return capacity
 
     def simulate_transport(self, discharge: np.ndarray, dt: float = 1.0, 
-                          sediment_influx_map: np.ndarray = None) -> np.ndarray:
+                          sediment_influx_map: np.ndarray = None,
+                          slope: np.ndarray = None, out: np.ndarray = None) -> np.ndarray:
         """
         통합 퇴적물 이송 시뮬레이션 (Flux-based)
         1. 상류에서 퇴적물 유입 (Flux In)
         2. 로컬 침식/퇴적 (Erosion/Deposition)
         3. 하류로 배출 (Flux Out)
+        
+        slope를 넘기면 같은 스텝에서 이미 계산한 경사도를 재사용합니다.
+        반복 호출 시 out에 이전 결과 배열을 넘기면 새로 할당하지 않고 덮어씁니다.
+        
+        Returns:
+            change: 셀별 고도 변화량 (퇴적 +, 침식 -), out을 주면 out 자체
         """
         h, w = self.grid.height, self.grid.width
         elev = self.grid.elevation
         
-        # 1. 정렬 (높은 곳 -> 낮은 곳)
-        indices = np.argsort(elev.ravel())[::-1]
+        # 1. 정렬 (높은 곳 -> 낮은 곳, 순서가 유지되면 재사용)
+        indices = self.grid.get_flow_order()
         
-        # 퇴적물 플럭스 초기화 (유입원 반영)
-        flux = np.zeros((h, w))
-        if sediment_influx_map is not None:
-            flux += sediment_influx_map
+        # 퇴적물 플럭스 초기화 (유입원 반영, 하류 셀은 패딩 배열에서 찾음)
+        flux = self._padded_buffer('flux_padded', np.float64, 0.0)
+        flux[1:-1, 1:-1] = 0.0 if sediment_influx_map is None else sediment_influx_map
             
-        slope, _ = self.grid.get_gradient()
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         slope = np.maximum(slope, 0.001)
         
-        change = np.zeros((h, w))
+        if out is None:
+            change = np.zeros((h, w))
+        elif out.shape != (h, w) or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f"out 배열은 ({h}, {w}) 크기의 연속 float64 배열이어야 합니다")
+        else:
+            change = out
+            change.fill(0.0)
         
-        # D8 Neighbors (Lookup for flow_dir)
-        d8_dr = [-1, -1, -1,  0,  0,  1,  1,  1]
-        d8_dc = [-1,  0,  1, -1,  1, -1,  0,  1]
+        # 해수면 아래는 퇴적 위주 (셀마다가 아니라 한 번만 계산)
+        underwater = self.grid.is_underwater()
         
         # Check if flow_dir is available
         use_flow_dir = (self.grid.flow_dir is not None)
-        
-        for idx in indices:
-            r, c = idx // w, idx % w
-            
-
-
-            # 해수면 아래 깊은 곳은 퇴적 위주
-            underwater = self.grid.is_underwater()[r, c]
-            
-            # A. 운반 능력 (Capacity)
-            # 물 속에서는 유속이 급감한다고 가정 -> Capacity 감소
-            # eff_slope calculation fix: slope can be very small on flat land
-            eff_slope = slope[r, c] if not underwater else slope[r, c] * 0.01
-            
-            # Kf (Transportation efficiency) should be high enough
-            # Use 'self.K * 100' or similar
-            qs_cap = self.K * 500 * np.power(discharge[r, c], self.m) * np.power(eff_slope, self.n)
-            
-            # B. 현재 플럭스 (상류에서 들어온 것 + 로컬 침식 잠재량)
-            qs_in = flux[r, c]
-            
-            # C. 침식 vs 퇴적 결정
-            # 기계적 침식 (Stream Power)
-            potential_erosion = self.K * np.power(discharge[r, c], self.m) * np.power(slope[r, c], self.n) * dt
-            
-            # 만약 들어온 흙(qs_in)이 용량(qs_cap)보다 많으면 -> 퇴적
-            if qs_in > qs_cap:
-                # 퇴적량 = 초과분 * 1.0 (일단 100% 퇴적 가정하여 효과 확인)
-                deposition_amount = (qs_in - qs_cap) * 1.0 
-                change[r, c] += deposition_amount
-                qs_out = qs_cap # 나머지는 하류로? 아니, 퇴적 후 남은건 qs_cap임 (Transport-limited)
-            else:
-                # 용량이 남으면 -> 침식하여 흙을 더 싣고감
-                # 실제 침식 = 잠재 침식 (기반암도 침식 가능)
-                erosion_amount = potential_erosion
-                
-                change[r, c] -= erosion_amount
-                qs_out = qs_in + erosion_amount
-
-            # D. 하류로 전달 (Qs Out Routing)
-            # Use pre-calculated flow direction if available
-            target_r, target_c = -1, -1
-            
-            if use_flow_dir:
-                k = self.grid.flow_dir[r, c]
-                # k could be default 0 even if no flow?
-                # Usually sink nodes have special value (e.g. -1 or point to self)
-                # But here we initialized to 0.
-                # Need to check constraints.
-                # If discharge[r,c] > 0, flow_dir should be valid.
-                if discharge[r, c] > 0:
-                     nr = r + d8_dr[k]
-                     nc = c + d8_dc[k]
-                     if 0 <= nr < h and 0 <= nc < w:
-                         target_r, target_c = nr, nc
-            else:
-                # Fallback: Local Seek (Slow)
-                min_z = elev[r, c]
-                for k in range(8):
-                    nr = r + d8_dr[k]
-                    nc = c + d8_dc[k]
-                    if 0 <= nr < h and 0 <= nc < w:
-                        if elev[nr, nc] < min_z:
-                            min_z = elev[nr, nc]
-                            target_r, target_c = nr, nc
-            
-            if target_r != -1:
-                flux[target_r, target_c] += qs_out
-            else:
-                # 갇힌 곳(Sink) -> 그 자리에 퇴적
-                # 침식이 발생했다면 되돌려놓고 퇴적
-                change[r, c] += qs_out
+        flow_dir = self.grid.flow_dir if use_flow_dir else np.zeros((h, w), dtype=np.int64)
+        
+        # 가장자리 +inf 패딩 → 최급경사 탐색에서 격자 밖 이웃이 자동으로 제외됨
+        elev_padded = self._padded_buffer('elev_padded', elev.dtype, np.inf)
+        elev_padded[1:-1, 1:-1] = elev
+        pad_index, inside = self._padded_tables()
+        
+        # 평탄화된 1D 배열(SoA)로 커널 호출 - 2D 인덱싱/셀별 div/mod/경계 검사 제거
+        _transport_kernel(
+            indices, pad_index,
+            elev_padded.ravel(), inside,
+            np.ascontiguousarray(discharge, dtype=np.float64).ravel(),
+            slope.ravel(),
+            underwater.ravel(),
+            np.ascontiguousarray(flow_dir).ravel(),
+            flux.ravel(),
+            change.ravel(),
+            float(self.K), float(self.m), float(self.n), float(dt),
+            use_flow_dir, w
+        )
         
         # 지형 업데이트
         # 침식은 elevation 감소, 퇴적은 sediment 증가이지만
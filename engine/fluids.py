@@ -1,65 +1,294 @@
+"""
+수력학 커널 (유량 라우팅, 싱크 채우기, 수심/침수)
+
+Numba 커널은 parallel=True 없이 직렬로 둠: Streamlit 세션과 render_frames가
+여러 스레드에서 커널을 동시에 호출하는데, tbb/omp가 없을 때 기본인 workqueue
+스레딩 레이어는 parallel 커널에 여러 스레드가 동시에 들어오면 프로세스를 종료시킴.
+engine의 다른 모듈(erosion, glacier, ideal_landforms) 커널도 같은 규칙을 따름.
+"""
 import numpy as np
+from numba import jit
+from scipy.ndimage import minimum_filter
 from .grid import WorldGrid
 
-try:
-    from numba import jit
-    HAS_NUMBA = True
-except ImportError:
-    HAS_NUMBA = False
-    # Dummy decorator if numba is missing
-    def jit(*args, **kwargs):
-        def decorator(func):
-            return func
-        return decorator
+# D8 이웃 오프셋 (전역 상수 → Numba가 컴파일 시 상수로 고정)
+_D8_DR = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
+_D8_DC = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+
+# 중심을 제외한 3x3 이웃 풋프린트 (싱크 판정용)
+_NEIGHBOR_FOOTPRINT = np.ones((3, 3), dtype=bool)
+_NEIGHBOR_FOOTPRINT[1, 1] = False
+
+@jit(nopython=True, cache=True)
+def _d8_receiver_kernel(elev_padded, flow_dir, receiver, underwater, h, w):
+    """
+    D8 최급경사 이웃 탐색 (직렬)
+    
+    elev_padded: 가장자리에 +inf 한 칸을 두른 (h+2, w+2) 고도 → 경계 검사 불필요
+    receiver에 하류 셀의 평탄 인덱스 기록 (없거나 물속이면 -1).
+    flow_dir은 하류 셀이 있을 때만 갱신
+    """
+    for r in range(h):
+        for c in range(w):
+            receiver[r * w + c] = -1
+            
+            # Check underwater
+            if underwater[r, c]:
+                continue
+            
+            min_z = elev_padded[r + 1, c + 1]
+            target_k = -1
+            
+            # Find steepest descent
+            # (최소값/방향은 분기 없는 선택으로 갱신, 인덱스는 루프 후 한 번만 계산)
+            for k in range(8):
+                n_elev = elev_padded[r + 1 + _D8_DR[k], c + 1 + _D8_DC[k]]
+                better = n_elev < min_z
+                min_z = n_elev if better else min_z
+                target_k = k if better else target_k
+            
+            if target_k != -1:
+                receiver[r * w + c] = (r + _D8_DR[target_k]) * w + (c + _D8_DC[target_k])
+                flow_dir[r, c] = target_k # Store direction (0-7)
+
+@jit(nopython=True, cache=True)
+def _d8_accumulate_kernel(order, receiver, discharge):
+    """
+    D8 유량 누적 (상류 -> 하류 순서로 하류 셀에 전달, 직렬)
+    """
+    for i in range(order.size):
+        idx = order[i]
+        target = receiver[idx]
+        if target != -1:
+            discharge[target] += discharge[idx]
+
+@jit(nopython=True, cache=True)
+def _priority_flood_kernel(elev, tolerance):
+    """
+    Priority-Flood 싱크 채우기 (Barnes et al.)
+    
+    경계 셀에서 시작해 가장 낮은 셀부터 안쪽으로 확장.
+    주변(이미 확정된 셀)보다 낮은 이웃은 pop된 고도 + tolerance로 올려
+    모든 내부 셀이 경계까지 하강 경로를 갖도록 함. elev를 직접 수정.
+    """
+    h, w = elev.shape
+    n = h * w
+    dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
+    dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+    
+    # closed는 가장자리에 True 한 칸을 둘러 이웃 경계 검사를 없앰 (인덱스 +1)
+    closed = np.zeros((h + 2, w + 2), dtype=np.bool_)
+    closed[0, :] = True
+    closed[-1, :] = True
+    closed[:, 0] = True
+    closed[:, -1] = True
+    # 배열 기반 이진 힙 (키: 고도, 동률은 삽입 순서)
+    heap_z = np.empty(n, dtype=np.float64)
+    heap_seq = np.empty(n, dtype=np.int64)
+    heap_idx = np.empty(n, dtype=np.int64)
+    size = 0
+    seq = 0
+    
+    for r in range(h):
+        for c in range(w):
+            if r == 0 or r == h - 1 or c == 0 or c == w - 1:
+                closed[r + 1, c + 1] = True
+                # push
+                i = size
+                size += 1
+                z = elev[r, c]
+                while i > 0:
+                    p = (i - 1) // 2
+                    if heap_z[p] < z or (heap_z[p] == z and heap_seq[p] < seq):
+                        break
+                    heap_z[i] = heap_z[p]
+                    heap_seq[i] = heap_seq[p]
+                    heap_idx[i] = heap_idx[p]
+                    i = p
+                heap_z[i] = z
+                heap_seq[i] = seq
+                heap_idx[i] = r * w + c
+                seq += 1
+    
+    while size > 0:
+        # pop
+        top_z = heap_z[0]
+        top_idx = heap_idx[0]
+        size -= 1
+        last_z = heap_z[size]
+        last_seq = heap_seq[size]
+        last_idx = heap_idx[size]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and (heap_z[child + 1] < heap_z[child] or
+                                     (heap_z[child + 1] == heap_z[child] and heap_seq[child + 1] < heap_seq[child])):
+                child += 1
+            if last_z < heap_z[child] or (last_z == heap_z[child] and last_seq < heap_seq[child]):
+                break
+            heap_z[i] = heap_z[child]
+            heap_seq[i] = heap_seq[child]
+            heap_idx[i] = heap_idx[child]
+            i = child
+        heap_z[i] = last_z
+        heap_seq[i] = last_seq
+        heap_idx[i] = last_idx
+        
+        r = top_idx // w
+        c = top_idx % w
+        for k in range(8):
+            nr = r + dr[k]
+            nc = c + dc[k]
+            if closed[nr + 1, nc + 1]:
+                continue
+            closed[nr + 1, nc + 1] = True
+            if elev[nr, nc] < top_z:
+                elev[nr, nc] = top_z + tolerance
+            # push
+            i = size
+            size += 1
+            z = elev[nr, nc]
+            while i > 0:
+                p = (i - 1) // 2
+                if heap_z[p] < z or (heap_z[p] == z and heap_seq[p] < seq):
+                    break
+                heap_z[i] = heap_z[p]
+                heap_seq[i] = heap_seq[p]
+                heap_idx[i] = heap_idx[p]
+                i = p
+            heap_z[i] = z
+            heap_seq[i] = seq
+            heap_idx[i] = nr * w + nc
+            seq += 1
+
+@jit(nopython=True, cache=True)
+def _priority_flood_bucket_kernel(elev, tolerance, z_min, scale, n_levels):
+    """
+    Priority-Flood 싱크 채우기 (고도 구간 버킷 큐, O(n))
+    
+    힙 대신 고도를 1/scale 간격 구간(버킷)으로 나눈 FIFO 큐를 사용.
+    고도 값 자체는 float 그대로 두고 처리 순서만 구간 단위로 정함
+    (같은 구간 안에서는 먼저 들어온 셀부터 처리, 오차 < 1/scale)
+    """
+    h, w = elev.shape
+    n = h * w
+    dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
+    dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+    
+    # closed는 가장자리에 True 한 칸을 둘러 이웃 경계 검사를 없앰 (인덱스 +1)
+    closed = np.zeros((h + 2, w + 2), dtype=np.bool_)
+    closed[0, :] = True
+    closed[-1, :] = True
+    closed[:, 0] = True
+    closed[:, -1] = True
+    head = np.full(n_levels, -1, dtype=np.int64)
+    tail = np.full(n_levels, -1, dtype=np.int64)
+    nxt = np.full(n, -1, dtype=np.int64)
+    
+    for r in range(h):
+        for c in range(w):
+            if r == 0 or r == h - 1 or c == 0 or c == w - 1:
+                closed[r + 1, c + 1] = True
+                idx = r * w + c
+                level = min(int((elev[r, c] - z_min) * scale), n_levels - 1)
+                if tail[level] == -1:
+                    head[level] = idx
+                else:
+                    nxt[tail[level]] = idx
+                tail[level] = idx
+    
+    current = 0
+    while current < n_levels:
+        idx = head[current]
+        if idx == -1:
+            current += 1
+            continue
+        head[current] = nxt[idx]
+        if head[current] == -1:
+            tail[current] = -1
+        
+        top_z = elev.flat[idx]
+        r = idx // w
+        c = idx % w
+        for k in range(8):
+            nr = r + dr[k]
+            nc = c + dc[k]
+            if closed[nr + 1, nc + 1]:
+                continue
+            closed[nr + 1, nc + 1] = True
+            if elev[nr, nc] < top_z:
+                elev[nr, nc] = top_z + tolerance
+            # 이웃은 현재 구간 이상에만 들어감 (단조 증가)
+            level = max(min(int((elev[nr, nc] - z_min) * scale), n_levels - 1), current)
+            n_idx = nr * w + nc
+            if tail[level] == -1:
+                head[level] = n_idx
+            else:
+                nxt[tail[level]] = n_idx
+            tail[level] = n_idx
 
-@jit(nopython=True)
-def _d8_flow_kernel(elev, discharge, flow_dir, underwater, h, w):
+@jit(nopython=True, cache=True)
+def _mfd_flow_kernel(flat_indices, elev, discharge, h, w, cell_size, p):
     """
-    Numba-optimized D8 Flow Routing
+    Numba-optimized MFD Flow Routing (셀별 후보는 고정 크기 배열에 저장)
+    flat_indices: 육지 셀의 고도 내림차순 평탄 인덱스 (WorldGrid.get_land_flow_order)
     """
-    # Flatten elevation to sort
-    flat_elev = elev.ravel()
-    # Sort indices descending (Source -> Sink)
-    # Note: argsort in numba supports 1D array
-    flat_indices = np.argsort(flat_elev)[::-1]
     
-    # 8-neighbor offsets
-    # Numba doesn't like list of tuples in loops sometimes, simple arrays are better
     dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
     dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+    dist = np.array([1.414, 1.0, 1.414, 1.0, 1.0, 1.414, 1.0, 1.414])  # 대각 거리
+    inv_dist = 1.0 / (dist * cell_size)
+    
+    slopes = np.empty(8)
+    tr = np.empty(8, dtype=np.int32)
+    tc = np.empty(8, dtype=np.int32)
     
     for i in range(len(flat_indices)):
         idx = flat_indices[i]
         r = idx // w
         c = idx % w
         
-        # Check underwater
-        if underwater[r, c]:
-            continue
-            
         current_z = elev[r, c]
-        min_z = current_z
-        target_r = -1
-        target_c = -1
-        target_k = -1
+        current_q = discharge[r, c]
+        if current_q <= 0:
+            continue
         
-        # Find steepest descent
+        # 낮은 이웃들의 경사 계산
+        n = 0
+        total_slope = 0.0
         for k in range(8):
             nr = r + dr[k]
             nc = c + dc[k]
-            
             if 0 <= nr < h and 0 <= nc < w:
-                n_elev = elev[nr, nc]
-                if n_elev < min_z:
-                    min_z = n_elev
-                    target_r = nr
-                    target_c = nc
-                    target_k = k
+                dz = current_z - elev[nr, nc]
+                if dz > 0:  # 하강하는 방향만
+                    s = (dz * inv_dist[k]) ** p
+                    slopes[n] = s
+                    tr[n] = nr
+                    tc[n] = nc
+                    total_slope += s
+                    n += 1
         
-        # Pass flow to lowest neighbor
-        if target_r != -1:
-            discharge[target_r, target_c] += discharge[r, c]
-            flow_dir[r, c] = target_k # Store direction (0-7)
+        # 경사 비례 분배
+        for j in range(n):
+            discharge[tr[j], tc[j]] += current_q * (slopes[j] / total_slope)
+
+@jit(nopython=True, cache=True)
+def _water_depth_kernel(discharge, slope, manning_n, depth):
+    """
+    Manning 수심 단일 패스 커널 (중간 배열 없이 셀마다 바로 계산, 직렬)
+    """
+    for i in range(discharge.size):
+        q = discharge[i]
+        s = slope[i]
+        if s < 0.001:
+            s = 0.001 # 최소 경사
+        width = 5.0 * np.sqrt(q)
+        if width < 1.0:
+            width = 1.0 # 최소 폭 1m
+        depth[i] = ((q * manning_n) / (width * np.sqrt(s))) ** 0.6
 
 class HydroKernel:
     """
@@ -70,31 +299,45 @@ class HydroKernel:
     - Shallow Water (간소화): 홍수 및 해수면 침수
     """
     
+    # Priority-Flood 버킷 큐의 고도 구간 (m)
+    FLOOD_RESOLUTION = 0.001
+    
     def __init__(self, grid: WorldGrid):
         self.grid = grid
+        self._elev_pad = None
         
     def route_flow_d8(self, precipitation: float = 0.001) -> np.ndarray:
         """
         D8 알고리즘으로 유량(Discharge) 계산 (Numba 가속)
         """
         h, w = self.grid.height, self.grid.width
-        elev = self.grid.elevation
         
         # 1. 초기 강수 분포
-        discharge = np.full((h, w), precipitation * (self.grid.cell_size ** 2), dtype=np.float64)
+        discharge = np.full((h, w), precipitation * (self.grid.cell_size ** 2), dtype=self.grid.dtype)
         
         # 2. 해수면 마스크
         underwater = self.grid.is_underwater()
         
-        # 3. Numba Kernel 호출
-        if HAS_NUMBA:
-            _d8_flow_kernel(elev, discharge, self.grid.flow_dir, underwater, h, w)
-        else:
-            # Fallback (Slow Python) if numba somehow fails to import
-            self._route_flow_d8_python(discharge, self.grid.flow_dir, elev, underwater, h, w)
+        # 3. 처리 순서 (물속 셀 제외, 고도가 조금만 변했으면 이전 정렬 재사용)
+        order = self.grid.get_land_flow_order()
+        
+        # 4. Numba Kernel 호출 (수신 셀 탐색 후 고도 순서대로 누적)
+        receiver = np.empty(h * w, dtype=np.int64)
+        _d8_receiver_kernel(self._padded_elevation(), self.grid.flow_dir, receiver, underwater, h, w)
+        _d8_accumulate_kernel(order, receiver, discharge.ravel())
             
         return discharge
 
+    def _padded_elevation(self) -> np.ndarray:
+        """가장자리에 +inf 한 칸을 두른 고도 (버퍼 재사용)"""
+        elev = self.grid.elevation
+        shape = (elev.shape[0] + 2, elev.shape[1] + 2)
+        pad = self._elev_pad
+        if pad is None or pad.shape != shape or pad.dtype != elev.dtype:
+            pad = self._elev_pad = np.full(shape, np.inf, dtype=elev.dtype)
+        pad[1:-1, 1:-1] = elev
+        return pad
+
     def route_flow_mfd(self, precipitation: float = 0.001, p: float = 1.1) -> np.ndarray:
         """
         MFD (Multiple Flow Direction) 유량 분배
@@ -113,106 +356,37 @@ class HydroKernel:
         elev = self.grid.elevation
         
         # 초기 강수
-        discharge = np.full((h, w), precipitation * (self.grid.cell_size ** 2), dtype=np.float64)
-        
-        # 해수면 마스크
-        underwater = self.grid.is_underwater()
+        discharge = np.full((h, w), precipitation * (self.grid.cell_size ** 2), dtype=self.grid.dtype)
         
-        # D8 방향 벡터
-        dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
-        dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
-        dist = np.array([1.414, 1.0, 1.414, 1.0, 1.0, 1.414, 1.0, 1.414])  # 대각 거리
-        
-        # 정렬 (높은 곳 -> 낮은 곳)
-        flat_indices = np.argsort(elev.ravel())[::-1]
-        
-        for idx in flat_indices:
-            r, c = idx // w, idx % w
-            
-            if underwater[r, c]:
-                continue
-                
-            current_z = elev[r, c]
-            current_q = discharge[r, c]
-            
-            if current_q <= 0:
-                continue
-            
-            # 낮은 이웃들의 경사 계산
-            slopes = []
-            targets = []
-            
-            for k in range(8):
-                nr, nc = r + dr[k], c + dc[k]
-                if 0 <= nr < h and 0 <= nc < w:
-                    dz = current_z - elev[nr, nc]
-                    if dz > 0:  # 하강하는 방향만
-                        slope = dz / (dist[k] * self.grid.cell_size)
-                        slopes.append(slope ** p)
-                        targets.append((nr, nc))
-            
-            if not slopes:
-                continue
-                
-            # 경사 비례 분배
-            total_slope = sum(slopes)
-            for i, (nr, nc) in enumerate(targets):
-                fraction = slopes[i] / total_slope
-                discharge[nr, nc] += current_q * fraction
+        # 정렬 (높은 곳 -> 낮은 곳, 물속 셀 제외) 후 경사 비례 분배 (Numba Kernel)
+        _mfd_flow_kernel(self.grid.get_land_flow_order(), elev, discharge,
+                         h, w, self.grid.cell_size, p)
                 
         return discharge
 
-    def _route_flow_d8_python(self, discharge, flow_dir, elev, underwater, h, w):
-        """Legacy Python implementation for fallback"""
-        flat_indices = np.argsort(elev.ravel())[::-1]
-        neighbors = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-        
-        for idx in flat_indices:
-            r, c = idx // w, idx % w
-            if underwater[r, c]: continue
-            
-            min_z = elev[r, c]
-            target = None
-            target_k = -1
-            
-            for k, (dr, dc) in enumerate(neighbors):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < h and 0 <= nc < w:
-                    if elev[nr, nc] < min_z:
-                        min_z = elev[nr, nc]
-                        target = (nr, nc)
-                        target_k = k
-            
-            if target:
-                tr, tc = target
-                discharge[tr, tc] += discharge[r, c]
-                flow_dir[r, c] = target_k
-
-    def calculate_water_depth(self, discharge: np.ndarray, manning_n: float = 0.03) -> np.ndarray:
+    def calculate_water_depth(self, discharge: np.ndarray, manning_n: float = 0.03,
+                              slope: np.ndarray = None) -> np.ndarray:
         """
         Manning 공식을 이용한 하천 수심 추정 (정상 등류 가정)
         Depth = (Q * n / (Width * S^0.5))^(3/5)
         
         * 경사(S)가 0인 경우 최소 경사 적용
         * 하폭(W)은 유량(Q)의 함수로 가정 (W ~ Q^0.5)
+        * slope를 넘기면 같은 스텝에서 계산한 경사도를 재사용
         """
-        slope, _ = self.grid.get_gradient()
-        slope = np.maximum(slope, 0.001) # 최소 경사 설정
-        
-        # 하폭 추정: W = 5 * Q^0.5 (경험식)
-        # Q가 매우 작으면 W도 작아짐
-        width = 5.0 * np.sqrt(discharge)
-        width = np.maximum(width, 1.0) # 최소 폭 1m
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         
-        # 수심 계산
         # Q = V * Area = (1/n * R^(2/3) * S^(1/2)) * (W * D)
-        # 직사각형 단면 가정 시 R approx D (넓은 하천)
-        # Q = (1/n) * D^(5/3) * W * S^(1/2)
-        # D = (Q * n / (W * S^0.5)) ^ (3/5)
-        
-        val = (discharge * manning_n) / (width * np.sqrt(slope))
-        depth = np.power(val, 0.6)
-        
+        # 직사각형 단면 가정 시 R approx D (넓은 하천), 하폭 W = 5 * Q^0.5 (최소 1m)
+        # D = (Q * n / (W * S^0.5)) ^ (3/5), 셀 단위 한 번의 순회로 계산 (Numba Kernel)
+        discharge = np.ascontiguousarray(discharge)
+        if not np.issubdtype(discharge.dtype, np.floating):
+            discharge = discharge.astype(np.float64)
+        depth = np.empty_like(discharge)
+        _water_depth_kernel(discharge.ravel(),
+                            np.ascontiguousarray(slope, dtype=discharge.dtype).ravel(),
+                            manning_n, depth.ravel())
         return depth
     
     def simulate_inundation(self):
@@ -227,51 +401,37 @@ class HydroKernel:
         # (하천이 바다로 들어가면 바다 수심에 묻힘)
         self.grid.water_depth = np.where(underwater, sea_depth, self.grid.water_depth)
 
-    def fill_sinks(self, max_iterations: int = 100, tolerance: float = 0.001):
+    def fill_sinks(self, max_iterations: int = 100, tolerance: float = 0.001,
+                   method: str = 'priority_flood'):
         """
         싱크(웅덩이) 채우기 - 호수 형성
         
         물이 갇히는 곳을 찾아 채워서 월류(Overflow)가 가능하도록 함.
-        간단한 반복 스무딩 방식 (Priority-Flood 근사)
+        
+        - 'priority_flood': 경계에서 낮은 셀부터 안쪽으로 확장하며
+          갇힌 셀을 월류 고도(+tolerance)까지 올림. 한 번의 힙 순회로 끝남.
+        - 'iterative': 단일 셀 싱크를 8-이웃 최소값으로 반복해서 올리는
+          근사 방식 (NumPy 배열 연산, 넓은 웅덩이는 여러 번 반복 필요)
         
         Args:
-            max_iterations: 최대 반복 횟수
-            tolerance: 수렴 허용 오차
+            max_iterations: 최대 반복 횟수 ('iterative'에서만 사용)
+            tolerance: 채운 셀에 더하는 경사 (하강 경로 보장)
+            method: 'priority_flood' 또는 'iterative'
         """
-        h, w = self.grid.height, self.grid.width
-        elev = self.grid.elevation.copy()
+        elev = self.grid.elevation.astype(np.float64)
         
-        # 경계는 고정 (물이 빠져나감)
-        # 내부 싱크만 채움
-        
-        dr = [-1, -1, -1,  0,  0,  1,  1,  1]
-        dc = [-1,  0,  1, -1,  1, -1,  0,  1]
-        
-        for iteration in range(max_iterations):
-            changed = False
-            new_elev = elev.copy()
-            
-            for r in range(1, h - 1):
-                for c in range(1, w - 1):
-                    current = elev[r, c]
-                    
-                    # 이웃 중 최소값 찾기
-                    min_neighbor = current
-                    for k in range(8):
-                        nr, nc = r + dr[k], c + dc[k]
-                        if 0 <= nr < h and 0 <= nc < w:
-                            min_neighbor = min(min_neighbor, elev[nr, nc])
-                    
-                    # 모든 이웃보다 낮으면 (싱크) → 최소 이웃 높이로 맞춤
-                    if current < min_neighbor:
-                        # 살짝 높여서 흐름 유도
-                        new_elev[r, c] = min_neighbor + tolerance
-                        changed = True
-                        
-            elev = new_elev
-            
-            if not changed:
-                break
+        # 경계는 고정 (물이 빠져나감), 내부 싱크만 채움
+        if method == 'iterative':
+            self._fill_sinks_iterative(elev, max_iterations, tolerance)
+        else:
+            # 고도 범위가 감당 가능하면 mm 단위 버킷 큐(O(n)), 아니면 힙(O(n log n))
+            z_min, z_max = elev.min(), elev.max()
+            scale = 1.0 / self.FLOOD_RESOLUTION
+            n_levels = int((z_max - z_min) * scale) + 2
+            if np.isfinite(z_max - z_min) and n_levels <= max(4 * elev.size, 1 << 20):
+                _priority_flood_bucket_kernel(elev, tolerance, z_min, scale, n_levels)
+            else:
+                _priority_flood_kernel(elev, tolerance)
                 
         # 채워진 양 = 새 고도 - 기존 고도
         fill_amount = elev - self.grid.elevation
@@ -284,3 +444,21 @@ class HydroKernel:
         
         return fill_amount
 
+    def _fill_sinks_iterative(self, elev, max_iterations, tolerance):
+        """반복 스무딩 방식 싱크 채우기 (elev를 직접 수정)"""
+        if elev.shape[0] < 3 or elev.shape[1] < 3:
+            return
+        
+        inner = elev[1:-1, 1:-1]
+        neighbor_min = np.empty_like(elev)
+        min_neighbor = neighbor_min[1:-1, 1:-1]
+        for _ in range(max_iterations):
+            # 이웃 중 최소값 (중심 셀 제외, C 구현 필터 / 경계 값은 사용하지 않음)
+            minimum_filter(elev, footprint=_NEIGHBOR_FOOTPRINT, mode='nearest',
+                           output=neighbor_min)
+            
+            # 모든 이웃보다 낮으면 (싱크) → 최소 이웃 높이로 맞춤 (살짝 높여서 흐름 유도)
+            sinks = inner < min_neighbor
+            if not sinks.any():
+                break
+            inner[sinks] = min_neighbor[sinks] + tolerance
@@ -12,9 +12,92 @@ Glacier Kernel (빙하 커널)
 """
 
 import numpy as np
+from numba import jit
 from .grid import WorldGrid
 
 
+@jit(nopython=True, cache=True)
+def _glacier_step_kernel(elev, ice, temperature, precipitation, ice_threshold,
+                         K, sliding_velocity, cell_size, dt,
+                         ice_acc, move, receiver, new_ice, erosion, moraine):
+    """
+    빙하 1단계 (축적 → 흐름 → 침식 → 모레인)를 세 번의 격자 순회로 계산 (직렬)
+    
+    1) 축적/소멸 + 셀별 유출량/하류 셀 (셀 독립)
+    2) 유입량 모으기 (이웃이 나를 가리키면 더함, 쓰기 충돌 없음)
+    3) 새 빙하 두께로 침식량(지표 경사)과 모레인(빙하 두께 경사) 계산
+    경사는 np.gradient와 같은 차분 (내부 중앙차분, 가장자리 1차 차분)
+    """
+    h, w = elev.shape
+    dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
+    dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
+    
+    # 1) 축적/소멸, 가장 낮은 이웃으로의 이동량
+    for r in range(h):
+        for c in range(w):
+            t = temperature[r, c]
+            v = ice[r, c]
+            if t < ice_threshold:
+                v += precipitation[r, c] * min(max(-t / 10.0, 0.0), 1.0) * 0.001 * dt
+            if t > ice_threshold:
+                v -= min(t * 0.01 * dt, v)
+            v = max(v, 0.0)
+            ice_acc[r, c] = v
+            
+            move[r, c] = 0.0
+            receiver[r, c] = -1
+            if r == 0 or r == h - 1 or c == 0 or c == w - 1 or v <= 0:
+                continue
+            min_z = elev[r, c]
+            target_k = -1
+            for k in range(8):
+                n_elev = elev[r + dr[k], c + dc[k]]
+                if n_elev < min_z:
+                    min_z = n_elev
+                    target_k = k
+            if target_k != -1:
+                # 이동량 (속도에 비례, 최대 10%)
+                move[r, c] = min(v * 0.1 * dt, v)
+                receiver[r, c] = target_k
+    
+    # 2) 유출 빼고 유입 더하기
+    for r in range(h):
+        for c in range(w):
+            v = ice_acc[r, c] - move[r, c]
+            for k in range(8):
+                nr = r - dr[k]
+                nc = c - dc[k]
+                if 0 <= nr < h and 0 <= nc < w and receiver[nr, nc] == k:
+                    v += move[nr, nc]
+            new_ice[r, c] = v
+    
+    # 3) 침식 (빙하 두께 * 속도 * 경사) / 모레인 (빙하 말단)
+    for r in range(h):
+        r0 = r - 1 if r > 0 else 0
+        r1 = r + 1 if r < h - 1 else h - 1
+        for c in range(w):
+            c0 = c - 1 if c > 0 else 0
+            c1 = c + 1 if c < w - 1 else w - 1
+            
+            v = new_ice[r, c]
+            erosion[r, c] = 0.0
+            moraine[r, c] = 0.0
+            if v <= 0.1:
+                continue
+            
+            dy = (elev[r1, c] - elev[r0, c]) / ((r1 - r0) * cell_size)
+            dx = (elev[r, c1] - elev[r, c0]) / ((c1 - c0) * cell_size)
+            slope = np.sqrt(dx * dx + dy * dy)
+            erosion[r, c] = K * v * sliding_velocity * slope * dt
+            
+            gy = (new_ice[r1, c] - new_ice[r0, c]) / (r1 - r0)
+            gx = (new_ice[r, c1] - new_ice[r, c0]) / (c1 - c0)
+            grad = np.sqrt(gx * gx + gy * gy)
+            if grad > 0.1:
+                moraine[r, c] = grad * 0.01 * dt
+
+
+
 class GlacierKernel:
     """
     빙하 커널
@@ -32,7 +115,7 @@ class GlacierKernel:
         self.sliding_velocity = sliding_velocity
         
         # 빙하 두께 배열
-        self.ice_thickness = np.zeros((grid.height, grid.width))
+        self.ice_thickness = np.zeros((grid.height, grid.width), dtype=grid.dtype)
         
     def accumulate_ice(self, temperature: np.ndarray, 
                        precipitation: np.ndarray,
@@ -85,31 +168,37 @@ class GlacierKernel:
         dr = np.array([-1, -1, -1,  0,  0,  1,  1,  1])
         dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
         
-        new_ice = self.ice_thickness.copy()
-        elev = self.grid.elevation
+        ice = self.ice_thickness
+        new_ice = ice.copy()
         
-        for r in range(1, h - 1):
-            for c in range(1, w - 1):
-                if self.ice_thickness[r, c] <= 0:
-                    continue
-                    
-                # 가장 낮은 이웃 찾기
-                min_z = elev[r, c]
-                target = None
-                
-                for k in range(8):
-                    nr, nc = r + dr[k], c + dc[k]
-                    if 0 <= nr < h and 0 <= nc < w:
-                        if elev[nr, nc] < min_z:
-                            min_z = elev[nr, nc]
-                            target = (nr, nc)
-                            
-                if target:
-                    tr, tc = target
-                    # 이동량 (속도에 비례, 최대 10%)
-                    move = min(self.ice_thickness[r, c] * 0.1 * dt, self.ice_thickness[r, c])
-                    new_ice[r, c] -= move
-                    new_ice[tr, tc] += move
+        if h < 3 or w < 3:
+            self.ice_thickness = new_ice
+            return
+        
+        # 내부 셀의 8방향 이웃 고도를 한 번에 쌓아서 가장 낮은 이웃 찾기
+        # (argmin은 동률일 때 앞 방향 우선 → 순차 탐색과 같은 결과)
+        elev = self.grid.elevation
+        center = elev[1:-1, 1:-1]
+        neighbors = np.stack([elev[1 + dr[k]:h - 1 + dr[k], 1 + dc[k]:w - 1 + dc[k]] for k in range(8)])
+        k_min = np.argmin(neighbors, axis=0)
+        min_z = np.take_along_axis(neighbors, k_min[None], axis=0)[0]
+        
+        inner_ice = ice[1:-1, 1:-1]
+        moving = (inner_ice > 0) & (min_z < center)
+        
+        rows, cols = np.nonzero(moving)
+        rows += 1
+        cols += 1
+        k_sel = k_min[moving]
+        
+        # 이동량 (속도에 비례, 최대 10%)
+        move = np.minimum(ice[rows, cols] * 0.1 * dt, ice[rows, cols])
+        src = rows * w + cols
+        dst = (rows + dr[k_sel]) * w + (cols + dc[k_sel])
+        
+        flat = new_ice.ravel()
+        np.subtract.at(flat, src, move)
+        np.add.at(flat, dst, move)
                     
         self.ice_thickness = new_ice
         
@@ -129,7 +218,7 @@ class GlacierKernel:
         # 빙하가 있는 곳만 침식
         glacier_mask = self.ice_thickness > 0.1
         
-        erosion = np.zeros((h, w), dtype=np.float64)
+        erosion = np.zeros((h, w), dtype=self.grid.dtype)
         
         if not np.any(glacier_mask):
             return erosion
@@ -157,18 +246,21 @@ class GlacierKernel:
         """
         h, w = self.grid.height, self.grid.width
         
-        deposition = np.zeros((h, w), dtype=np.float64)
+        deposition = np.zeros((h, w), dtype=self.grid.dtype)
         
         # 빙하 두께 감소 지점 = 말단
-        # Gradient of ice thickness
+        # Gradient of ice thickness (차분 배열을 그대로 재사용해 크기 계산)
         dy, dx = np.gradient(self.ice_thickness)
-        ice_gradient = np.sqrt(dx**2 + dy**2)
+        ice_gradient = np.multiply(dx, dx, out=dx)
+        ice_gradient += np.multiply(dy, dy, out=dy)
+        np.sqrt(ice_gradient, out=ice_gradient)
         
         # 말단 조건: 빙하 있고, gradient 큼
         terminal_mask = (self.ice_thickness > 0.1) & (ice_gradient > 0.1)
         
-        # 퇴적량 = gradient에 비례
-        deposition[terminal_mask] = ice_gradient[terminal_mask] * 0.01 * dt
+        # 퇴적량 = gradient에 비례 (말단 셀에만 기록)
+        np.multiply(ice_gradient, 0.01, out=ice_gradient, where=terminal_mask)
+        np.multiply(ice_gradient, dt, out=deposition, where=terminal_mask)
         
         # 퇴적 적용
         self.grid.add_sediment(deposition)
@@ -199,20 +291,52 @@ class GlacierKernel:
         if precipitation is None:
             precipitation = np.ones((h, w)) * 1000.0  # mm/year
             
-        # 1. 빙하 축적/소멸
-        self.accumulate_ice(temperature, precipitation, dt)
-        
-        # 2. 빙하 흐름
-        self.flow_ice(dt)
-        
-        # 3. 침식
-        erosion = self.erode(dt)
-        
-        # 4. 모레인 퇴적
-        moraine = self.deposit_moraine(dt)
+        if h < 3 or w < 3:
+            # 1. 빙하 축적/소멸
+            self.accumulate_ice(temperature, precipitation, dt)
+            
+            # 2. 빙하 흐름
+            self.flow_ice(dt)
+            
+            # 3. 침식
+            erosion = self.erode(dt)
+            
+            # 4. 모레인 퇴적
+            moraine = self.deposit_moraine(dt)
+        else:
+            # 1~4를 한 커널에서 계산한 뒤 지형에 한 번에 반영
+            erosion, moraine = self._fused_step(temperature, precipitation, dt)
         
         return {
             'ice_thickness': self.ice_thickness.copy(),
             'erosion': erosion,
             'moraine': moraine
         }
+
+    def _fused_step(self, temperature: np.ndarray, precipitation: np.ndarray,
+                    dt: float):
+        """축적/흐름/침식/모레인 퇴적을 _glacier_step_kernel로 한 번에 처리"""
+        h, w = self.grid.height, self.grid.width
+        dtype = self.grid.dtype
+        
+        ice_acc = np.empty((h, w), dtype=self.ice_thickness.dtype)
+        move = np.empty((h, w), dtype=self.ice_thickness.dtype)
+        receiver = np.empty((h, w), dtype=np.int64)
+        new_ice = np.empty((h, w), dtype=self.ice_thickness.dtype)
+        erosion = np.empty((h, w), dtype=dtype)
+        moraine = np.empty((h, w), dtype=dtype)
+        
+        _glacier_step_kernel(self.grid.elevation, self.ice_thickness,
+                             np.broadcast_to(temperature, (h, w)),
+                             np.broadcast_to(precipitation, (h, w)),
+                             self.ice_threshold, self.K, self.sliding_velocity,
+                             self.grid.cell_size, dt,
+                             ice_acc, move, receiver, new_ice, erosion, moraine)
+        
+        self.ice_thickness = new_ice
+        
+        # 침식은 기반암에서, 모레인은 퇴적층에 (고도 갱신은 add_sediment에서 한 번)
+        self.grid.bedrock -= erosion
+        self.grid.add_sediment(moraine)
+        
+        return erosion, moraine
@@ -31,49 +31,177 @@ class WorldGrid:
     # 지표면 고도 (Topography = Bedrock + Sediment)
     elevation: np.ndarray = field(default=None)
     
+    # 상태 레이어 자료형 (np.float32로 두면 메모리 대역폭이 절반)
+    dtype: type = np.float64
+    
+    # --- 캐시 (Cache) ---
+    # 고도 내림차순 셀 인덱스 (get_flow_order)
+    _flow_order: np.ndarray = field(default=None, init=False, repr=False)
+    # 침수 마스크 (is_underwater, elevation/sea_level 변경 시 무효화)
+    _underwater: np.ndarray = field(default=None, init=False, repr=False)
+    # 육지 셀만 남긴 처리 순서와 그 기준이 된 (순서, 침수 마스크)
+    _land_order: np.ndarray = field(default=None, init=False, repr=False)
+    _land_order_key: tuple = field(default=None, init=False, repr=False)
+    # 경사 계산용 차분 버퍼 (get_gradient, 스텝마다 재사용)
+    _grad_dy: np.ndarray = field(default=None, init=False, repr=False)
+    _grad_dx: np.ndarray = field(default=None, init=False, repr=False)
+    
+    def __setattr__(self, name, value):
+        # 고도 배열 교체 / 해수면 변경 시 침수 마스크 캐시 무효화
+        if name in ('elevation', 'sea_level'):
+            object.__setattr__(self, '_underwater', None)
+        object.__setattr__(self, name, value)
+    
     def __post_init__(self):
         """그리드 초기화"""
         shape = (self.height, self.width)
         
         if self.bedrock is None:
-            self.bedrock = np.zeros(shape)
+            self.bedrock = np.zeros(shape, dtype=self.dtype)
         if self.sediment is None:
-            self.sediment = np.zeros(shape)
+            self.sediment = np.zeros(shape, dtype=self.dtype)
         if self.water_depth is None:
-            self.water_depth = np.zeros(shape)
+            self.water_depth = np.zeros(shape, dtype=self.dtype)
         if self.discharge is None:
-            self.discharge = np.zeros(shape)
+            self.discharge = np.zeros(shape, dtype=self.dtype)
         if self.flow_dir is None:
             self.flow_dir = np.zeros(shape, dtype=int)
         if self.elevation is None:
             self.update_elevation()
             
     def update_elevation(self):
-        """지표면 고도 갱신 (기반암 + 퇴적층)"""
-        self.elevation = self.bedrock + self.sediment
+        """
+        지표면 고도 갱신 (기반암 + 퇴적층)
+        
+        기존 elevation 배열에 제자리로 기록하여 매번 새 배열을 만들지 않음
+        (모양/자료형이 다르거나 입력 배열과 메모리를 공유하면 새로 할당)
+        """
+        elev = self.elevation
+        if (elev is None or elev.shape != self.bedrock.shape
+                or elev.dtype != np.result_type(self.bedrock, self.sediment)
+                or np.may_share_memory(elev, self.bedrock)
+                or np.may_share_memory(elev, self.sediment)):
+            self.elevation = self.bedrock + self.sediment
+            return
+        
+        np.add(self.bedrock, self.sediment, out=elev)
+        self.invalidate_cache()
 
     def get_gradient(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         경사도(Slope)와 경사향(Aspect) 계산
+        
+        np.gradient와 같은 차분(내부 중앙차분, 가장자리 1차 차분)을
+        재사용 버퍼에 직접 계산하고 경사도는 제자리 연산으로 구합니다.
+        반환 배열은 매번 새로 만들어지므로 호출자가 보관해도 안전합니다.
+        
         Returns:
             slope (m/m): 경사도
             aspect (rad): 경사 방향 (0=East, pi/2=North)
         """
-        dy, dx = np.gradient(self.elevation, self.cell_size)
-        slope = np.sqrt(dx**2 + dy**2)
+        elev = self.elevation
+        h, w = elev.shape
+        if h < 2 or w < 2:
+            dy, dx = np.gradient(elev, self.cell_size)
+            return np.sqrt(dx**2 + dy**2), np.arctan2(dy, dx)
+        
+        dtype = elev.dtype if np.issubdtype(elev.dtype, np.floating) else np.float64
+        dy = self._grad_dy
+        if dy is None or dy.shape != elev.shape or dy.dtype != dtype:
+            dy = self._grad_dy = np.empty(elev.shape, dtype=dtype)
+            self._grad_dx = np.empty(elev.shape, dtype=dtype)
+        dx = self._grad_dx
+        
+        cs = self.cell_size
+        # 내부: 중앙차분
+        np.subtract(elev[2:, :], elev[:-2, :], out=dy[1:-1, :])
+        np.divide(dy[1:-1, :], 2.0 * cs, out=dy[1:-1, :])
+        np.subtract(elev[:, 2:], elev[:, :-2], out=dx[:, 1:-1])
+        np.divide(dx[:, 1:-1], 2.0 * cs, out=dx[:, 1:-1])
+        # 가장자리: 1차 차분
+        np.subtract(elev[1, :], elev[0, :], out=dy[0, :])
+        np.subtract(elev[-1, :], elev[-2, :], out=dy[-1, :])
+        np.subtract(elev[:, 1], elev[:, 0], out=dx[:, 0])
+        np.subtract(elev[:, -1], elev[:, -2], out=dx[:, -1])
+        np.divide(dy[0, :], cs, out=dy[0, :])
+        np.divide(dy[-1, :], cs, out=dy[-1, :])
+        np.divide(dx[:, 0], cs, out=dx[:, 0])
+        np.divide(dx[:, -1], cs, out=dx[:, -1])
+        
+        # slope = sqrt(dx^2 + dy^2)를 결과 배열 하나에서 계산
+        # (np.hypot은 오버플로 보호 때문에 훨씬 느림)
         aspect = np.arctan2(dy, dx)
+        slope = np.multiply(dx, dx)
+        np.multiply(dy, dy, out=dx)
+        slope += dx
+        np.sqrt(slope, out=slope)
         return slope, aspect
 
+    def get_flow_order(self) -> np.ndarray:
+        """
+        고도 내림차순 셀 인덱스 (상류 → 하류 처리 순서)
+        
+        직전 순서가 현재 고도에서도 여전히 내림차순이면 O(N) 확인만 하고
+        재정렬(O(N log N))을 생략합니다.
+        
+        Returns:
+            order: 평탄화(ravel) 인덱스 배열
+        """
+        flat = self.elevation.ravel()
+        order = self._flow_order
+        
+        if order is not None and order.size == flat.size:
+            ranked = flat[order]
+            if np.all(ranked[:-1] >= ranked[1:]):
+                return order
+                
+        order = np.argsort(flat)[::-1]
+        self._flow_order = order
+        return order
+
+    def get_land_flow_order(self) -> np.ndarray:
+        """
+        해수면 위 셀만 남긴 고도 내림차순 인덱스
+        
+        물속 셀은 유량을 하류로 넘기지 않으므로 라우팅 순서에서 미리 제외.
+        get_flow_order / is_underwater 캐시가 그대로면 이전 결과를 재사용합니다.
+        """
+        order = self.get_flow_order()
+        underwater = self.is_underwater()
+        key = self._land_order_key
+        if key is not None and key[0] is order and key[1] is underwater:
+            return self._land_order
+        
+        land_order = order[~underwater.ravel()[order]]
+        self._land_order = land_order
+        self._land_order_key = (order, underwater)
+        return land_order
+
     def get_water_surface(self) -> np.ndarray:
         """수면 고도 반환 (지표면 + 수심)"""
         return self.elevation + self.water_depth
 
     def is_underwater(self) -> np.ndarray:
-        """해수면 기준 침수 여부 확인"""
+        """
+        해수면 기준 침수 여부 확인
+        
+        결과는 캐시되어 elevation 교체(update_elevation 포함)나 sea_level 변경
+        전까지 재사용됩니다. 공유 배열이므로 읽기 전용으로 반환합니다.
+        elevation[...] = ... 처럼 원소만 바꿨다면 invalidate_cache()를 호출하세요
+        (grid.elevation += ... 같은 복합 대입은 속성 대입이라 자동으로 무효화됨).
+        """
         # 해수면보다 낮거나, 지표면에 물이 흐르고 있는 경우
         # 여기서는 간단히 '해수면' 기준과 '담수' 존재 여부를 분리해서 생각할 수 있음.
         # 일단 해수면(Sea Level) 기준 침수 지역 반환
-        return self.elevation < self.sea_level
+        if self._underwater is None:
+            underwater = self.elevation < self.sea_level
+            underwater.setflags(write=False)
+            self._underwater = underwater
+        return self._underwater
+
+    def invalidate_cache(self):
+        """elevation을 제자리에서 수정한 뒤 파생 캐시(침수 마스크) 무효화"""
+        self._underwater = None
 
     def apply_uplift(self, rate: float, dt: float = 1.0):
         """지반 융기 적용"""
@@ -84,5 +212,5 @@ class WorldGrid:
         """퇴적물 추가/제거"""
         self.sediment += amount
         # 퇴적물은 0보다 작을 수 없음 (기반암 침식은 별도 로직)
-        self.sediment = np.maximum(self.sediment, 0)
+        np.maximum(self.sediment, 0, out=self.sediment)
         self.update_elevation()
@@ -13,8 +13,198 @@ Ideal Landform Geometry Models (이상적 지형 기하학 모델)
 - 사구: 바르한 (Crescent)
 """
 
+import os
 import numpy as np
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Iterable, Tuple
+from numba import jit
+
+
+# 고도 배열 dtype: 이상적 지형 높이(|z| < 수백 m)는 float32 정밀도로 충분
+# (메모리/대역폭 절반, 애니메이션 프레임 배열도 절반)
+_DTYPE = np.float32
+
+
+# ============================================
+# 프레임 간 재사용 격자 (Stage-invariant Meshes)
+# 애니메이션은 같은 grid_size로 stage만 바꿔 반복 호출하므로
+# stage와 무관한 거리/각도 격자는 한 번만 계산해 캐시 (읽기 전용)
+# ============================================
+
+@lru_cache(maxsize=32)
+def _coord_grid(h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """행/열 좌표 (h, 1), (1, w) - np.ogrid[:h, :w]와 같고 h + w개만 저장"""
+    rows, cols = np.ogrid[:h, :w]
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
+
+@lru_cache(maxsize=32)
+def _radial_distance(h: int, w: int, cy: int, cx: int) -> np.ndarray:
+    """(cy, cx)로부터 각 셀까지의 거리 격자 (h, w)"""
+    yy, xx = _coord_grid(h, w)
+    dist = np.hypot(yy - cy, xx - cx)
+    dist.flags.writeable = False
+    return dist
+
+
+@lru_cache(maxsize=32)
+def _meander_wave(h: int, wl: float) -> Tuple[np.ndarray, np.ndarray]:
+    """파장 wl 곡류 중심선의 행별 위상 (sin, cos), theta = 2π·행/wl"""
+    theta = 2 * np.pi * np.arange(h) / wl
+    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
+    sin_theta.flags.writeable = False
+    cos_theta.flags.writeable = False
+    return sin_theta, cos_theta
+
+
+@lru_cache(maxsize=32)
+def _apex_angle(h: int, w: int, apex_y: int, center_x: int) -> np.ndarray:
+    """정점 아래 각 행의 하류 방향 기준 각도 (h - apex_y, w), 정점 행은 0"""
+    dist = np.arange(h - apex_y)[:, None]
+    dx = np.arange(w)[None, :] - center_x
+    angle = np.where(dist > 0, np.arctan2(dx, dist), 0.0)
+    angle.flags.writeable = False
+    return angle
+
+
+@lru_cache(maxsize=32)
+def _row_gradient(h: int, height: float) -> np.ndarray:
+    """상류(0행)에서 height, 하류로 갈수록 낮아지는 종단 경사 열벡터 (h, 1)"""
+    r = np.arange(h)[:, None]
+    gradient = (h - r) / h * height
+    gradient.flags.writeable = False
+    return gradient
+
+
+# ============================================
+# 배경 템플릿 (Stage-invariant Backgrounds)
+# 바다/육지/산지 배경이 stage와 무관한 지형은 배경을 크기별로 한 번만 만들고
+# 각 프레임은 템플릿의 .copy() (연속 배열 memcpy)에서 시작해 stage별 지형만 덧그림
+# ============================================
+
+@lru_cache(maxsize=32)
+def _delta_background(h: int, w: int, apex_y: int) -> np.ndarray:
+    """삼각주 배경: 바다/호수 (하류로 갈수록 깊어짐)"""
+    elevation = np.empty((h, w), dtype=_DTYPE)
+    elevation[:, :] = (-5.0 - (np.arange(h) - apex_y) * 0.05)[:, None]
+    elevation.flags.writeable = False
+    return elevation
+
+
+@lru_cache(maxsize=32)
+def _fan_background(h: int, w: int, apex_y: int, center_x: int, max_height: float) -> np.ndarray:
+    """선상지 배경: 정점 위 산지 + 협곡"""
+    elevation = np.zeros((h, w), dtype=_DTYPE)
+    elevation[:apex_y, :] = (max_height + (apex_y - np.arange(apex_y)) * 2.0)[:, None]
+    
+    cols = np.arange(w)
+    lo, hi = max(0, center_x - 3), min(w, center_x + 4)
+    elevation[:apex_y + 5, lo:hi] -= 10.0 * (1 - np.abs(cols[lo:hi] - center_x) / 4)
+    elevation.flags.writeable = False
+    return elevation
+
+
+@lru_cache(maxsize=32)
+def _spit_background(h: int, w: int, sea_line: int) -> np.ndarray:
+    """사취 배경: 육지(왼쪽) + 해저 경사(오른쪽)"""
+    elevation = np.empty((h, w), dtype=_DTYPE)
+    elevation[:, sea_line:] = -5.0 - (np.arange(sea_line, w) - sea_line) * 0.1
+    elevation[:, :sea_line] = 10.0
+    elevation.flags.writeable = False
+    return elevation
+
+
+@lru_cache(maxsize=32)
+def _moraine_background(h: int, w: int) -> np.ndarray:
+    """빙하 계곡 배경: 중앙에서 멀수록 높아지는 양쪽 산지"""
+    elevation = np.empty((h, w), dtype=_DTYPE)
+    elevation[:, :] = 25.0 + np.abs(np.arange(w) - w // 2) * 0.3
+    elevation.flags.writeable = False
+    return elevation
+
+
+@lru_cache(maxsize=32)
+def _tombolo_background(h: int, w: int, island_cy: int, island_cx: int,
+                        island_radius: int) -> np.ndarray:
+    """육계사주 배경: 바다 + 본토(왼쪽) + 섬"""
+    elevation = np.full((h, w), -5.0, dtype=_DTYPE)
+    elevation[:, :int(w * 0.3)] = 15.0
+    
+    dist = _radial_distance(h, w, island_cy, island_cx)
+    island = dist < island_radius
+    elevation[island] = 20.0 * (1 - dist[island] / island_radius / 1.5)
+    elevation.flags.writeable = False
+    return elevation
+
+
+@lru_cache(maxsize=32)
+def _sea_arch_background(h: int, w: int, sea_line: int, cliff_height: float,
+                         headland_cx: int, headland_width: int,
+                         headland_length: int) -> np.ndarray:
+    """해식아치 배경: 바다 + 육지 절벽 + 바다로 가늘어지는 곶(headland)"""
+    elevation = np.full((h, w), cliff_height, dtype=_DTYPE)
+    elevation[sea_line:, :] = -8.0
+    
+    rows = np.arange(sea_line, sea_line + headland_length)
+    taper = 1 - (rows - sea_line) / headland_length * 0.5
+    half = (headland_width * taper).astype(int)[:, None] // 2
+    cols = np.arange(w)[None, :]
+    headland = (cols >= headland_cx - half) & (cols < headland_cx + half)
+    height = cliff_height * (1 - (rows - sea_line) / headland_length * 0.2)
+    slab = elevation[sea_line:sea_line + headland_length]
+    np.copyto(slab, np.broadcast_to(height[:, None], slab.shape), where=headland)
+    elevation.flags.writeable = False
+    return elevation
+
+
+# ============================================
+# 스탬프 (Stamps)
+# 원판/타원처럼 중심 주변 작은 창에만 영향을 주는 형태는 격자 전체 대신
+# 격자 경계로 잘린 창에서만 계산
+# ============================================
+
+def _stamp_window(h: int, w: int, cy: int, cx: int, ry: int, rx: int):
+    """
+    (cy, cx) 중심 ±(ry, rx) 창을 격자 안으로 자른 슬라이스
+    
+    Returns:
+        (격자 행, 격자 열, 창 행, 창 열) 슬라이스, 창이 격자 밖이면 None
+    """
+    r0, r1 = max(cy - ry, 0), min(cy + ry + 1, h)
+    c0, c1 = max(cx - rx, 0), min(cx + rx + 1, w)
+    if r0 >= r1 or c0 >= c1:
+        return None
+    return (slice(r0, r1), slice(c0, c1),
+            slice(r0 - (cy - ry), r1 - (cy - ry)), slice(c0 - (cx - rx), c1 - (cx - rx)))
+
+
+def _stamp(elevation: np.ndarray, cy: int, cx: int, values: np.ndarray,
+           mask: np.ndarray, ufunc=None) -> np.ndarray:
+    """
+    홀수 크기 스탬프를 (cy, cx) 중심에 찍음 (격자 밖으로 나간 부분은 잘림)
+    
+    Args:
+        elevation: 고도 배열 (제자리 수정)
+        values: 스탬프 값 (2*ry+1, 2*rx+1)
+        mask: 스탬프가 적용될 셀 (values와 같은 크기)
+        ufunc: None이면 덮어쓰기, 아니면 np.maximum/np.minimum 등으로 합침
+        
+    Returns:
+        실제로 적용된 (잘린) 마스크 - 면적 집계용
+    """
+    window = _stamp_window(*elevation.shape, cy, cx, values.shape[0] // 2, values.shape[1] // 2)
+    if window is None:
+        return mask[:0, :0]
+    rs, cs, kr, kc = window
+    slab = elevation[rs, cs]
+    if ufunc is None:
+        np.copyto(slab, values[kr, kc], where=mask[kr, kc])
+    else:
+        ufunc(slab, values[kr, kc], out=slab, where=mask[kr, kc])
+    return mask[kr, kc]
 
 
 def create_delta(grid_size: int = 100, 
@@ -34,7 +224,7 @@ def create_delta(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     apex_y = int(h * apex_row)
     center_x = w // 2
@@ -45,37 +235,33 @@ def create_delta(grid_size: int = 100,
     # 육지 배경 (삼각주 전체)
     half_angle = np.radians(spread_angle / 2)
     
-    for r in range(apex_y, h):
-        dist = r - apex_y
-        if dist == 0:
-            continue
-            
-        # 각도 범위 내 육지
-        for c in range(w):
-            dx = c - center_x
-            angle = np.arctan2(dx, dist)  # 정점 기준 각도
-            
-            if abs(angle) < half_angle:
-                # 삼각주 육지
-                # 중심에서 멀수록 낮아짐
-                radial_dist = np.sqrt(dx**2 + dist**2)
-                max_dist = h - apex_y
-                elevation[r, c] = 10.0 * (1 - radial_dist / max_dist)
+    # 정점 아래 행 (정점 행 제외)
+    dist = np.arange(1, h - apex_y)[:, None]
+    dx = np.arange(w)[None, :] - center_x
+    angle = _apex_angle(h, w, apex_y, center_x)[1:]  # 정점 기준 각도 (캐시)
+    
+    # 각도 범위 내 육지, 중심에서 멀수록 낮아짐
+    radial_dist = np.hypot(dx, dist)
+    max_dist = h - apex_y
+    land = elevation[apex_y + 1:]
+    inside = np.abs(angle) < half_angle
+    land[inside] = (10.0 * (1 - radial_dist / max_dist))[inside]
                 
     # 분배 수로 (Distributary Channels)
-    for i in range(num_channels):
-        channel_angle = -half_angle + (2 * half_angle) * (i / (num_channels - 1))
-        
-        for r in range(apex_y, h):
-            dist = r - apex_y
-            c = int(center_x + dist * np.tan(channel_angle))
-            
-            if 0 <= c < w:
-                # 수로 파기 (음각)
-                for dc in range(-2, 3):
-                    if 0 <= c + dc < w:
-                        depth = 2.0 * (1 - abs(dc) / 3)
-                        elevation[r, c + dc] -= depth
+    # (수로, 폭 오프셋, 행) 인덱스를 한 번에 만들어 겹치는 셀까지 누적 차감
+    rows = np.arange(apex_y, h)
+    channel_angle = np.array([-half_angle + (2 * half_angle) * (i / (num_channels - 1))
+                              for i in range(num_channels)])
+    cols = (center_x + (rows - apex_y)[None, :] * np.tan(channel_angle)[:, None]).astype(int)
+    on_grid = (cols >= 0) & (cols < w)
+    
+    # 수로 파기 (음각)
+    dc = np.arange(-2, 3)[None, :, None]
+    c = cols[:, None, :] + dc
+    r = np.broadcast_to(rows, c.shape)
+    depth = np.broadcast_to((2.0 * (1 - np.abs(dc) / 3)).astype(_DTYPE), c.shape)
+    valid = on_grid[:, None, :] & (c >= 0) & (c < w)
+    np.subtract.at(elevation, (r[valid], c[valid]), depth[valid])
                         
     return elevation
 
@@ -97,43 +283,38 @@ def create_alluvial_fan(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     apex_y = int(h * apex_row)
     center_x = w // 2
     half_angle = np.radians(cone_angle / 2)
     
     # 배경 산지 (상단)
-    for r in range(apex_y):
-        elevation[r, :] = max_height + (apex_y - r) * 2.0
+    elevation[:apex_y, :] = max_height + (apex_y - np.arange(apex_y))[:, None] * 2.0
         
     # 선상지 본체 (원뿔)
-    for r in range(apex_y, h):
-        dist = r - apex_y
-        max_dist = h - apex_y
-        
-        for c in range(w):
-            dx = c - center_x
-            angle = np.arctan2(abs(dx), dist) if dist > 0 else 0
-            
-            if abs(np.arctan2(dx, dist)) < half_angle:
-                # 원뿔 형태: 중심이 높고, 가장자리가 낮음
-                radial = np.sqrt(dx**2 + dist**2)
-                # 정점에서 멀어질수록 낮아짐
-                z = max_height * (1 - radial / (max_dist * 1.5))
-                # 가장자리로 갈수록 더 급격히 낮아짐
-                lateral_decay = 1 - abs(dx) / (w // 2)
-                elevation[r, c] = max(0, z * lateral_decay)
-            else:
-                elevation[r, c] = 0  # 평지
+    dist = np.arange(h - apex_y)[:, None]
+    dx = np.arange(w)[None, :] - center_x
+    max_dist = h - apex_y
+    
+    # 원뿔 형태: 중심이 높고, 가장자리가 낮음
+    radial = np.hypot(dx, dist)
+    # 정점에서 멀어질수록 낮아짐
+    z = max_height * (1 - radial / (max_dist * 1.5))
+    # 가장자리로 갈수록 더 급격히 낮아짐
+    lateral_decay = 1 - np.abs(dx) / (w // 2)
+    cone = np.maximum(0, z * lateral_decay)
+    
+    # 부채꼴 밖은 평지 (정점 기준 각도는 캐시, 정점 행은 좌우가 ±90°라 따로 계산)
+    inside = np.abs(_apex_angle(h, w, apex_y, center_x)) < half_angle
+    inside[:1] = np.abs(np.arctan2(dx[0], 0)) < half_angle
+    elevation[apex_y:, :] = np.where(inside, cone, 0)
                 
-    # 협곡 (Apex에서 시작)
-    for r in range(0, apex_y + 5):
-        for dc in range(-3, 4):
-            c = center_x + dc
-            if 0 <= c < w:
-                depth = 10.0 * (1 - abs(dc) / 4)
-                elevation[r, c] -= depth
+    # 협곡 (Apex에서 시작) - 열 단면을 정점 위쪽 행 구간에 일괄 차감
+    c0, c1 = max(center_x - 3, 0), min(center_x + 4, w)
+    canyon = 10.0 * (1 - np.abs(np.arange(c0, c1) - center_x) / 4)
+    slab = elevation[:apex_y + 5, c0:c1]
+    np.subtract(slab, canyon.astype(_DTYPE), out=slab)
                 
     return elevation
 
@@ -155,7 +336,7 @@ def create_meander(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 배경: 범람원 평탄면
     elevation[:, :] = 10.0
@@ -166,36 +347,30 @@ def create_meander(grid_size: int = 100,
     channel_width = max(3, w // 20)
     
     # 사행 하천 경로
-    for r in range(h):
-        # Kinoshita curve (이상화된 곡류)
-        theta = 2 * np.pi * r / wl
-        meander_x = center_x + amp * np.sin(theta)
-        
-        for c in range(w):
-            dist = abs(c - meander_x)
-            
-            if dist < channel_width:
-                # 하도 (낮게)
-                elevation[r, c] = 5.0 - (channel_width - dist) * 0.3
-            elif dist < channel_width * 3:
-                # 자연제방 (약간 높게)
-                elevation[r, c] = 10.5
+    # Kinoshita curve (이상화된 곡류)
+    meander_x = center_x + amp * _meander_wave(h, wl)[0]
+    dist = np.abs(_coord_grid(h, w)[1] - meander_x[:, None])
+    
+    # 자연제방 (약간 높게)
+    elevation[dist < channel_width * 3] = 10.5
+    # 하도 (낮게)
+    channel = dist < channel_width
+    elevation[channel] = (5.0 - (channel_width - dist) * 0.3)[channel]
                 
     # 우각호 (Oxbow Lake) 추가
     # 중간쯤에 절단된 곡류 흔적
     oxbow_y = h // 2
     oxbow_amp = amp * 1.5
     
-    for dy in range(-int(wl/4), int(wl/4)):
-        r = oxbow_y + dy
-        if 0 <= r < h:
-            theta = 2 * np.pi * dy / (wl/2)
-            ox_x = center_x + oxbow_amp * np.sin(theta)
-            
-            for dc in range(-channel_width, channel_width + 1):
-                c = int(ox_x + dc)
-                if 0 <= c < w:
-                    elevation[r, c] = 4.0  # 호수 수면
+    dy = np.arange(-int(wl/4), int(wl/4))
+    rows = oxbow_y + dy
+    theta = 2 * np.pi * dy / (wl/2)
+    ox_x = center_x + oxbow_amp * np.sin(theta)
+    
+    cols = (ox_x[:, None] + np.arange(-channel_width, channel_width + 1)[None, :]).astype(int)
+    rows = np.broadcast_to(rows[:, None], cols.shape)
+    valid = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+    elevation[rows[valid], cols[valid]] = 4.0  # 호수 수면
                     
     return elevation
 
@@ -215,26 +390,21 @@ def create_u_valley(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = w // 2
     half_width = int(w * valley_width / 2)
     
-    for r in range(h):
-        for c in range(w):
-            dx = abs(c - center)
-            
-            if dx < half_width:
-                # U자 바닥 (평탄)
-                elevation[r, c] = 0
-            else:
-                # U자 측벽 (급경사 후 완만)
-                # y = (x/a)^4 형태
-                normalized_x = (dx - half_width) / (w // 2 - half_width)
-                elevation[r, c] = valley_depth * (normalized_x ** 2)
-                
-        # 상류로 갈수록 높아짐
-        elevation[r, :] += (h - r) / h * 30.0
+    dx = np.abs(np.arange(w) - center)
+    
+    # U자 바닥 (평탄) / U자 측벽 (급경사 후 완만)
+    # y = (x/a)^4 형태
+    # 곡저가 격자 절반을 다 채우면 분모가 0 → 1로 고정 (가장자리 NaN 방지)
+    normalized_x = np.maximum(dx - half_width, 0) / max(w // 2 - half_width, 1)
+    profile = valley_depth * (normalized_x ** 2)
+    
+    # 상류로 갈수록 높아짐 (횡단면 + 종단 경사를 elevation에 바로 기록)
+    np.add(profile[None, :], _row_gradient(h, 30.0), out=elevation)
         
     return elevation
 
@@ -252,26 +422,20 @@ def create_v_valley(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = w // 2
     
-    for r in range(h):
-        for c in range(w):
-            dx = abs(c - center)
-            
-            # V자 형태: |x| 에 비례
-            elevation[r, c] = valley_depth * (dx / (w // 2))
-            
-        # 상류로 갈수록 높아짐
-        elevation[r, :] += (h - r) / h * 50.0
+    # V자 형태: |x| 에 비례
+    dx = np.abs(np.arange(w) - center)
+    profile = valley_depth * (dx / max(w // 2, 1))
+    
+    # 상류로 갈수록 높아짐 (횡단면 + 종단 경사를 elevation에 바로 기록)
+    np.add(profile[None, :], _row_gradient(h, 50.0), out=elevation)
         
     # 하천 (V자 바닥)
-    for r in range(h):
-        for dc in range(-2, 3):
-            c = center + dc
-            if 0 <= c < w:
-                elevation[r, c] = max(0, elevation[r, c] - 5)
+    lo, hi = max(0, center - 2), min(w, center + 3)
+    elevation[:, lo:hi] = np.maximum(0, elevation[:, lo:hi] - 5)
                 
     return elevation
 
@@ -289,49 +453,59 @@ def create_barchan_dune(grid_size: int = 100,
         elevation: 고도 배열
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 사막 기반면
     elevation[:, :] = 5.0
     
+    rng = np.random.RandomState(42)
+    
     for i in range(num_dunes):
         # 사구 중심
         cy = h // 4 + i * (h // (num_dunes + 1))
         cx = w // 2 + (i - num_dunes // 2) * (w // 5)
         
-        dune_height = 15.0 + np.random.rand() * 10.0
+        dune_height = 15.0 + rng.rand() * 10.0
         dune_length = w // 5
         dune_width = w // 8
         
-        for r in range(h):
-            for c in range(w):
-                dy = r - cy
-                dx = c - cx
-                
-                # 바르한: 바람받이(앞)는 완만, 바람그늘(뒤)는 급경사
-                # 초승달 형태
-                
-                # 거리
-                dist = np.sqrt((dy / dune_length) ** 2 + (dx / dune_width) ** 2)
-                
-                if dist < 1.0:
-                    # 사구 본체
-                    # 앞쪽(바람받이): 완만한 경사
-                    # 뒤쪽: 급경사 (Slip Face)
-                    
-                    if dy < 0:  # 바람받이
-                        z = dune_height * (1 - dist) * (1 - abs(dy) / dune_length)
-                    else:  # 바람그늘
-                        z = dune_height * (1 - dist) * max(0, 1 - dy / (dune_length * 0.5))
-                        
-                    # 초승달 뿔 (Horns)
-                    horn_factor = 1 + 0.5 * abs(dx / dune_width)
-                    
-                    elevation[r, c] = max(elevation[r, c], 5.0 + z * horn_factor)
+        # 타원 안(dist < 1)만 바뀌므로 |dy| < 길이, |dx| < 폭 경계 상자만 계산
+        window = _stamp_window(h, w, cy, cx, dune_length - 1, dune_width - 1)
+        if window is None:
+            continue
+        rs, cs = window[:2]
+        dy = np.arange(rs.start, rs.stop)[:, None] - cy
+        dx = np.arange(cs.start, cs.stop)[None, :] - cx
+        
+        # 바르한: 바람받이(앞)는 완만, 바람그늘(뒤)는 급경사
+        # 초승달 형태
+        
+        # 거리
+        dist = np.hypot(dy / dune_length, dx / dune_width)
+        
+        # 사구 본체
+        # 앞쪽(바람받이): 완만한 경사
+        # 뒤쪽: 급경사 (Slip Face)
+        windward = dune_height * (1 - dist) * (1 - np.abs(dy) / dune_length)
+        lee = dune_height * (1 - dist) * np.maximum(0, 1 - dy / (dune_length * 0.5))
+        z = np.where(dy < 0, windward, lee)
+            
+        # 초승달 뿔 (Horns)
+        horn_factor = 1 + 0.5 * np.abs(dx / dune_width)
+        
+        body = dist < 1.0
+        slab = elevation[rs, cs]
+        np.maximum(slab, 5.0 + z * horn_factor, out=slab, where=body)
                     
     return elevation
 
 
+# 시스택 스탬프 (9x9, 중심 기준): 반경 4 안쪽만 솟아오르고 중심에서 멀수록 포물선으로 낮아짐
+_CLIFF_STACK_DIST = np.hypot(*np.ogrid[-4:5, -4:5])
+_CLIFF_STACK_MASK = _CLIFF_STACK_DIST < 4
+_CLIFF_STACK_PROFILE = 1 - (_CLIFF_STACK_DIST / 4) ** 2
+
+
 def create_coastal_cliff(grid_size: int = 100, stage: float = 1.0,
                           cliff_height: float = 30.0,
                           num_stacks: int = 2,
@@ -362,7 +536,7 @@ def create_coastal_cliff(grid_size: int = 100, stage: float = 1.0,
     - 용식작용: 해수의 화학적 용해 (석회암)
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 해안선 위치 (stage에 따라 육지쪽으로 후퇴)
     initial_sea_line = int(h * 0.7)
@@ -370,41 +544,40 @@ def create_coastal_cliff(grid_size: int = 100, stage: float = 1.0,
     sea_line = initial_sea_line - retreat_amount
     
     # 바다 (하단)
-    for r in range(sea_line, h):
-        elevation[r, :] = -5.0
+    elevation[max(sea_line, 0):, :] = -5.0
     
     # 절벽 높이 (stage에 따라 발달)
     current_cliff_height = cliff_height * (0.5 + 0.5 * stage)
     
     # 육지 + 절벽
     cliff_width = max(3, int(5 * stage))
-    for r in range(sea_line):
-        cliff_dist = sea_line - r
-        if cliff_dist < cliff_width:
-            # 절벽면 (수직에 가까움)
-            t = cliff_dist / cliff_width
-            elevation[r, :] = current_cliff_height * (t ** 0.7)  # 오목한 프로파일
-        else:
-            # 평탄한 육지
-            elevation[r, :] = current_cliff_height
+    if sea_line > 0:
+        cliff_dist = sea_line - np.arange(sea_line)
+        # 절벽면 (수직에 가까움, 오목한 프로파일) / 평탄한 육지
+        t = cliff_dist / cliff_width
+        land = np.where(cliff_dist < cliff_width,
+                        current_cliff_height * (t ** 0.7),
+                        current_cliff_height)
+        elevation[:sea_line, :] = land[:, None]
     
     # 노치 (Notch) - stage > 0.3에서 형성
     if stage > 0.3:
         notch_depth = int(3 * (stage - 0.3) / 0.7)
         notch_height = 2  # 파랑대 높이
         
-        for r in range(sea_line - notch_height, sea_line):
-            for c in range(w):
-                if 0 <= r < h:
-                    # 노치 깊이만큼 파임
-                    elevation[r, c] = min(elevation[r, c], 
-                                         elevation[r, c] - notch_depth * (1 - abs(r - (sea_line - 1)) / notch_height))
+        # 노치 깊이만큼 파임 (해안선 바로 위 행들에 행별 깊이를 브로드캐스트)
+        notch_rows = np.arange(max(sea_line - notch_height, 0), min(sea_line, h))
+        if notch_rows.size:
+            depth = notch_depth * (1 - np.abs(notch_rows - (sea_line - 1)) / notch_height)
+            slab = elevation[notch_rows[0]:notch_rows[-1] + 1]
+            np.minimum(slab, slab - depth.astype(_DTYPE)[:, None], out=slab)
     
     # 파식대 (Wave-cut Platform) - stage > 0.4에서 확장
     platform_width = int(10 + 15 * max(0, (stage - 0.4) / 0.6))
-    for r in range(sea_line, min(sea_line + platform_width, h)):
-        platform_depth = -1.0 - (r - sea_line) * 0.3
-        elevation[r, :] = max(platform_depth, -5.0)
+    platform_rows = np.arange(sea_line, min(sea_line + platform_width, h))
+    if platform_rows.size:
+        platform_depth = -1.0 - (platform_rows - sea_line) * 0.3
+        elevation[platform_rows, :] = np.maximum(platform_depth, -5.0)[:, None]
     
     # 시스택 (Sea Stacks) - stage > 0.7에서 형성
     stacks_formed = []
@@ -417,16 +590,9 @@ def create_coastal_cliff(grid_size: int = 100, stage: float = 1.0,
             sy = sea_line + 8 + i * 4
             
             stack_height = current_cliff_height * 0.6 * stack_progress
-            stack_radius = 4
             
-            for dr in range(-stack_radius, stack_radius + 1):
-                for dc in range(-stack_radius, stack_radius + 1):
-                    r_pos, c_pos = sy + dr, sx + dc
-                    if 0 <= r_pos < h and 0 <= c_pos < w:
-                        dist = np.sqrt(dr**2 + dc**2)
-                        if dist < stack_radius:
-                            z = stack_height * (1 - (dist / stack_radius) ** 2)
-                            elevation[r_pos, c_pos] = max(elevation[r_pos, c_pos], z)
+            _stamp(elevation, sy, sx, stack_height * _CLIFF_STACK_PROFILE, _CLIFF_STACK_MASK,
+                   np.maximum)
             
             stacks_formed.append((sy, sx))
     
@@ -503,31 +669,29 @@ def create_delta_animated(grid_size: int, stage: float,
     - Bhattacharya (2006) Deltas in Sedimentary Geology
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     
     apex_y = int(h * 0.2)
     center_x = w // 2
     
-    # 배경: 바다/호수 (수심에 따른 경사)
-    for r in range(h):
-        base_depth = -5.0 - (r - apex_y) * 0.05  # 하류로 갈수록 깊어짐
-        elevation[r, :] = base_depth
+    cols = np.arange(w)
+    dx = (cols - center_x)[None, :]
+    
+    # 배경: 바다/호수 (수심에 따른 경사, 하류로 갈수록 깊어짐)
+    elevation = _delta_background(h, w, apex_y).copy()
     
     # === Bottomset beds (stage 0.0부터 시작) ===
     bottomset_reach = int((h - apex_y) * min(1.0, stage * 1.5))  # 가장 멀리까지
-    bottomset_zone = []
     
-    for r in range(apex_y + int(bottomset_reach * 0.7), min(h, apex_y + bottomset_reach)):
-        dist = r - apex_y
-        width = int(dist * 0.6 * stage)
-        for c in range(max(0, center_x - width), min(w, center_x + width)):
-            # 미립 퇴적물 - 얇은 층
-            bottomset_thickness = 0.5 * stage * (1 - abs(c - center_x) / max(width, 1))
-            elevation[r, c] += bottomset_thickness
-            bottomset_zone.append((r, c))
+    r0, r1 = apex_y + int(bottomset_reach * 0.7), min(h, apex_y + bottomset_reach)
+    dist = (np.arange(r0, r1) - apex_y)[:, None]
+    width = (dist * 0.6 * stage).astype(int)
+    # 미립 퇴적물 - 얇은 층 (행 구간 뷰에 제자리 누적)
+    bottomset_thickness = 0.5 * stage * (1 - np.abs(dx) / np.maximum(width, 1))
+    slab = elevation[r0:r1]
+    np.add(slab, bottomset_thickness, out=slab, where=(dx >= -width) & (dx < width))
     
     # === Foreset beds (stage 0.2부터) ===
-    foreset_zone = []
+    foreset_cells = 0
     if stage > 0.2:
         foreset_intensity = min(1.0, (stage - 0.2) / 0.4)
         foreset_angle = 25 + 10 * foreset_intensity  # 25-35° 경사
@@ -535,48 +699,40 @@ def create_delta_animated(grid_size: int, stage: float,
         foreset_start = int(apex_y + bottomset_reach * 0.3)
         foreset_end = int(apex_y + bottomset_reach * 0.7)
         
-        for r in range(foreset_start, foreset_end):
-            dist = r - apex_y
-            half_angle = np.radians(spread_angle / 2) * min(1.0, stage * 1.2)
-            
-            for c in range(w):
-                dx = c - center_x
-                angle = np.arctan2(dx, dist) if dist > 0 else 0
-                
-                if abs(angle) < half_angle:
-                    radial_dist = np.sqrt(dx**2 + dist**2)
-                    relative_pos = (r - foreset_start) / max(foreset_end - foreset_start, 1)
-                    
-                    # Foreset 경사면 (급경사)
-                    foreset_height = 8.0 * foreset_intensity * (1 - relative_pos) * (1 - abs(dx) / max(w // 3, 1))
-                    elevation[r, c] = max(elevation[r, c], foreset_height)
-                    foreset_zone.append((r, c))
+        rows = np.arange(foreset_start, foreset_end)
+        dist = (rows - apex_y)[:, None]
+        half_angle = np.radians(spread_angle / 2) * min(1.0, stage * 1.2)
+        angle = _apex_angle(h, w, apex_y, center_x)[foreset_start - apex_y:foreset_end - apex_y]
+        foreset = np.abs(angle) < half_angle
+        
+        relative_pos = (rows[:, None] - foreset_start) / max(foreset_end - foreset_start, 1)
+        
+        # Foreset 경사면 (급경사)
+        foreset_height = 8.0 * foreset_intensity * (1 - relative_pos) * (1 - np.abs(dx) / max(w // 3, 1))
+        slab = elevation[foreset_start:foreset_end]
+        np.maximum(slab, foreset_height, out=slab, where=foreset)
+        foreset_cells = int(foreset.sum())
     
     # === Topset beds (stage 0.4부터) ===
-    topset_zone = []
+    topset_cells = 0
     if stage > 0.4:
         topset_intensity = min(1.0, (stage - 0.4) / 0.4)
         
-        for r in range(apex_y, int(apex_y + bottomset_reach * 0.4)):
-            dist = r - apex_y
-            half_angle = np.radians(spread_angle / 2) * topset_intensity
-            
-            for c in range(w):
-                dx = c - center_x
-                angle = np.arctan2(dx, dist) if dist > 0 else 0
-                
-                if abs(angle) < half_angle or dist < 5:
-                    # Topset - 거의 수평, 두꺼운 퇴적
-                    topset_height = 10.0 * topset_intensity * (1 - dist / max(bottomset_reach * 0.4, 1))
-                    elevation[r, c] = max(elevation[r, c], topset_height)
-                    topset_zone.append((r, c))
+        rows = np.arange(apex_y, int(apex_y + bottomset_reach * 0.4))
+        dist = (rows - apex_y)[:, None]
+        half_angle = np.radians(spread_angle / 2) * topset_intensity
+        angle = _apex_angle(h, w, apex_y, center_x)[:rows.size]
+        topset = (np.abs(angle) < half_angle) | (dist < 5)
+        
+        # Topset - 거의 수평, 두꺼운 퇴적
+        topset_height = 10.0 * topset_intensity * (1 - dist / max(bottomset_reach * 0.4, 1))
+        slab = elevation[apex_y:apex_y + rows.size]
+        np.maximum(slab, topset_height, out=slab, where=topset)
+        topset_cells = int(topset.sum())
     
     # 상류 하천 (항상 존재)
-    for r in range(apex_y):
-        for dc in range(-3, 4):
-            c = center_x + dc
-            if 0 <= c < w:
-                elevation[r, c] = 8.0 - abs(dc) * 0.5
+    lo, hi = max(0, center_x - 3), min(w, center_x + 4)
+    elevation[:apex_y, lo:hi] = 8.0 - np.abs(cols[lo:hi] - center_x) * 0.5
                 
     # 분배 수로 (stage 0.5 이후)
     distributary_count = 0
@@ -585,17 +741,21 @@ def create_delta_animated(grid_size: int, stage: float,
         active_channels = int(num_channels * min(1.0, (stage - 0.5) / 0.5))
         distributary_count = active_channels
         
-        for i in range(active_channels):
-            channel_angle = -half_angle + (2 * half_angle) * (i / max(active_channels - 1, 1))
-            for r in range(apex_y, apex_y + int(bottomset_reach * 0.6)):
-                dist = r - apex_y
-                c = int(center_x + dist * np.tan(channel_angle))
-                if 0 <= c < w:
-                    for dc in range(-2, 3):
-                        if 0 <= c + dc < w:
-                            # 수로 파기
-                            channel_depth = 2.0 * (1 - abs(dc) / 3)
-                            elevation[r, c + dc] -= channel_depth
+        rows = np.arange(apex_y, apex_y + int(bottomset_reach * 0.6))
+        dist = rows - apex_y
+        # (수로, 폭 오프셋, 행) 인덱스를 한 번에 만들어 겹치는 셀까지 누적 차감
+        channel_angle = np.array([-half_angle + (2 * half_angle) * (i / max(active_channels - 1, 1))
+                                  for i in range(active_channels)])
+        cols_ch = (center_x + dist[None, :] * np.tan(channel_angle)[:, None]).astype(int)
+        on_grid = (cols_ch >= 0) & (cols_ch < w)
+        
+        # 수로 파기 (음각)
+        dc = np.arange(-2, 3)[None, :, None]
+        c = cols_ch[:, None, :] + dc
+        r = np.broadcast_to(rows, c.shape)
+        depth = np.broadcast_to((2.0 * (1 - np.abs(dc) / 3)).astype(_DTYPE), c.shape)
+        hit = on_grid[:, None, :] & (c >= 0) & (c < w)
+        np.subtract.at(elevation, (r[hit], c[hit]), depth[hit])
     
     if return_metadata:
         # 전진(progradation) 거리 계산
@@ -628,7 +788,7 @@ def create_delta_animated(grid_size: int, stage: float,
             'bed_structure': bed_structure,
             'progradation_distance': progradation_distance,
             'distributary_count': distributary_count,
-            'delta_area': len(topset_zone) + len(foreset_zone),  # 상대적 면적
+            'delta_area': topset_cells + foreset_cells,  # 상대적 면적
             'spread_angle': spread_angle * stage,
         }
                             
@@ -662,23 +822,15 @@ def create_alluvial_fan_animated(grid_size: int, stage: float,
     - 선단: 경사 <2°, 니(Silt) 퇴적, 망상/시상 수로
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     zone_mask = np.zeros((h, w), dtype=int)  # 0: 없음, 1: 선정, 2: 선앙, 3: 선단
     
     apex_y = int(h * 0.15)
     center_x = w // 2
     
-    # 배경 산지 (항상 존재)
-    for r in range(apex_y):
-        elevation[r, :] = max_height + (apex_y - r) * 2.0
-        
-    # 협곡
-    for r in range(apex_y + 5):
-        for dc in range(-3, 4):
-            c = center_x + dc
-            if 0 <= c < w:
-                elevation[r, c] -= 10.0 * (1 - abs(dc) / 4)
-                
+    # 배경 산지 + 협곡 (항상 존재)
+    elevation = _fan_background(h, w, apex_y, center_x, max_height).copy()
+    cols = np.arange(w)
+    
     # Stage에 따라 선상지 성장
     max_reach = int((h - apex_y) * stage)
     half_angle = np.radians(cone_angle / 2) * (0.5 + 0.5 * stage)
@@ -688,28 +840,24 @@ def create_alluvial_fan_animated(grid_size: int, stage: float,
     mid_end = apex_y + max(1, int(max_reach * 0.6))       # 선앙: 20~60%
     # 선단: 60~100%
     
-    for r in range(apex_y, min(apex_y + max_reach, h)):
-        dist = r - apex_y
-        
-        # 존 결정
-        if r < apex_end:
-            current_zone = 1  # 선정
-        elif r < mid_end:
-            current_zone = 2  # 선앙
-        else:
-            current_zone = 3  # 선단
-        
-        for c in range(w):
-            dx = c - center_x
-            if abs(np.arctan2(dx, max(dist, 1))) < half_angle:
-                radial = np.sqrt(dx**2 + dist**2)
-                z = max_height * (1 - radial / (max_reach * 1.5 + 0.001)) * stage
-                lateral_decay = 1 - abs(dx) / (w // 2)
-                new_elevation = max(0, z * lateral_decay)
-                
-                if new_elevation > 0:
-                    elevation[r, c] = new_elevation
-                    zone_mask[r, c] = current_zone
+    fan_end = min(apex_y + max_reach, h)
+    rows = np.arange(apex_y, fan_end)
+    dist = (rows - apex_y)[:, None]
+    dx = (cols - center_x)[None, :]
+    
+    # 존 결정 (선정 1 / 선앙 2 / 선단 3)
+    current_zone = np.where(rows < apex_end, 1, np.where(rows < mid_end, 2, 3))[:, None]
+    
+    # 정점 행은 한 행 아래의 각도를 사용 (max(dist, 1))
+    in_cone = np.abs(_apex_angle(h, w, apex_y, center_x)[np.maximum(rows - apex_y, 1)]) < half_angle
+    radial = _radial_distance(h, w, apex_y, center_x)[rows]
+    z = max_height * (1 - radial / (max_reach * 1.5 + 0.001)) * stage
+    lateral_decay = 1 - np.abs(dx) / (w // 2)
+    new_elevation = np.maximum(0, z * lateral_decay)
+    
+    fan = in_cone & (new_elevation > 0)
+    np.copyto(elevation[apex_y:fan_end], new_elevation, where=fan)
+    np.copyto(zone_mask[apex_y:fan_end], current_zone, where=fan)
     
     if return_metadata:
         return elevation, {
@@ -749,7 +897,7 @@ def create_meander_animated(grid_size: int, stage: float,
     Stage 0.8~1.0: 하중도(river island) 형성 + 구하도 안정화
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 10.0  # 범람원 기준면
     
     center_x = w // 2
@@ -764,70 +912,67 @@ def create_meander_animated(grid_size: int, stage: float,
     wl = h / num_bends  # 파장
     
     # 메인 하천 그리기
-    for r in range(h):
-        theta = 2 * np.pi * r / wl
-        meander_x = center_x + current_amp * np.sin(theta)
-        
-        # 공격사면 (attack slope) - 바깥쪽, 침식
-        # 활주사면 (slip-off slope) - 안쪽, 퇴적
-        dtheta = np.cos(theta)  # 곡률 방향
-        
-        for c in range(w):
-            dist = c - meander_x
-            
+    sin_theta, cos_theta = _meander_wave(h, wl)
+    meander_x = center_x + current_amp * sin_theta
+    
+    # 공격사면 (attack slope) - 바깥쪽, 침식
+    # 활주사면 (slip-off slope) - 안쪽, 퇴적
+    dtheta = cos_theta[:, None]  # 곡률 방향
+    
+    dist = _coord_grid(h, w)[1] - meander_x[:, None]
+    abs_dist = np.abs(dist)
+    
+    elevation[:, :] = np.select(
+        [
             # 하천 채널
-            if abs(dist) < channel_width:
-                # 수심 (중앙이 깊음)
-                depth_factor = 1 - (abs(dist) / channel_width)
-                elevation[r, c] = 5.0 - depth_factor * 3.0  # 2~5m
-                
+            abs_dist < channel_width,
             # 공격사면 (외측) - 절벽
-            elif dist * dtheta > 0 and abs(dist) < channel_width * 2:
-                # 외측은 침식으로 가파름
-                erosion_factor = (abs(dist) - channel_width) / channel_width
-                elevation[r, c] = 8.0 + erosion_factor * 3.0
-                
+            (dist * dtheta > 0) & (abs_dist < channel_width * 2),
             # 활주사면 (내측) - 포인트바
-            elif dist * dtheta < 0 and abs(dist) < channel_width * 3:
-                # 내측은 퇴적으로 완만
-                deposit_factor = (abs(dist) - channel_width) / (channel_width * 2)
-                elevation[r, c] = 6.0 + deposit_factor * 4.0
-                
+            (dist * dtheta < 0) & (abs_dist < channel_width * 3),
             # 자연제방 (levee)
-            elif abs(dist) < channel_width * 4:
-                levee_height = 11.0 - (abs(dist) - channel_width * 2) * 0.5
-                elevation[r, c] = max(levee_height, 10.0)
+            abs_dist < channel_width * 4,
+        ],
+        [
+            # 수심 (중앙이 깊음) 2~5m
+            5.0 - (1 - (abs_dist / channel_width)) * 3.0,
+            # 외측은 침식으로 가파름
+            8.0 + ((abs_dist - channel_width) / channel_width) * 3.0,
+            # 내측은 퇴적으로 완만
+            6.0 + ((abs_dist - channel_width) / (channel_width * 2)) * 4.0,
+            np.maximum(11.0 - (abs_dist - channel_width * 2) * 0.5, 10.0),
+        ],
+        default=elevation
+    )
     
     # 우각호 형성 (stage > 0.6)
     if stage > 0.6:
         oxbow_intensity = min((stage - 0.6) / 0.2, 1.0)
         
-        # 곡류 목 직선화 (cutoff)
+        # 곡류 목 직선화 (cutoff) - 직선 채널
         cutoff_y = int(h * 0.5)
         cutoff_width = int(wl * 0.3)
         
-        for r in range(cutoff_y - cutoff_width // 2, cutoff_y + cutoff_width // 2):
-            if 0 <= r < h:
-                # 직선 채널
-                for dc in range(-channel_width, channel_width + 1):
-                    c = center_x + dc
-                    if 0 <= c < w:
-                        new_elev = 4.0 * oxbow_intensity + elevation[r, c] * (1 - oxbow_intensity)
-                        elevation[r, c] = new_elev
+        r0, r1 = max(0, cutoff_y - cutoff_width // 2), cutoff_y + cutoff_width // 2
+        lo, hi = max(0, center_x - channel_width), min(w, center_x + channel_width + 1)
+        cutoff = elevation[r0:r1, lo:hi]
+        cutoff[:, :] = 4.0 * oxbow_intensity + cutoff * (1 - oxbow_intensity)
         
         # 구하도 (우각호) - 물이 고인 곳
-        for r in range(cutoff_y - int(wl * 0.4), cutoff_y + int(wl * 0.4)):
-            if 0 <= r < h:
-                theta = 2 * np.pi * r / wl
-                old_channel_x = center_x + current_amp * np.sin(theta)
-                
-                # 구하도가 메인 채널과 겹치지 않는 곳만
-                if abs(old_channel_x - center_x) > channel_width * 2:
-                    for dc in range(-channel_width, channel_width + 1):
-                        c = int(old_channel_x + dc)
-                        if 0 <= c < w:
-                            # 구하도는 물이 고여 낮음
-                            elevation[r, c] = 3.0 * oxbow_intensity + elevation[r, c] * (1 - oxbow_intensity)
+        old_rows = np.arange(max(0, cutoff_y - int(wl * 0.4)), min(h, cutoff_y + int(wl * 0.4)))
+        old_channel_x = center_x + current_amp * sin_theta[old_rows]
+        
+        # 구하도가 메인 채널과 겹치지 않는 곳만
+        apart = np.abs(old_channel_x - center_x) > channel_width * 2
+        old_rows, old_channel_x = old_rows[apart], old_channel_x[apart]
+        
+        # 열 오프셋마다 순서대로 적용 (가장자리에서 int 절사로 같은 셀이 겹치면 두 번 섞임)
+        for dc in range(-channel_width, channel_width + 1):
+            c = (old_channel_x + dc).astype(int)
+            ok = (c >= 0) & (c < w)
+            r, c = old_rows[ok], c[ok]
+            # 구하도는 물이 고여 낮음
+            elevation[r, c] = 3.0 * oxbow_intensity + elevation[r, c] * (1 - oxbow_intensity)
     
     # 하중도 형성 (stage > 0.8)
     if stage > 0.8:
@@ -837,12 +982,13 @@ def create_meander_animated(grid_size: int, stage: float,
         island_y = int(h * 0.75)
         island_size = max(3, channel_width // 2)
         
-        for dy in range(-island_size, island_size + 1):
-            for dx in range(-island_size, island_size + 1):
-                if dy**2 + dx**2 < island_size**2:
-                    r, c = island_y + dy, center_x + dx
-                    if 0 <= r < h and 0 <= c < w:
-                        elevation[r, c] = 7.0 * island_intensity + elevation[r, c] * (1 - island_intensity)
+        window = _stamp_window(h, w, island_y, center_x, island_size, island_size)
+        if window is not None:
+            rs, cs, kr, kc = window
+            dy, dx = np.ogrid[-island_size:island_size + 1, -island_size:island_size + 1]
+            island = (dy**2 + dx**2 < island_size**2)[kr, kc]
+            slab = elevation[rs, cs]
+            np.copyto(slab, 7.0 * island_intensity + slab * (1 - island_intensity), where=island)
                         
     return elevation
 
@@ -865,7 +1011,7 @@ def create_u_valley_animated(grid_size: int, stage: float,
     - U자형: 마찰 최소화 형태 + 동시 측면/바닥 침식
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     center = w // 2
     
     # === 빙하 전진/후퇴 계산 ===
@@ -903,72 +1049,58 @@ def create_u_valley_animated(grid_size: int, stage: float,
         phase = "post_glacial"
     
     # === 지형 생성 ===
-    for r in range(h):
-        # 상류로 갈수록 기반 높아짐 (경사)
-        base_height = (h - r) / h * 60.0
-        
-        # 이 행까지 빙하가 도달했는가?
-        was_glaciated = (r >= glacier_rear and r <= glacier_front) or phase == "post_glacial"
-        
-        # 빙하가 지나간 구간의 침식 정도
-        if was_glaciated or phase == "post_glacial":
-            local_erosion = erosion_progress
-        elif phase == "glacial_advance" and r < glacier_front:
-            # 아직 빙하가 안 도달한 하류
-            local_erosion = 0
-        else:
-            local_erosion = 0
-        
-        # U자 바닥 너비 (침식에 따라 넓어짐)
-        floor_width = int(w * valley_width * 0.08) + int(w * valley_width * 0.35 * local_erosion)
-        
-        for c in range(w):
-            dx = abs(c - center)
-            
-            if dx < floor_width:
-                # U자 바닥 (평탄) - 마식으로 연마됨
-                elev = 0
-            else:
-                # 측벽
-                wall_dist = (dx - floor_width) / max(1, w // 2 - floor_width)
-                wall_dist = min(1, wall_dist)
-                
-                # V자형 단면 (포물선 아님, 삼각형)
-                v_profile = valley_depth * wall_dist
-                
-                # U자형 단면 (측벽이 급해지고 바닥이 편평)
-                u_profile = valley_depth * (wall_dist ** 0.35)  # 급한 측벽
-                
-                # V→U 변환
-                elev = v_profile * (1 - local_erosion) + u_profile * local_erosion
-            
-            elevation[r, c] = base_height + elev
+    # 행마다 달라지는 값은 (h, 1), 열마다 달라지는 값은 (1, w)로 브로드캐스트
+    rows, cols = _coord_grid(h, w)
+    dx = np.abs(cols - center)
+    
+    # 상류로 갈수록 기반 높아짐 (경사)
+    base_height = _row_gradient(h, 60.0)
+    
+    # 이 행까지 빙하가 도달했는가?
+    was_glaciated = ((rows >= glacier_rear) & (rows <= glacier_front)) | (phase == "post_glacial")
+    
+    # 빙하가 지나간 구간만 침식 (아직 빙하가 안 도달한 하류는 0)
+    local_erosion = np.where(was_glaciated, erosion_progress, 0.0)
+    
+    # U자 바닥 너비 (침식에 따라 넓어짐)
+    floor_width = int(w * valley_width * 0.08) + (w * valley_width * 0.35 * local_erosion).astype(int)
+    
+    # 측벽
+    wall_dist = (dx - floor_width) / np.maximum(1, w // 2 - floor_width)
+    wall_dist = np.clip(wall_dist, 0, 1)
+    
+    # V자형 단면 (포물선 아님, 삼각형)
+    v_profile = valley_depth * wall_dist
+    
+    # U자형 단면 (측벽이 급해지고 바닥이 편평)
+    u_profile = valley_depth * (wall_dist ** 0.35)  # 급한 측벽
+    
+    # V→U 변환, U자 바닥 (평탄)은 마식으로 연마됨
+    elev = np.where(dx < floor_width, 0.0, v_profile * (1 - local_erosion) + u_profile * local_erosion)
+    np.add(base_height, elev, out=elevation)
     
     # === 빙하 시각화 ===
     if glacier_front > glacier_rear and phase not in ["pre_glacial", "post_glacial"]:
         glacier_thickness = 40.0 if phase == "glacial_max" else 30.0
         
-        for r in range(glacier_rear, glacier_front):
-            # 빙하 두께: 중앙 두껍고 위/아래로 갈수록 얇아짐
-            relative_pos = (r - glacier_rear) / max(1, glacier_front - glacier_rear)
-            
-            # 빙하 혀(tongue) 형태: 중앙 두껍고 앞/뒤 얇음
-            long_profile = 1.0 - abs(relative_pos - 0.5) * 0.6
-            
-            # 빙하 앞부분(snout) 경사
-            if r > glacier_front - int(h * 0.08):
-                snout_factor = (glacier_front - r) / (h * 0.08)
-                long_profile *= snout_factor
-            
-            for c in range(w):
-                dx = abs(c - center)
-                floor_w = int(w * valley_width * 0.3)
-                
-                if dx < floor_w + 12:
-                    # 빙하 표면 (볼록, 중앙 두꺼움)
-                    cross_profile = 1 - (dx / (floor_w + 12)) ** 2
-                    ice_surface = glacier_thickness * cross_profile * long_profile
-                    elevation[r, c] += ice_surface
+        ice_rows = rows[glacier_rear:glacier_front]
+        
+        # 빙하 두께: 중앙 두껍고 위/아래로 갈수록 얇아짐
+        relative_pos = (ice_rows - glacier_rear) / max(1, glacier_front - glacier_rear)
+        
+        # 빙하 혀(tongue) 형태: 중앙 두껍고 앞/뒤 얇음
+        long_profile = 1.0 - np.abs(relative_pos - 0.5) * 0.6
+        
+        # 빙하 앞부분(snout) 경사
+        snout = ice_rows > glacier_front - int(h * 0.08)
+        long_profile = np.where(snout, long_profile * ((glacier_front - ice_rows) / (h * 0.08)), long_profile)
+        
+        floor_w = int(w * valley_width * 0.3)
+        
+        # 빙하 표면 (볼록, 중앙 두꺼움)
+        cross_profile = 1 - (dx / (floor_w + 12)) ** 2
+        ice_surface = glacier_thickness * cross_profile * long_profile
+        elevation[glacier_rear:glacier_front] += np.where(dx < floor_w + 12, ice_surface, 0.0)
     
     # === 현수곡 (Hanging Valley) ===
     if stage > 0.65:
@@ -979,19 +1111,18 @@ def create_u_valley_animated(grid_size: int, stage: float,
             (int(h * 0.25), -1, 30 * hang_progress),  # 좌측 상류
             (int(h * 0.50), 1, 25 * hang_progress),   # 우측 중류
         ]
+        dy, dx = np.ogrid[-15:16, -12:13]
+        dist_sq = dy**2 + dx**2
+        hang = dist_sq < 14**2
+        hang_dist = np.sqrt(dist_sq[hang])
         
         for hy, side, height in hanging_valleys:
             hx = center + side * int(w * 0.42)
             
-            for dy in range(-15, 16):
-                for dx in range(-12, 13):
-                    r, c = hy + dy, hx + dx
-                    if 0 <= r < h and 0 <= c < w:
-                        dist = np.sqrt(dy**2 + dx**2)
-                        if dist < 14:
-                            # 현수곡 입구 (높게 매달림)
-                            notch = height * (1 - dist / 14) ** 0.7
-                            elevation[r, c] = max(elevation[r, c], height + notch)
+            # 현수곡 입구 (높게 매달림)
+            notch = np.zeros(hang.shape)
+            notch[hang] = height * (1 - hang_dist / 14) ** 0.7
+            _stamp(elevation, hy, hx, height + notch, hang, np.maximum)
     
     # === 종퇴석 (Terminal Moraine) ===
     if stage > 0.55:
@@ -999,15 +1130,15 @@ def create_u_valley_animated(grid_size: int, stage: float,
         moraine_row = int(h * 0.85)  # 빙하 최대 전진선
         moraine_height = 12 * moraine_progress
         
-        for c in range(w):
-            dx = abs(c - center)
-            floor_w = int(w * valley_width * 0.35)
-            if dx < floor_w + 25:
-                ridge = moraine_height * (1 - (dx / (floor_w + 25)) ** 2)
-                # 불규칙한 퇴적
-                ridge *= 0.7 + 0.3 * np.sin(c * 0.3)
-                elevation[moraine_row, c] += ridge
-                elevation[moraine_row + 1, c] += ridge * 0.6
+        cols = np.arange(w)
+        dx = np.abs(cols - center)
+        floor_w = int(w * valley_width * 0.35)
+        ridge = moraine_height * (1 - (dx / (floor_w + 25)) ** 2)
+        # 불규칙한 퇴적
+        ridge *= 0.7 + 0.3 * np.sin(cols * 0.3)
+        ridge = np.where(dx < floor_w + 25, ridge, 0.0)
+        elevation[moraine_row] += ridge
+        elevation[moraine_row + 1] += ridge * 0.6
     
     # === 빙하호 (Tarn/Lake) ===
     if stage > 0.85:
@@ -1016,15 +1147,13 @@ def create_u_valley_animated(grid_size: int, stage: float,
         lake_radius = int(w * 0.12 * lake_progress)
         lake_depth = 10 * lake_progress
         
-        for dy in range(-lake_radius - 3, lake_radius + 4):
-            for dx in range(-lake_radius - 3, lake_radius + 4):
-                r, c = lake_center_y + dy, center + dx
-                if 0 <= r < h and 0 <= c < w:
-                    dist = np.sqrt(dy**2 + dx**2)
-                    if dist < lake_radius:
-                        # 호수 바닥 (오목)
-                        depth = lake_depth * (1 - (dist / lake_radius) ** 2)
-                        elevation[r, c] = min(elevation[r, c], -depth)
+        # 호수 바닥 (오목)
+        dy, dx = np.ogrid[-lake_radius:lake_radius + 1, -lake_radius:lake_radius + 1]
+        dist_sq = dy**2 + dx**2
+        lake = dist_sq < lake_radius**2
+        depth = np.zeros(lake.shape)
+        depth[lake] = lake_depth * (1 - (np.sqrt(dist_sq[lake]) / lake_radius) ** 2)
+        _stamp(elevation, lake_center_y, center, -depth, lake, np.minimum)
     
     if return_metadata:
         return elevation, {
@@ -1054,11 +1183,17 @@ def _get_u_valley_stage_desc(stage: float) -> str:
         return "💧 빙하호+종퇴석: 과굴착 바닥에 물 고임"
 
 
+# 시스택 스탬프 (7x7, 중심 기준): 반경 3 안쪽만 솟아오르고 중심에서 멀수록 낮아짐
+_SEA_STACK_DIST = np.hypot(*np.ogrid[-3:4, -3:4])
+_SEA_STACK_MASK = _SEA_STACK_DIST < 3
+_SEA_STACK_PROFILE = 1 - _SEA_STACK_DIST / 4
+
+
 def create_coastal_cliff_animated(grid_size: int, stage: float,
                                    cliff_height: float = 30.0, num_stacks: int = 2) -> np.ndarray:
     """해안 절벽 후퇴 과정"""
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # Stage에 따른 해안선 후퇴
     initial_sea_line = int(h * 0.8)
@@ -1068,21 +1203,18 @@ def create_coastal_cliff_animated(grid_size: int, stage: float,
     # 바다
     elevation[sea_line:, :] = -5.0
     
-    # 육지 + 절벽
-    for r in range(sea_line):
-        cliff_dist = sea_line - r
-        if cliff_dist < 5:
-            elevation[r, :] = cliff_height * (cliff_dist / 5)
-        else:
-            elevation[r, :] = cliff_height
+    # 육지 + 절벽 (해안선 5칸 이내는 절벽 경사)
+    cliff_dist = sea_line - np.arange(sea_line)
+    land = np.where(cliff_dist < 5, cliff_height * (cliff_dist / 5), cliff_height)
+    elevation[:sea_line, :] = land[:, None]
             
     # 파식대 (stage > 0.3)
     if stage > 0.3:
         platform_width = int(10 * (stage - 0.3) / 0.7)
-        for r in range(sea_line, min(h, sea_line + platform_width)):
-            elevation[r, :] = -2.0 + (r - sea_line) * 0.2
+        platform_rows = np.arange(sea_line, min(h, sea_line + platform_width))
+        elevation[platform_rows, :] = (-2.0 + (platform_rows - sea_line) * 0.2)[:, None]
             
-    # 시스택 (stage > 0.6)
+    # 시스택 (stage > 0.6) - 7x7 스탬프를 격자 안에 잘리는 만큼만 덮어씀
     if stage > 0.6:
         stack_stage = (stage - 0.6) / 0.4
         for i in range(num_stacks):
@@ -1090,13 +1222,7 @@ def create_coastal_cliff_animated(grid_size: int, stage: float,
             sy = sea_line + 5 + i * 3
             stack_height = cliff_height * 0.7 * stack_stage
             
-            for dr in range(-3, 4):
-                for dc in range(-3, 4):
-                    r, c = sy + dr, sx + dc
-                    if 0 <= r < h and 0 <= c < w:
-                        dist = np.sqrt(dr**2 + dc**2)
-                        if dist < 3:
-                            elevation[r, c] = stack_height * (1 - dist / 4)
+            _stamp(elevation, sy, sx, stack_height * _SEA_STACK_PROFILE, _SEA_STACK_MASK)
                             
     return elevation
 
@@ -1138,7 +1264,7 @@ def create_v_valley_animated(grid_size: int, stage: float,
     - Charlton (2008) Fundamentals of Fluvial Geomorphology
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     center = w // 2
     
     # 단계별 침식 깊이 계산 (비선형적 - 초기에 빠르고 후기에 느림)
@@ -1156,55 +1282,46 @@ def create_v_valley_animated(grid_size: int, stage: float,
     # V자 형태 계산
     slope_rad = np.radians(slope_angle)
     
-    for r in range(h):
-        # 상류-하류 경사 (종단면 경사)
-        upstream_gradient = (h - r) / h * 30.0
-        
-        for c in range(w):
-            dx = abs(c - center)
-            
-            # 초기 고원 상태
-            base_height = 50.0
-            
-            # V자 형태 (경사각에 따른 사면 높이)
-            if dx > 0:
-                v_shape = dx * np.tan(slope_rad) * (current_depth / valley_depth)
-            else:
-                v_shape = 0
-            
-            # 최종 고도
-            elevation[r, c] = base_height - current_depth + min(v_shape, current_depth) + upstream_gradient
+    # 상류-하류 경사 (종단면 경사) - 행마다 하나
+    rows, _ = _coord_grid(h, w)
+    upstream_gradient = _row_gradient(h, 30.0)
+    
+    # 초기 고원 상태
+    base_height = 50.0
+    
+    # V자 형태 (경사각에 따른 사면 높이) - 모든 행에서 같은 횡단면
+    dx = np.abs(np.arange(w) - center)
+    v_shape = dx * np.tan(slope_rad) * (current_depth / valley_depth)
+    
+    # 최종 고도 (횡단면 한 줄 + 종단 경사 열벡터를 한 번의 브로드캐스트로 기록)
+    cross_section = base_height - current_depth + np.minimum(v_shape, current_depth)
+    np.add(cross_section[None, :], upstream_gradient, out=elevation)
             
     # Interlocking spurs (맞물림 돌출부) - stage 0.3 이후
     if stage > 0.3:
         spur_intensity = min(1.0, (stage - 0.3) / 0.4)
         num_spurs = 3
-        for i in range(num_spurs):
-            spur_y = int(h * (0.3 + i * 0.25))
-            spur_side = (-1) ** i  # 교대로 좌우 배치
-            
-            for dy in range(-5, 6):
-                r = spur_y + dy
-                if 0 <= r < h:
-                    spur_width = max(0, 5 - abs(dy))
-                    for dc in range(spur_width):
-                        c = center + spur_side * (w // 4 - dc * 2)
-                        if 0 <= c < w:
-                            elevation[r, c] += 8 * spur_intensity * (1 - abs(dy) / 5)
+        # (돌출부, 행 오프셋, 열 오프셋) 셀을 한 번에 만들어 누적 (작은 격자에서는 돌출부 행이 겹침)
+        spur = np.arange(num_spurs)[:, None, None]
+        dy = np.arange(-5, 6)[None, :, None]
+        dc = np.arange(5)[None, None, :]
+        spur_y = (h * (0.3 + spur * 0.25)).astype(int)
+        spur_side = np.where(spur % 2 == 0, 1, -1)  # 교대로 좌우 배치
+        r, c = np.broadcast_arrays(spur_y + dy, center + spur_side * (w // 4 - dc * 2))
+        bump = np.broadcast_to((8 * spur_intensity * (1 - np.abs(dy) / 5)).astype(_DTYPE), r.shape)
+        hit = (dc < 5 - np.abs(dy)) & (r >= 0) & (r < h) & (c >= 0) & (c < w)
+        np.add.at(elevation, (r[hit], c[hit]), bump[hit])
     
     # 하천 수로 (단계적으로 형성)
     if stage > 0.2:
         channel_intensity = min(1.0, (stage - 0.2) / 0.8)
         channel_width = 2 + int(stage * 2)  # 하류로 갈수록 넓어짐
         
-        for r in range(h):
-            # 하류로 갈수록 하폭 증가
-            local_width = channel_width + r // 20
-            for dc in range(-local_width, local_width + 1):
-                c = center + dc
-                if 0 <= c < w:
-                    channel_depth = 5 * channel_intensity * (1 - abs(dc) / (local_width + 1))
-                    elevation[r, c] -= channel_depth
+        # 하류로 갈수록 하폭 증가
+        local_width = channel_width + rows // 20
+        dc = np.abs(np.arange(w) - center)[None, :]
+        channel_depth = 5 * channel_intensity * (1 - dc / (local_width + 1))
+        elevation -= np.where(dc <= local_width, channel_depth, 0.0)
     
     if return_metadata:
         # 침식 프로세스 정보
@@ -1274,12 +1391,12 @@ def create_barchan_animated(grid_size: int, stage: float,
     - 가장자리 모래가 더 빨리 이동 → 뿔이 바람 하류로 뻗음
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 사막 기반면: 0으로 설정 (사구 상대 높이가 잘 보이도록)
     elevation[:, :] = 0.0
     
-    np.random.seed(42)
+    rows, cols = _coord_grid(h, w)
     
     for i in range(num_dunes):
         # 사구 위치 (고정)
@@ -1333,55 +1450,64 @@ def create_barchan_animated(grid_size: int, stage: float,
         inner_ratio = 0.5 + 0.2 * asymmetry
         inner_offset = current_radius * 0.4 * asymmetry  # X방향 오프셋 (바람 하류)
         
-        for r in range(h):
-            for c in range(w):
-                dy = r - cy  # Y축
-                dx = c - cx  # X축 (바람 방향)
+        # 사구 몸체는 바깥 원(dist < 반경) 안에만 생기므로 경계 상자에서만 계산
+        window = _stamp_window(h, w, cy, cx, current_radius, current_radius)
+        if window is None:
+            continue
+        rs, cs = window[:2]
+        dy = rows[rs] - cy  # Y축
+        dx = cols[:, cs] - cx  # X축 (바람 방향)
+        
+        dist = _radial_distance(h, w, cy, cx)[rs, cs]
+        
+        # 바깥 원 영역
+        outer = dist < current_radius
+        
+        # 안쪽 원 (오목면) - 바람 하류(오른쪽)에 위치, 오목면 안쪽은 낮게 (뿔도 그리지 않음)
+        concave = np.zeros((h, w), dtype=bool)
+        if asymmetry > 0.5:
+            dist_inner = np.hypot(dx - inner_offset, dy)
+            inner_r = current_radius * inner_ratio
+            concave[rs, cs] = outer & (dist_inner < inner_r)
+        
+        # 높이 계산
+        radial_factor = 1 - (dist / current_radius) ** 1.5
+        
+        # 바람받이(왼쪽, ~15°, 완만) vs 바람그늘(오른쪽, 30-35° 안식각, 급경사)
+        slope_factor = np.where(dx < 0, 0.5 + 0.3 * (1 - asymmetry), 0.9 + 0.3 * asymmetry)
+        
+        z = current_height * radial_factor * slope_factor
+        body = outer & ~concave[rs, cs] & (z > 0.3)
+        slab = elevation[rs, cs]
+        np.maximum(slab, z, out=slab, where=body)
+        
+        # 뿔 (horns) - stage 0.5 이후, 바람 하류(오른쪽)로 뻗음
+        if horn_length > 2:
+            for side in [-1, 1]:
+                horn_cy = cy + side * int(current_radius * 0.7)
+                horn_cx = cx + inner_offset
                 
-                dist = np.sqrt(dx**2 + dy**2)
+                dx_h = cols[0] - horn_cx
+                dy_h = rows[:, 0] - horn_cy
                 
-                # 바깥 원 영역
-                if dist < current_radius:
-                    # 안쪽 원 (오목면) - 바람 하류(오른쪽)에 위치
-                    dist_inner = np.sqrt((dx - inner_offset)**2 + dy**2)
-                    inner_r = current_radius * inner_ratio
-                    
-                    if asymmetry > 0.5 and dist_inner < inner_r:
-                        # 오목면 안쪽은 낮게
-                        continue
-                    
-                    # 높이 계산
-                    radial_factor = 1 - (dist / current_radius) ** 1.5
-                    
-                    # 바람받이(왼쪽, ~15°) vs 바람그늘(오른쪽, 30-35° 안식각)
-                    if dx < 0:
-                        # 바람받이: 완만 (~15° 경사)
-                        slope_factor = 0.5 + 0.3 * (1 - asymmetry)
-                    else:
-                        # 바람그늘: 급경사 (30-35° 안식각)
-                        slope_factor = 0.9 + 0.3 * asymmetry
-                    
-                    z = current_height * radial_factor * slope_factor
-                    if z > 0.3:
-                        elevation[r, c] = max(elevation[r, c], z)
+                # 뿔 영역: 바람 방향(X방향)으로 길쭉
+                horn_width = max(2, current_radius * 0.22)
+                along = (dx_h > 0) & (dx_h < horn_length)
+                across = np.abs(dy_h) < horn_width
+                if not along.any() or not across.any():
+                    continue
                 
-                # 뿔 (horns) - stage 0.5 이후, 바람 하류(오른쪽)로 뻗음
-                if horn_length > 2:
-                    for side in [-1, 1]:
-                        horn_cy = cy + side * int(current_radius * 0.7)
-                        horn_cx = cx + inner_offset
-                        
-                        dx_h = c - horn_cx
-                        dy_h = r - horn_cy
-                        
-                        # 뿔 영역: 바람 방향(X방향)으로 길쭉
-                        horn_width = max(2, current_radius * 0.22)
-                        if abs(dy_h) < horn_width and 0 < dx_h < horn_length:
-                            horn_factor = (1 - dx_h / horn_length) ** 0.7
-                            width_factor = 1 - (abs(dy_h) / horn_width) ** 2
-                            z = current_height * 0.4 * horn_factor * width_factor
-                            if z > 0.2:
-                                elevation[r, c] = max(elevation[r, c], z)
+                # 뿔이 걸치는 행/열 구간만 계산
+                hr = np.flatnonzero(across)
+                hc = np.flatnonzero(along)
+                hr, hc = slice(hr[0], hr[-1] + 1), slice(hc[0], hc[-1] + 1)
+                horn_factor = (1 - dx_h[hc] / horn_length) ** 0.7
+                width_factor = 1 - (np.abs(dy_h[hr]) / horn_width) ** 2
+                
+                z = (current_height * 0.4 * horn_factor)[None, :] * width_factor[:, None]
+                horn = ~concave[hr, hc] & (z > 0.2)
+                slab = elevation[hr, hc]
+                np.maximum(slab, z, out=slab, where=horn)
     
     if return_metadata:
         # 학술 자료 기반 메타데이터
@@ -1427,6 +1553,39 @@ def _get_barchan_stage_desc(stage: float) -> str:
 # 확장 지형 (Extended Landforms)
 # ============================================
 
+@jit(nopython=True, cache=True)
+def _incised_meander_kernel(elevation, meander_x, channel_width,
+                            base_level, plateau_height, current_depth,
+                            terrace_x, terrace_start, terrace_end, terrace_height):
+    """
+    감입 곡류 하도 + V자 측벽 파기 후 하안단구 띠 깎기 (셀마다 한 번에)
+    """
+    h, w = elevation.shape
+    n_terraces = terrace_height.shape[0]
+    
+    # 하도 바닥 (침식기준면까지)
+    river_bottom = plateau_height - current_depth
+    
+    for r in range(h):
+        mx = meander_x[r]
+        for c in range(w):
+            dist = abs(c - mx)
+            
+            if dist < channel_width:
+                # 하도 (가장 깊음)
+                elevation[r, c] = max(base_level, river_bottom)
+            elif dist < channel_width * 3:
+                # 협곡 측벽 (V자형)
+                t = (dist - channel_width) / (channel_width * 2)
+                elevation[r, c] = river_bottom + current_depth * t
+            
+            # 하안단구: 단구 순서대로 곡류대 양쪽 띠를 단구면 높이로 깎기
+            for i in range(n_terraces):
+                td = abs(c - terrace_x[i, r])
+                if terrace_start[i] < td < terrace_end[i] and elevation[r, c] > terrace_height[i]:
+                    elevation[r, c] = terrace_height[i]
+
+
 def create_incised_meander(grid_size: int = 100, stage: float = 1.0,
                            valley_depth: float = 80.0, num_terraces: int = 3,
                            return_metadata: bool = False) -> np.ndarray:
@@ -1440,7 +1599,7 @@ def create_incised_meander(grid_size: int = 100, stage: float = 1.0,
     융기 환경에서 곡류가 암반을 파고 들어가면서 형성
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center_x = w // 2
     wl = h / 3  # 3개 굽이
@@ -1464,44 +1623,24 @@ def create_incised_meander(grid_size: int = 100, stage: float = 1.0,
     # 현재 침식 깊이 (stage에 따라 증가)
     current_depth = (plateau_height - base_level) * min(1.0, (stage - 0.2) / 0.8) if stage > 0.2 else 0
     
-    # 감입 곡류 파기
-    for r in range(h):
-        theta = 2 * np.pi * r / wl
-        meander_x = center_x + amplitude * np.sin(theta)
-        
-        for c in range(w):
-            dist = abs(c - meander_x)
-            
-            # 하도 바닥 (침식기준면까지)
-            river_bottom = plateau_height - current_depth
-            
-            if dist < channel_width:
-                # 하도 (가장 깊음)
-                elevation[r, c] = max(base_level, river_bottom)
-            elif dist < channel_width * 3:
-                # 협곡 측벽 (V자형)
-                t = (dist - channel_width) / (channel_width * 2)
-                elevation[r, c] = river_bottom + current_depth * t
-    
     # 하안단구 (stage > 0.5에서 형성)
     if stage > 0.5:
         terrace_progress = (stage - 0.5) / 0.5
         num_visible_terraces = int(num_terraces * terrace_progress) + 1
-        
-        for t_idx in range(min(num_visible_terraces, num_terraces)):
-            terrace_height = plateau_height - current_depth * (0.3 + 0.25 * t_idx)
-            terrace_width_start = channel_width * (3 + t_idx)
-            terrace_width_end = channel_width * (4 + t_idx)
-            
-            for r in range(h):
-                theta = 2 * np.pi * r / wl
-                meander_x = center_x + amplitude * np.sin(theta) * (0.9 - 0.1 * t_idx)
-                
-                for c in range(w):
-                    dist = abs(c - meander_x)
-                    if terrace_width_start < dist < terrace_width_end:
-                        if elevation[r, c] > terrace_height:
-                            elevation[r, c] = terrace_height
+        t_idx = np.arange(min(num_visible_terraces, num_terraces))
+    else:
+        t_idx = np.arange(0)
+    terrace_height = plateau_height - current_depth * (0.3 + 0.25 * t_idx)
+    terrace_start = (channel_width * (3 + t_idx)).astype(np.float64)
+    terrace_end = (channel_width * (4 + t_idx)).astype(np.float64)
+    
+    # 감입 곡류 파기 + 단구 (한 번의 격자 순회)
+    sin_theta = _meander_wave(h, wl)[0]
+    meander_x = center_x + amplitude * sin_theta
+    terrace_x = center_x + amplitude * sin_theta[None, :] * (0.9 - 0.1 * t_idx)[:, None]
+    _incised_meander_kernel(elevation, meander_x, channel_width,
+                            base_level, plateau_height, float(current_depth),
+                            terrace_x, terrace_start, terrace_end, terrace_height.astype(np.float64))
     
     if return_metadata:
         return elevation, {
@@ -1542,7 +1681,7 @@ def create_free_meander(grid_size: int = 100, stage: float = 1.0,
     - 활주사면(Point Bar): 퇴적
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 범람원 기반
     base_height = 10.0
@@ -1565,41 +1704,46 @@ def create_free_meander(grid_size: int = 100, stage: float = 1.0,
     cutbank_positions = []
     pointbar_positions = []
     
-    for r in range(h):
-        theta = 2 * np.pi * r / wl
-        meander_x = center_x + amplitude * np.sin(theta)
-        
-        # 곡률 방향 (공격사면 결정용)
-        curvature = np.cos(theta)  # +: 오른쪽 공격사면, -: 왼쪽 공격사면
+    rows = np.arange(h)
+    sin_theta, cos_theta = _meander_wave(h, wl)
+    meander_x = center_x + amplitude * sin_theta
+    
+    # 곡률 방향 (공격사면 결정용)
+    curvature = cos_theta[:, None]  # +: 오른쪽 공격사면, -: 왼쪽 공격사면
+    
+    dist = _coord_grid(h, w)[1] - meander_x[:, None]
+    abs_dist = np.abs(dist)
+    channel = abs_dist < channel_width
+    
+    # 하도 (비대칭 단면 - stage 후반에)
+    if stage > 0.3:
+        # 공격사면 쪽은 더 깊음
+        cutbank = ((curvature > 0) & (dist > 0)) | ((curvature < 0) & (dist < 0))
+        depth_factor = np.where(cutbank, 1.2, 0.7)  # 공격사면 / 활주사면
         
-        for c in range(w):
-            dist = c - meander_x
-            abs_dist = abs(dist)
-            
-            if abs_dist < channel_width:
-                # 하도 (비대칭 단면 - stage 후반에)
-                if stage > 0.3:
-                    # 공격사면 쪽은 더 깊음
-                    if (curvature > 0 and dist > 0) or (curvature < 0 and dist < 0):
-                        depth_factor = 1.2  # 공격사면
-                        if r % 20 == 0:
-                            cutbank_positions.append((r, c))
-                    else:
-                        depth_factor = 0.7  # 활주사면
-                        if r % 20 == 0:
-                            pointbar_positions.append((r, c))
-                else:
-                    depth_factor = 1.0
-                elevation[r, c] = 5.0 - (channel_width - abs_dist) * 0.2 * depth_factor
-                
-            elif abs_dist < channel_width * 2 and stage > 0.5:
-                # 자연제방 (Levee) - stage 후반에 발달
-                levee_height = base_height + 1.5 * ((stage - 0.5) / 0.5)
-                elevation[r, c] = levee_height
-                
-            elif abs_dist < channel_width * 5 and stage > 0.7:
-                # 배후습지 (Backswamp) - 자연제방보다 낮음
-                elevation[r, c] = base_height - 0.5
+        sampled = channel & (rows % 20 == 0)[:, None]
+        cutbank_positions = list(zip(*(idx.tolist() for idx in np.nonzero(sampled & cutbank))))
+        pointbar_positions = list(zip(*(idx.tolist() for idx in np.nonzero(sampled & ~cutbank))))
+    else:
+        depth_factor = 1.0
+    
+    channel_elev = 5.0 - (channel_width - abs_dist) * 0.2 * depth_factor
+    
+    elevation[:, :] = np.select(
+        [
+            channel,
+            # 자연제방 (Levee) - stage 후반에 발달
+            (abs_dist < channel_width * 2) & (stage > 0.5),
+            # 배후습지 (Backswamp) - 자연제방보다 낮음
+            (abs_dist < channel_width * 5) & (stage > 0.7),
+        ],
+        [
+            channel_elev,
+            base_height + 1.5 * ((stage - 0.5) / 0.5),
+            base_height - 0.5,
+        ],
+        default=elevation
+    )
     
     # 우각호 (Oxbow Lake) - Stage 0.7 이후
     oxbow_formed = False
@@ -1608,18 +1752,17 @@ def create_free_meander(grid_size: int = 100, stage: float = 1.0,
         oxbow_y = h // 2
         oxbow_amplitude = amplitude * 1.4
         
-        for dy in range(-int(wl/4), int(wl/4)):
-            r = oxbow_y + dy
-            if 0 <= r < h:
-                theta = 2 * np.pi * dy / (wl/2)
-                ox_x = center_x + oxbow_amplitude * np.sin(theta)
-                
-                for dc in range(-channel_width-2, channel_width + 3):
-                    c = int(ox_x + dc)
-                    if 0 <= c < w:
-                        # 우각호 (고립된 호수)
-                        elevation[r, c] = 4.0
-                        oxbow_formed = True
+        dy = np.arange(-int(wl/4), int(wl/4))
+        theta = 2 * np.pi * dy / (wl/2)
+        ox_x = center_x + oxbow_amplitude * np.sin(theta)
+        
+        r = np.broadcast_to((oxbow_y + dy)[:, None], (dy.size, 2 * channel_width + 5))
+        c = (ox_x[:, None] + np.arange(-channel_width-2, channel_width + 3)[None, :]).astype(int)
+        valid = (r >= 0) & (r < h) & (c >= 0) & (c < w)
+        
+        # 우각호 (고립된 호수)
+        elevation[r[valid], c[valid]] = 4.0
+        oxbow_formed = bool(valid.any())
     
     if return_metadata:
         return elevation, {
@@ -1648,6 +1791,51 @@ def _get_meander_stage_desc(stage: float) -> str:
         return "🏞️ 성숙 곡류: 자연제방 + 배후습지 + 우각호 완성"
 
 
+@jit(nopython=True, cache=True)
+def _bird_foot_finger_kernel(elevation, rs, cs, levee, stage):
+    """
+    분배수로 중심선(rs, cs)을 따라 수로 + 자연제방 스탬프 쌓기
+    
+    levee[k]: 폭 방향 오프셋 dc = k - finger_width 위치의 자연제방 상대 높이
+    
+    Returns:
+        격자 안에 그려진 마지막 거리 (finger 길이)
+    """
+    h, w = elevation.shape
+    max_length = rs.size
+    finger_width = (levee.size - 1) // 2
+    finger_length = 0
+    
+    for d in range(max_length):
+        r = rs[d]
+        c = cs[d]
+        
+        if 0 <= r < h and 0 <= c < w:
+            finger_length = d
+            
+            # 분배수로 + 자연제방
+            for k in range(levee.size):
+                dc = k - finger_width
+                nc = c + dc
+                if nc < 0 or nc >= w:
+                    continue
+                
+                # 중앙: 수로 (낮음), 양쪽: 자연제방 (높음)
+                if abs(dc) < 2:
+                    # 수로
+                    z = 2.0 * (1 - d / max_length) * stage
+                else:
+                    # 자연제방
+                    z = 6.0 * (1 - d / max_length) * levee[k] * stage
+                
+                for dr in range(-2, 3):
+                    nr = r + dr
+                    if 0 <= nr < h and z > elevation[nr, nc]:
+                        elevation[nr, nc] = z
+    
+    return finger_length
+
+
 def create_bird_foot_delta(grid_size: int = 100, stage: float = 1.0,
                            return_metadata: bool = False) -> np.ndarray:
     """조족상 삼각주 (Bird-foot Delta) - 미시시피강형
@@ -1672,7 +1860,7 @@ def create_bird_foot_delta(grid_size: int = 100, stage: float = 1.0,
     대표 사례: 미시시피강 삼각주
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = -5.0  # 바다
     
     apex_y = int(h * 0.12)
@@ -1691,6 +1879,11 @@ def create_bird_foot_delta(grid_size: int = 100, stage: float = 1.0,
     
     distributary_info = []
     
+    # 폭 방향 자연제방 프로파일 (모든 finger 공통)
+    dc = np.arange(-finger_width, finger_width + 1)
+    levee = 1 - (np.abs(dc) - 2) / finger_width
+    d = np.arange(max_length)
+    
     for i in range(num_fingers):
         # 각도 분포 (중앙에서 양쪽으로)
         if num_fingers == 1:
@@ -1698,31 +1891,10 @@ def create_bird_foot_delta(grid_size: int = 100, stage: float = 1.0,
         else:
             angle = np.radians(-35 + 70 * i / (num_fingers - 1))
         
-        finger_length = 0
-        
-        for d in range(max_length):
-            r = apex_y + int(d * np.cos(angle))
-            c = center_x + int(d * np.sin(angle))
-            
-            if 0 <= r < h and 0 <= c < w:
-                finger_length = d
-                
-                # 분배수로 + 자연제방
-                for dc in range(-finger_width, finger_width + 1):
-                    for dr in range(-2, 3):
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < h and 0 <= nc < w:
-                            dist = np.sqrt(dr**2 + dc**2)
-                            
-                            # 중앙: 수로 (낮음), 양쪽: 자연제방 (높음)
-                            if abs(dc) < 2:
-                                # 수로
-                                z = 2.0 * (1 - d / max_length) * stage
-                            else:
-                                # 자연제방
-                                z = 6.0 * (1 - d / max_length) * (1 - (abs(dc) - 2) / finger_width) * stage
-                            
-                            elevation[nr, nc] = max(elevation[nr, nc], z)
+        # 중심선 픽셀 (거리 d마다 한 칸씩, 정수 절단)
+        rs = apex_y + (d * np.cos(angle)).astype(np.int64)
+        cs = center_x + (d * np.sin(angle)).astype(np.int64)
+        finger_length = _bird_foot_finger_kernel(elevation, rs, cs, levee, float(stage))
         
         distributary_info.append({
             'angle_deg': np.degrees(angle),
@@ -1730,11 +1902,9 @@ def create_bird_foot_delta(grid_size: int = 100, stage: float = 1.0,
         })
     
     # 상류 하천
-    for r in range(apex_y):
-        for dc in range(-4, 5):
-            if 0 <= center_x + dc < w:
-                channel_depth = 3.0 * (1 - abs(dc) / 5)
-                elevation[r, center_x + dc] = 5.0 + channel_depth
+    lo, hi = max(0, center_x - 4), min(w, center_x + 5)
+    channel_depth = 3.0 * (1 - np.abs(np.arange(lo, hi) - center_x) / 5)
+    elevation[:apex_y, lo:hi] = 5.0 + channel_depth
     
     if return_metadata:
         return elevation, {
@@ -1777,7 +1947,7 @@ def create_arcuate_delta(grid_size: int = 100, stage: float = 1.0,
     Reference: Galloway (1975) Delta Classification
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = -5.0
     
     apex_y = int(h * 0.2)
@@ -1787,25 +1957,21 @@ def create_arcuate_delta(grid_size: int = 100, stage: float = 1.0,
     max_reach = int((h - apex_y) * stage)
     arc_area = 0
     
-    for r in range(apex_y, apex_y + max_reach):
-        dist = r - apex_y
-        arc_width = int(dist * 0.8)
-        
-        for c in range(max(0, center_x - arc_width), min(w, center_x + arc_width)):
-            dx = abs(c - center_x)
-            radial = np.sqrt(dx**2 + dist**2)
-            
-            edge_dist = arc_width - dx
-            if edge_dist > 0:
-                z = 10.0 * (1 - radial / (max_reach * 1.2)) * min(1, edge_dist / 10)
-                elevation[r, c] = max(elevation[r, c], z * stage)
-                arc_area += 1
-                
+    dist = np.arange(max_reach)[:, None]
+    arc_width = (dist * 0.8).astype(int)
+    dx = np.abs(np.arange(w) - center_x)[None, :]
+    radial = np.hypot(dx, dist)
+    
+    edge_dist = arc_width - dx
+    arc = edge_dist > 0
+    if max_reach > 0:
+        z = 10.0 * (1 - radial / (max_reach * 1.2)) * np.minimum(1, edge_dist / 10)
+        slab = elevation[apex_y:apex_y + max_reach]
+        np.maximum(slab, z * stage, out=slab, where=arc)
+        arc_area = int(arc.sum())
+    
     # 하천
-    for r in range(apex_y):
-        for dc in range(-4, 5):
-            if 0 <= center_x + dc < w:
-                elevation[r, center_x + dc] = 6.0
+    elevation[:apex_y, max(0, center_x - 4):min(w, center_x + 5)] = 6.0
     
     if return_metadata:
         return elevation, {
@@ -1856,7 +2022,7 @@ def create_cuspate_delta(grid_size: int = 100, stage: float = 1.0,
     Reference: Galloway (1975), Wright & Coleman (1973)
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = -5.0
     
     apex_y = int(h * 0.2)
@@ -1864,24 +2030,20 @@ def create_cuspate_delta(grid_size: int = 100, stage: float = 1.0,
     point_y = int(apex_y + (h - apex_y) * 0.8 * stage)
     
     # 뾰족한 삼각형 형태
-    cusp_area = 0
-    for r in range(apex_y, point_y):
-        dist = r - apex_y
-        total_dist = point_y - apex_y
-        
-        width = int((w // 3) * (1 - dist / max(total_dist, 1)))
-        
-        for c in range(max(0, center_x - width), min(w, center_x + width)):
-            dx = abs(c - center_x)
-            z = 10.0 * (1 - dist / max(total_dist, 1)) * (1 - dx / max(width, 1))
-            elevation[r, c] = max(elevation[r, c], z * stage)
-            cusp_area += 1
-            
+    total_dist = point_y - apex_y
+    dist = np.arange(max(total_dist, 0))[:, None]
+    along = 1 - dist / max(total_dist, 1)
+    width = ((w // 3) * along).astype(int)
+    dc = (np.arange(w) - center_x)[None, :]
+    
+    cusp = (dc >= -width) & (dc < width)
+    z = 10.0 * along * (1 - np.abs(dc) / np.maximum(width, 1))
+    slab = elevation[apex_y:point_y]
+    np.maximum(slab, z * stage, out=slab, where=cusp)
+    cusp_area = int(cusp.sum())
+    
     # 하천
-    for r in range(apex_y):
-        for dc in range(-3, 4):
-            if 0 <= center_x + dc < w:
-                elevation[r, center_x + dc] = 6.0
+    elevation[:apex_y, max(0, center_x - 3):min(w, center_x + 4)] = 6.0
     
     if return_metadata:
         cusp_length = (point_y - apex_y) * 10  # 미터 단위
@@ -1936,7 +2098,7 @@ def create_cirque(grid_size: int = 100, stage: float = 1.0,
     - 과굴착(overdeepening): 바닥이 빙하 혀보다 깊어짐
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 산악 배경
     mountain_height = depth + 60.0
@@ -1987,57 +2149,52 @@ def create_cirque(grid_size: int = 100, stage: float = 1.0,
     headwall_steepness = 0.2 + 0.8 * erosion
     
     # === 지형 생성 ===
-    for r in range(h):
-        for c in range(w):
-            dy = r - cirque_y
-            dx = c - cirque_x
-            dist = np.sqrt(dy**2 + dx**2)
-            
-            if dist < cirque_radius:
-                # 방향에 따른 형태
-                angle = np.arctan2(dy, dx)
-                
-                if dy < 0:
-                    # 후벽 (Headwall) - 베르그슈런트 동결풍화로 급경사
-                    wall_factor = (1 - dist / cirque_radius) * headwall_steepness
-                    base_elev = mountain_height - bowl_depth + bowl_depth * wall_factor
-                else:
-                    # 바닥 - 회전류 침식으로 오목 (과굴착)
-                    # 중앙이 가장 깊고 가장자리로 갈수록 얕아짐
-                    floor_profile = 1 - (dist / cirque_radius) ** 1.5
-                    scour_depth = bowl_depth * 0.85 * floor_profile
-                    base_elev = mountain_height - scour_depth
-                
-                elevation[r, c] = base_elev
-            
-            # 빙하 유출 곡(outlet)
-            if cirque_y < r < cirque_y + cirque_radius * 0.7:
-                if abs(c - cirque_x) < cirque_radius * 0.20:
-                    outlet_dist = (r - cirque_y) / (cirque_radius * 0.7)
-                    outlet_depth = bowl_depth * 0.35 * (1 - outlet_dist)
-                    elevation[r, c] = min(elevation[r, c], mountain_height - outlet_depth)
+    rows, cols = _coord_grid(h, w)
+    dy = rows - cirque_y
+    dist_sq = dy**2 + (cols - cirque_x)**2
+    bowl = dist_sq < cirque_radius**2
+    dist = np.sqrt(dist_sq[bowl])
+    elevation[bowl] = np.where(
+        np.broadcast_to(dy < 0, (h, w))[bowl],
+        # 후벽 (Headwall) - 베르그슈런트 동결풍화로 급경사
+        mountain_height - bowl_depth + bowl_depth * ((1 - dist / cirque_radius) * headwall_steepness),
+        # 바닥 - 회전류 침식으로 오목 (과굴착), 중앙이 가장 깊고 가장자리로 갈수록 얕아짐
+        mountain_height - bowl_depth * 0.85 * (1 - (dist / cirque_radius) ** 1.5)
+    )
+    
+    # 빙하 유출 곡(outlet) - 권곡 아래 행 구간 x 중앙 열 구간
+    out_rows = np.arange(cirque_y + 1, h)
+    out_rows = out_rows[out_rows < cirque_y + cirque_radius * 0.7]
+    out_cols = np.flatnonzero(np.abs(np.arange(w) - cirque_x) < cirque_radius * 0.20)
+    if out_rows.size and out_cols.size:
+        outlet_dist = (out_rows - cirque_y) / (cirque_radius * 0.7)
+        outlet_depth = bowl_depth * 0.35 * (1 - outlet_dist)
+        slab = elevation[out_rows[0]:out_rows[-1] + 1, out_cols[0]:out_cols[-1] + 1]
+        np.minimum(slab, (mountain_height - outlet_depth)[:, None], out=slab)
     
     # === 빙하 시각화 ===
     if glacier_fill > 0 and phase != "post_glacial":
         ice_radius = int(cirque_radius * 0.80 * glacier_fill)
         ice_thickness = 25.0 * glacier_fill
         
-        for r in range(cirque_y - ice_radius, cirque_y + int(ice_radius * 0.6)):
-            for c in range(cirque_x - ice_radius, cirque_x + ice_radius):
-                if 0 <= r < h and 0 <= c < w:
-                    dist = np.sqrt((r - cirque_y)**2 + (c - cirque_x)**2)
-                    if dist < ice_radius:
-                        # 빙하 표면 - 볼록 (중앙 두꺼움)
-                        ice_profile = 1 - (dist / ice_radius) ** 2
-                        
-                        # 후퇴 중이면 가장자리부터 녹음
-                        if phase == "glacial_retreat":
-                            melt_edge = ice_radius * 0.4
-                            if dist > ice_radius - melt_edge:
-                                ice_profile *= (ice_radius - dist) / melt_edge
-                        
-                        elevation[r, c] = max(elevation[r, c], 
-                                             elevation[r, c] + ice_thickness * ice_profile)
+        r0, r1 = max(cirque_y - ice_radius, 0), min(cirque_y + int(ice_radius * 0.6), h)
+        c0, c1 = max(cirque_x - ice_radius, 0), min(cirque_x + ice_radius, w)
+        if r0 < r1 and c0 < c1:
+            dist_sq = ((np.arange(r0, r1) - cirque_y)**2)[:, None] + ((np.arange(c0, c1) - cirque_x)**2)[None, :]
+            ice = dist_sq < ice_radius**2
+            dist = np.sqrt(dist_sq[ice])
+            
+            # 빙하 표면 - 볼록 (중앙 두꺼움)
+            ice_profile = 1 - (dist / ice_radius) ** 2
+            
+            # 후퇴 중이면 가장자리부터 녹음
+            if phase == "glacial_retreat":
+                melt_edge = ice_radius * 0.4
+                ice_profile = np.where(dist > ice_radius - melt_edge,
+                                       ice_profile * ((ice_radius - dist) / melt_edge), ice_profile)
+            
+            slab = elevation[r0:r1, c0:c1]
+            slab[ice] = np.maximum(slab[ice], slab[ice] + ice_thickness * ice_profile)
     
     # === 턴(Tarn) 호수 ===
     if stage > 0.70:
@@ -2045,15 +2202,17 @@ def create_cirque(grid_size: int = 100, stage: float = 1.0,
         tarn_radius = int(cirque_radius * 0.35 * tarn_progress)
         tarn_depth = bowl_depth * 0.20 * tarn_progress
         
-        for r in range(cirque_y - tarn_radius, cirque_y + int(tarn_radius * 0.4)):
-            for c in range(cirque_x - tarn_radius, cirque_x + tarn_radius):
-                if 0 <= r < h and 0 <= c < w:
-                    dist = np.sqrt((r - cirque_y)**2 + (c - cirque_x)**2)
-                    if dist < tarn_radius:
-                        # 호수 바닥 (과굴착된 바닥에 물 고임)
-                        water_depth = tarn_depth * (1 - (dist / tarn_radius) ** 2)
-                        elevation[r, c] = min(elevation[r, c], 
-                                             mountain_height - bowl_depth - water_depth)
+        r0, r1 = max(cirque_y - tarn_radius, 0), min(cirque_y + int(tarn_radius * 0.4), h)
+        c0, c1 = max(cirque_x - tarn_radius, 0), min(cirque_x + tarn_radius, w)
+        if r0 < r1 and c0 < c1:
+            dist_sq = ((np.arange(r0, r1) - cirque_y)**2)[:, None] + ((np.arange(c0, c1) - cirque_x)**2)[None, :]
+            tarn = dist_sq < tarn_radius**2
+            dist = np.sqrt(dist_sq[tarn])
+            
+            # 호수 바닥 (과굴착된 바닥에 물 고임)
+            water_depth = tarn_depth * (1 - (dist / tarn_radius) ** 2)
+            slab = elevation[r0:r1, c0:c1]
+            slab[tarn] = np.minimum(slab[tarn], mountain_height - bowl_depth - water_depth)
     
     if return_metadata:
         return elevation, {
@@ -2107,7 +2266,7 @@ def create_horn(grid_size: int = 100, stage: float = 1.0,
     대표 사례: 마터호른 (스위스), K2
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = (h // 2, w // 2)
     max_peak_height = 120.0
@@ -2123,14 +2282,14 @@ def create_horn(grid_size: int = 100, stage: float = 1.0,
     cirque_radius = int(w * 0.28 * (0.6 + 0.4 * stage))
     
     # 기본 원뿔형 산체
-    for r in range(h):
-        for c in range(w):
-            dy = r - center[0]
-            dx = c - center[1]
-            dist = np.sqrt(dy**2 + dx**2)
-            
-            # 원뿔형 기본 형태
-            elevation[r, c] = peak_height * max(0, 1 - dist / (w * 0.45))
+    yy, xx = _coord_grid(h, w)
+    dist = _radial_distance(h, w, *center)
+    
+    # 원뿔형 기본 형태
+    elevation[:, :] = peak_height * np.maximum(0, 1 - dist / (w * 0.45))
+    
+    # 후벽 방향 (중심쪽)으로 더 급경사 - 권곡 위치와 무관하므로 한 번만 계산
+    headwall = dist < cirque_radius * 0.5
     
     # 다방향 권곡 파기
     cirque_centers = []
@@ -2142,20 +2301,23 @@ def create_horn(grid_size: int = 100, stage: float = 1.0,
         cy = center[0] + int(cirque_radius * 0.7 * np.sin(angle))
         cirque_centers.append((cy, cx))
         
-        for r in range(h):
-            for c in range(w):
-                cdist = np.sqrt((r - cy)**2 + (c - cx)**2)
-                
-                if cdist < cirque_radius * 0.6:
-                    # 권곡 파기 (반그릇 형태)
-                    floor_height = 20.0 + cirque_depth * (cdist / (cirque_radius * 0.6)) ** 0.5
-                    
-                    # 후벽 방향 (중심쪽)으로 더 급경사
-                    dir_to_center = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                    if dir_to_center < cirque_radius * 0.5:
-                        floor_height += 20.0 * (1 - dir_to_center / (cirque_radius * 0.5))
-                    
-                    elevation[r, c] = min(elevation[r, c], floor_height)
+        # 권곡 반경 안만 바뀌므로 경계 상자에서만 계산
+        bowl_r = int(cirque_radius * 0.6)
+        window = _stamp_window(h, w, cy, cx, bowl_r, bowl_r)
+        if window is None:
+            continue
+        rs, cs = window[:2]
+        cdist = np.hypot(yy[rs] - cy, xx[:, cs] - cx)
+        bowl = cdist < cirque_radius * 0.6
+        
+        # 권곡 파기 (반그릇 형태)
+        floor_height = 20.0 + cirque_depth * (cdist[bowl] / (cirque_radius * 0.6)) ** 0.5
+        
+        steep = headwall[rs, cs][bowl]
+        floor_height[steep] += 20.0 * (1 - dist[rs, cs][bowl][steep] / (cirque_radius * 0.5))
+        
+        slab = elevation[rs, cs]
+        slab[bowl] = np.minimum(slab[bowl], floor_height)
     
     # 아레트 강화 (인접 권곡 사이 능선)
     for i in range(num_cirques):
@@ -2166,15 +2328,17 @@ def create_horn(grid_size: int = 100, stage: float = 1.0,
         # 두 권곡 중간점
         mid_y, mid_x = (cy1 + cy2) // 2, (cx1 + cx2) // 2
         
-        for r in range(h):
-            for c in range(w):
-                # 능선 방향에 가까운 픽셀은 높이 유지
-                dist_to_mid = np.sqrt((r - mid_y)**2 + (c - mid_x)**2)
-                if dist_to_mid < cirque_radius * 0.3:
-                    dist_to_center = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                    if dist_to_center < cirque_radius * 0.5:
-                        ridge_boost = 15.0 * stage * (1 - dist_to_mid / (cirque_radius * 0.3))
-                        elevation[r, c] = min(elevation[r, c] + ridge_boost, peak_height)
+        # 능선 방향에 가까운 픽셀은 높이 유지
+        ridge_r = int(cirque_radius * 0.3)
+        window = _stamp_window(h, w, mid_y, mid_x, ridge_r, ridge_r)
+        if window is None:
+            continue
+        rs, cs = window[:2]
+        dist_to_mid = np.hypot(yy[rs] - mid_y, xx[:, cs] - mid_x)
+        ridge = (dist_to_mid < cirque_radius * 0.3) & headwall[rs, cs]
+        ridge_boost = 15.0 * stage * (1 - dist_to_mid[ridge] / (cirque_radius * 0.3))
+        slab = elevation[rs, cs]
+        slab[ridge] = np.minimum(slab[ridge] + ridge_boost, peak_height)
     
     if return_metadata:
         return elevation, {
@@ -2218,7 +2382,7 @@ def create_shield_volcano(grid_size: int = 100, stage: float = 1.0,
     - 용암류가 넓게 퍼짐
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = (h // 2, w // 2)
     max_radius = int(w * 0.45)
@@ -2227,21 +2391,20 @@ def create_shield_volcano(grid_size: int = 100, stage: float = 1.0,
     current_radius = int(max_radius * min(1.0, stage * 1.3))
     current_height = max_height * stage
     
-    for r in range(h):
-        for c in range(w):
-            dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-            
-            if dist < current_radius and current_radius > 0:
-                # 완만한 포물선 형태 (경사 5-10도)  
-                radial_factor = 1 - (dist / current_radius) ** 1.8
-                elevation[r, c] = current_height * radial_factor
+    dist = _radial_distance(h, w, *center)
+    
+    if current_radius > 0:
+        # 완만한 포물선 형태 (경사 5-10도)
+        cone = dist < current_radius
+        radial_factor = 1 - (dist[cone] / current_radius) ** 1.8
+        elevation[cone] = current_height * radial_factor
     
     # 용암류 흔적 (방사상) - stage 0.4 이후
     if stage > 0.4:
-        np.random.seed(42)
+        rng = np.random.RandomState(42)
         num_flows = 6
         for i in range(num_flows):
-            angle = 2 * np.pi * i / num_flows + np.random.random() * 0.3
+            angle = 2 * np.pi * i / num_flows + rng.random() * 0.3
             flow_length = int(current_radius * (0.6 + 0.4 * stage))
             flow_width = 3 + int(2 * stage)
             
@@ -2264,13 +2427,10 @@ def create_shield_volcano(grid_size: int = 100, stage: float = 1.0,
         crater_radius = int(max_radius * 0.08 * (1 + caldera_progress))
         crater_depth = 5.0 * caldera_progress
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                if dist < crater_radius:
-                    # 함몰 칼데라
-                    depression = crater_depth * (1 - (dist / crater_radius) ** 2)
-                    elevation[r, c] = max(elevation[r, c] - depression, current_height * 0.85)
+        # 함몰 칼데라
+        crater = dist < crater_radius
+        depression = crater_depth * (1 - (dist[crater] / crater_radius) ** 2)
+        elevation[crater] = np.maximum(elevation[crater] - depression, current_height * 0.85)
     
     if return_metadata:
         return elevation, {
@@ -2311,7 +2471,7 @@ def create_stratovolcano(grid_size: int = 100, stage: float = 1.0,
     - 용암류 + 화쇄류 교대층
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = (h // 2, w // 2)
     max_radius = int(w * 0.4)
@@ -2320,30 +2480,27 @@ def create_stratovolcano(grid_size: int = 100, stage: float = 1.0,
     current_radius = int(max_radius * min(1.0, stage * 1.2))
     current_height = max_height * stage
     
-    for r in range(h):
-        for c in range(w):
-            dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-            
-            if dist < current_radius and current_radius > 0:
-                # 급한 원뿔 (경사 25-35도)
-                radial_factor = 1 - (dist / current_radius) ** 0.8
-                elevation[r, c] = current_height * radial_factor
+    yy, xx = _coord_grid(h, w)
+    dist = _radial_distance(h, w, *center)
+    
+    if current_radius > 0:
+        # 급한 원뿔 (경사 25-35도)
+        cone = dist < current_radius
+        radial_factor = 1 - (dist[cone] / current_radius) ** 0.8
+        elevation[cone] = current_height * radial_factor
     
     # 층리 표현 (작은 요철) - stage 0.3 이후
     if stage > 0.3:
-        np.random.seed(42)
         num_layers = int(5 * stage)
+        # 층리 경계의 요철은 방위각에만 의존 → 한 번만 계산
+        bump = 1.5 * np.sin(np.arctan2(yy - center[0], xx - center[1]) * 8)
         for layer in range(num_layers):
             layer_radius = current_radius * (0.3 + 0.7 * layer / max(1, num_layers))
             layer_height = current_height * (0.2 + 0.6 * layer / max(1, num_layers))
             
-            for r in range(h):
-                for c in range(w):
-                    dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                    if abs(dist - layer_radius) < 3:
-                        # 층리 경계에 약간의 요철
-                        bump = 1.5 * np.sin(np.arctan2(r - center[0], c - center[1]) * 8)
-                        elevation[r, c] += bump
+            # 층리 경계에 약간의 요철
+            ring = np.abs(dist - layer_radius) < 3
+            elevation[ring] += bump[ring]
     
     # 정상부 분화구 - stage 0.5 이후
     if stage > 0.5:
@@ -2351,17 +2508,14 @@ def create_stratovolcano(grid_size: int = 100, stage: float = 1.0,
         crater_radius = int(max_radius * 0.06 * (1 + crater_progress * 0.5))
         crater_depth = 12.0 * crater_progress
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                if dist < crater_radius:
-                    # 분화구
-                    if dist < crater_radius * 0.7:
-                        elevation[r, c] = current_height - crater_depth
-                    else:
-                        # 분화구 테두리
-                        rim_factor = (dist - crater_radius * 0.7) / (crater_radius * 0.3)
-                        elevation[r, c] = current_height - crater_depth + crater_depth * rim_factor
+        # 분화구
+        floor = dist < crater_radius * 0.7
+        elevation[floor] = current_height - crater_depth
+        
+        # 분화구 테두리
+        rim = (dist < crater_radius) & ~floor
+        rim_factor = (dist[rim] - crater_radius * 0.7) / (crater_radius * 0.3)
+        elevation[rim] = current_height - crater_depth + crater_depth * rim_factor
     
     if return_metadata:
         return elevation, {
@@ -2424,31 +2578,27 @@ def create_caldera(grid_size: int = 100, stage: float = 1.0,
     - 칼데라 직경 수 km ~ 수십 km
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = (h // 2, w // 2)
     max_outer = int(w * 0.45)
     
+    dist = _radial_distance(h, w, *center)
+    
     if stage < 0.3:
         # Stage 0~0.3: 성층화산 성장
         progress = stage / 0.3
         volcano_height = rim_height * 1.5 * progress
         volcano_radius = int(max_outer * 0.8 * progress)
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                if dist < volcano_radius and volcano_radius > 0:
-                    # 성층화산 형태
-                    elevation[r, c] = volcano_height * (1 - (dist / volcano_radius) ** 0.9)
+        if volcano_radius > 0:
+            # 성층화산 형태
+            cone = dist < volcano_radius
+            elevation[cone] = volcano_height * (1 - (dist[cone] / volcano_radius) ** 0.9)
         
         # 작은 분화구
         crater_r = max(2, int(volcano_radius * 0.08))
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                if dist < crater_r:
-                    elevation[r, c] = volcano_height * 0.85
+        elevation[dist < crater_r] = volcano_height * 0.85
                     
     elif stage < 0.5:
         # Stage 0.3~0.5: 대분화 시작, 함몰 시작
@@ -2456,19 +2606,14 @@ def create_caldera(grid_size: int = 100, stage: float = 1.0,
         volcano_height = rim_height * 1.5
         collapse_depth = rim_height * 0.5 * progress
         collapse_radius = int(max_outer * 0.15 * (1 + progress))
-        
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                if dist < max_outer * 0.8:
-                    # 화산체
-                    base = volcano_height * (1 - (dist / (max_outer * 0.8)) ** 0.9)
-                    
-                    if dist < collapse_radius:
-                        # 함몰 시작
-                        elevation[r, c] = base - collapse_depth * (1 - (dist / collapse_radius) ** 2)
-                    else:
-                        elevation[r, c] = base
+        
+        # 화산체
+        body = dist < max_outer * 0.8
+        elevation[body] = volcano_height * (1 - (dist[body] / (max_outer * 0.8)) ** 0.9)
+        
+        # 함몰 시작
+        collapse = body & (dist < collapse_radius)
+        elevation[collapse] -= collapse_depth * (1 - (dist[collapse] / collapse_radius) ** 2)
                         
     elif stage < 0.8:
         # Stage 0.5~0.8: 칼데라 확장
@@ -2476,46 +2621,39 @@ def create_caldera(grid_size: int = 100, stage: float = 1.0,
         caldera_radius = int(max_outer * (0.2 + 0.25 * progress))  # 점점 넓어짐
         collapse_depth = rim_height * (0.5 + 0.4 * progress)
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                
-                if dist < max_outer:
-                    if dist < caldera_radius:
-                        # 칼데라 바닥 (평탄)
-                        elevation[r, c] = rim_height * 1.5 - collapse_depth
-                    else:
-                        # 칼데라 벽 + 외륜산
-                        wall_progress = (dist - caldera_radius) / (max_outer - caldera_radius)
-                        if wall_progress < 0.3:
-                            # 급경사 벽
-                            elevation[r, c] = (rim_height * 1.5 - collapse_depth) + rim_height * 0.8 * (wall_progress / 0.3)
-                        else:
-                            # 외륜산 사면
-                            elevation[r, c] = rim_height * (1 - (wall_progress - 0.3) / 0.7) * 1.2
+        # 칼데라 바닥 (평탄)
+        elevation[dist < caldera_radius] = rim_height * 1.5 - collapse_depth
+        
+        # 칼데라 벽 + 외륜산
+        ring = (dist >= caldera_radius) & (dist < max_outer)
+        wall_progress = (dist[ring] - caldera_radius) / (max_outer - caldera_radius)
+        elevation[ring] = np.where(
+            wall_progress < 0.3,
+            # 급경사 벽
+            (rim_height * 1.5 - collapse_depth) + rim_height * 0.8 * (wall_progress / 0.3),
+            # 외륜산 사면
+            rim_height * (1 - (wall_progress - 0.3) / 0.7) * 1.2
+        )
                             
     else:
         # Stage 0.8~1.0: 칼데라 완성 + 호수
         progress = (stage - 0.8) / 0.2
         caldera_radius = int(max_outer * 0.45)  # 최종 크기
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-                
-                if dist < max_outer:
-                    if dist < caldera_radius:
-                        # 칼데라 바닥 (호수)
-                        water_level = 5.0
-                        elevation[r, c] = water_level - 3.0 * (1 - (dist / caldera_radius) ** 2)
-                    elif dist < caldera_radius + 8:
-                        # 급경사 벽
-                        wall_t = (dist - caldera_radius) / 8
-                        elevation[r, c] = 5.0 + rim_height * 0.9 * wall_t
-                    else:
-                        # 외륜산
-                        outer_t = (dist - caldera_radius - 8) / (max_outer - caldera_radius - 8)
-                        elevation[r, c] = rim_height * (1 - outer_t ** 0.8) * 0.9
+        # 칼데라 바닥 (호수)
+        lake = (dist < max_outer) & (dist < caldera_radius)
+        water_level = 5.0
+        elevation[lake] = water_level - 3.0 * (1 - (dist[lake] / caldera_radius) ** 2)
+        
+        # 급경사 벽
+        wall = (dist < max_outer) & (dist >= caldera_radius) & (dist < caldera_radius + 8)
+        wall_t = (dist[wall] - caldera_radius) / 8
+        elevation[wall] = 5.0 + rim_height * 0.9 * wall_t
+        
+        # 외륜산
+        outer = (dist < max_outer) & (dist >= caldera_radius + 8)
+        outer_t = (dist[outer] - caldera_radius - 8) / (max_outer - caldera_radius - 8)
+        elevation[outer] = rim_height * (1 - outer_t ** 0.8) * 0.9
     
     if return_metadata:
         return elevation, {
@@ -2574,7 +2712,7 @@ def create_mesa_butte(grid_size: int = 100, stage: float = 1.0,
     - Moon & Jayasuriya (2018) Mesa Evolution
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 사막 기반 (페디먼트)
     elevation[:, :] = 5.0
@@ -2612,30 +2750,27 @@ def create_mesa_butte(grid_size: int = 100, stage: float = 1.0,
             form_type = 'pinnacle'
         formation_types.append(form_type)
         
-        for r in range(r_min, r_max):
-            for c in range(c_min, c_max):
-                dy = abs(r - my)
-                dx = abs(c - mx)
-                
-                # Normalize distance
-                if sh > 0 and sw > 0:
-                    dist_norm = (dy / sh)**n + (dx / sw)**n
-                else:
-                    dist_norm = 999.0
-                
-                if dist_norm <= 1.0:
-                    # 평탄한 정상부 (Cap Rock)
-                    elevation[r, c] = max(elevation[r, c], mesa_height)
-                elif dist_norm <= 1.3:
-                    # 급경사 측벽 (Cliff Face)
-                    wall_pos = (dist_norm - 1.0) / 0.3
-                    z = mesa_height * (1 - wall_pos * 0.7)  # 70% 높이까지 급경사
-                    elevation[r, c] = max(elevation[r, c], z)
-                elif dist_norm <= 1.8:
-                    # Talus Slope (애추) - 35° 경사
-                    talus_pos = (dist_norm - 1.3) / 0.5
-                    z = mesa_height * 0.3 * (1 - talus_pos)
-                    elevation[r, c] = max(elevation[r, c], z)
+        if sh <= 0 or sw <= 0:
+            continue
+        
+        # Normalize distance - 행/열 항이 분리되므로 1-D 두 개의 외합으로 계산
+        dy = np.abs(np.arange(r_min, r_max) - my)
+        dx = np.abs(np.arange(c_min, c_max) - mx)
+        dist_norm = np.add.outer((dy / sh)**n, (dx / sw)**n)
+        
+        z = np.select(
+            [dist_norm <= 1.0, dist_norm <= 1.3],
+            [
+                # 평탄한 정상부 (Cap Rock)
+                mesa_height,
+                # 급경사 측벽 (Cliff Face) - 70% 높이까지 급경사
+                mesa_height * (1 - (dist_norm - 1.0) / 0.3 * 0.7),
+            ],
+            # Talus Slope (애추) - 35° 경사
+            mesa_height * 0.3 * (1 - (dist_norm - 1.3) / 0.5)
+        )
+        slab = elevation[r_min:r_max, c_min:c_max]
+        np.maximum(slab, z, out=slab, where=dist_norm <= 1.8)
 
     # 뷰트 침식 표현 (Talus 형성)
     if num_mesas > 1 and stage > 0.5:
@@ -2643,12 +2778,13 @@ def create_mesa_butte(grid_size: int = 100, stage: float = 1.0,
         b_sh, b_sw = sizes[1]
         
         erosion_mask = (elevation > 10) & (elevation < mesa_height * 0.9)
-        dist_b = np.sqrt(((np.arange(h)[:, None] - by)**2 + (np.arange(w)[None, :] - bx)**2))
-        erosion_mask &= (dist_b < max(b_sh, b_sw) * 2)
+        rows, cols = _coord_grid(h, w)
+        dist_b_sq = (rows - by)**2 + (cols - bx)**2
+        erosion_mask &= (dist_b_sq < (max(b_sh, b_sw) * 2)**2)
         
         # Talus 노이즈
-        np.random.seed(42)
-        noise = np.random.rand(h, w) * 5.0
+        rng = np.random.RandomState(42)
+        noise = rng.rand(h, w) * 5.0
         elevation[erosion_mask] += noise[erosion_mask]
 
     if return_metadata:
@@ -2743,17 +2879,10 @@ def create_spit_lagoon(grid_size: int = 100, stage: float = 1.0,
     - Davis & FitzGerald (2004) Beaches and Coasts
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     
-    # 바다 (오른쪽)
+    # 바다 (오른쪽, 해저 경사) + 육지 (왼쪽)
     sea_line = int(w * 0.6)
-    for r in range(h):
-        for c in range(sea_line, w):
-            # 해저 경사
-            elevation[r, c] = -5.0 - (c - sea_line) * 0.1
-    
-    # 육지 (왼쪽)
-    elevation[:, :sea_line] = 10.0
+    elevation = _spit_background(h, w, sea_line).copy()
     
     # 사취 파라미터
     spit_start = int(h * 0.3)
@@ -2762,56 +2891,61 @@ def create_spit_lagoon(grid_size: int = 100, stage: float = 1.0,
     recurve_amount = 0  # 곡사취 정도
     
     # === 사취 형성 ===
-    spit_cells = []
+    # 행마다 휘어짐(curve/recurve)을 1-D로 구하고, 폭 방향 오프셋 dc와 브로드캐스트
     if stage > 0.1:
-        for r in range(spit_start, min(h, spit_start + spit_length)):
-            # 사취가 바다 쪽으로 휘어짐
-            progress = (r - spit_start) / max(spit_length, 1)
-            curve = int(progress * (w * 0.15))
-            
-            # 곡사취 (stage 0.4 이후)
-            if stage > 0.4 and progress > 0.7:
-                recurve = int((progress - 0.7) / 0.3 * w * 0.08)
-                recurve_amount = max(recurve_amount, recurve)
-            else:
-                recurve = 0
-            
-            spit_x = sea_line + curve
-            
-            for dc in range(-spit_width, spit_width + 1):
-                c = spit_x + dc + recurve
-                if 0 <= c < w:
-                    # 사취 높이 (중앙이 높음)
-                    spit_height = 3.0 * (1 - abs(dc) / spit_width) * min(1.0, stage * 2)
-                    if spit_height > elevation[r, c]:
-                        elevation[r, c] = spit_height
-                        spit_cells.append((r, c))
+        rows = np.arange(spit_start, min(h, spit_start + spit_length))
+        # 사취가 바다 쪽으로 휘어짐
+        progress = (rows - spit_start) / max(spit_length, 1)
+        curve = (progress * (w * 0.15)).astype(int)
+        
+        # 곡사취 (stage 0.4 이후)
+        if stage > 0.4:
+            recurve = np.where(progress > 0.7, ((progress - 0.7) / 0.3 * w * 0.08).astype(int), 0)
+            recurve_amount = max(recurve_amount, int(recurve.max(initial=0)))
+        else:
+            recurve = np.zeros_like(curve)
+        
+        spit_x = sea_line + curve
+        
+        dc = np.arange(-spit_width, spit_width + 1)
+        cs = (spit_x + recurve)[:, None] + dc[None, :]
+        rs = np.broadcast_to(rows[:, None], cs.shape)
+        # 사취 높이 (중앙이 높음)
+        spit_height = np.broadcast_to(3.0 * (1 - np.abs(dc) / spit_width) * min(1.0, stage * 2), cs.shape)
+        
+        inside = (cs >= 0) & (cs < w)
+        rs, cs, spit_height = rs[inside], cs[inside], spit_height[inside]
+        elevation[rs, cs] = np.maximum(elevation[rs, cs], spit_height)
     
     # === 석호 형성 (stage 0.5 이후) ===
     lagoon_area = 0
     lagoon_depth = 0
     if stage > 0.5:
         lagoon_intensity = (stage - 0.5) / 0.5
-        for r in range(spit_start, spit_start + int(spit_length * 0.8)):
-            progress = (r - spit_start) / max(spit_length * 0.8, 1)
-            curve = int(progress * (w * 0.1))
-            for c in range(sea_line - 5, sea_line + curve):
-                if 0 <= c < w:
-                    if elevation[r, c] < 3.0:
-                        # 석호 수심 (내륙일수록 얕음)
-                        depth = -2.0 + (sea_line - c) * 0.1
-                        elevation[r, c] = max(depth, -3.0)
-                        lagoon_area += 1
-                        lagoon_depth = min(lagoon_depth, depth)
+        rows = np.arange(spit_start, spit_start + int(spit_length * 0.8))
+        progress = (rows - spit_start) / max(spit_length * 0.8, 1)
+        curve = (progress * (w * 0.1)).astype(int)
+        
+        c0 = max(0, sea_line - 5)
+        c1 = min(w, sea_line + int(curve.max(initial=0)))
+        if rows.size and c0 < c1:
+            cols = np.arange(c0, c1)
+            slab = elevation[rows[0]:rows[-1] + 1, c0:c1]
+            lagoon = (cols[None, :] < (sea_line + curve)[:, None]) & (slab < 3.0)
+            
+            # 석호 수심 (내륙일수록 얕음)
+            depth = np.broadcast_to(-2.0 + (sea_line - cols) * 0.1, slab.shape)
+            np.copyto(slab, np.maximum(depth, -3.0), where=lagoon)
+            lagoon_area = int(lagoon.sum())
+            if lagoon_area:
+                lagoon_depth = min(lagoon_depth, float(depth[lagoon].min()))
         
         # 염습지 (stage 0.8 이후)
         if stage > 0.8:
             marsh_intensity = (stage - 0.8) / 0.2
-            for r in range(spit_start, spit_start + int(spit_length * 0.6)):
-                for c in range(sea_line - 5, sea_line):
-                    if 0 <= c < w and elevation[r, c] < 0:
-                        # 염습지로 변환
-                        elevation[r, c] = -0.5 * marsh_intensity
+            slab = elevation[spit_start:spit_start + int(spit_length * 0.6), max(0, sea_line - 5):sea_line]
+            # 염습지로 변환
+            slab[slab < 0] = -0.5 * marsh_intensity
     
     if return_metadata:
         # 형성 단계 판정
@@ -2873,7 +3007,7 @@ def create_fjord(grid_size: int = 100, stage: float = 1.0,
     - 해침: 빙하 후퇴 시 바닷물이 빙하 뒤따라 유입
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 산악 지형
     elevation[:, :] = 100.0
@@ -2931,30 +3065,29 @@ def create_fjord(grid_size: int = 100, stage: float = 1.0,
     # === 지형 생성 ===
     max_depth = -55.0  # 과굴착 최대 깊이 (해수면 이하)
     
-    for r in range(h):
-        # 종단 경사: 상류 높음, 하류는 해수면
-        base_height = (h - r) / h * 80.0
-        
-        # 과굴착: 내륙(상류)이 더 깊음
-        overdeepen_factor = 1.0 - (r / h) * 0.4  # 상류 깊고 하류 얕음
-        
-        for c in range(w):
-            dx = abs(c - center)
-            
-            if dx < valley_width:
-                # U자곡 바닥
-                # V→U 변환 + 과굴착
-                if erosion > 0:
-                    depth = max_depth * erosion * overdeepen_factor
-                else:
-                    depth = 10.0  # V자곡 바닥
-                elevation[r, c] = depth
-                
-            elif dx < valley_width + 15:
-                # U자 측벽 (급경사)
-                t = (dx - valley_width) / 15
-                floor = max_depth * erosion * overdeepen_factor if erosion > 0 else 10.0
-                elevation[r, c] = floor + (100.0 - floor) * (t ** 0.4)
+    # 행마다 달라지는 값은 (h, 1), 열마다 달라지는 값은 (1, w)로 브로드캐스트
+    rr, cc = _coord_grid(h, w)
+    dx = np.abs(cc - center)
+    valley = dx < valley_width
+    
+    # 과굴착: 내륙(상류)이 더 깊음 (상류 깊고 하류 얕음)
+    overdeepen_factor = 1.0 - (rr / h) * 0.4
+    
+    # U자곡 바닥: V→U 변환 + 과굴착 (침식 전에는 V자곡 바닥)
+    if erosion > 0:
+        floor = max_depth * erosion * overdeepen_factor
+    else:
+        floor = np.full((h, 1), 10.0)
+    
+    # U자 측벽 (급경사)
+    wall = ~valley & (dx < valley_width + 15)
+    t = (dx - valley_width) / 15
+    wall_height = floor + (100.0 - floor) * (np.maximum(t, 0) ** 0.4)
+    
+    elevation[:, :] = np.select([valley, wall], [floor, wall_height], elevation)
+    
+    # 곡 중심에서 가장자리로 갈수록 얇아지는 횡단 프로파일 (문턱, 빙하 공통)
+    cross_profile = 1 - (dx / max(valley_width, 1)) ** 2
     
     # === 문턱 (Sill) - 빙하 최대 전진선 ===
     if stage > 0.55:
@@ -2962,36 +3095,30 @@ def create_fjord(grid_size: int = 100, stage: float = 1.0,
         sill_row = int(h * 0.90)  # 피오르드 입구
         sill_height = 35.0 * sill_progress  # 문턱 높이 (바닥에서 솟아오름)
         
-        for r in range(sill_row - 3, min(h, sill_row + 5)):
-            for c in range(w):
-                dx = abs(c - center)
-                if dx < valley_width:
-                    # 문턱 형태 (종퇴석 퇴적)
-                    row_factor = 1 - abs(r - sill_row) / 4
-                    if row_factor > 0:
-                        ridge = sill_height * row_factor * (1 - (dx / valley_width) ** 2)
-                        elevation[r, c] += ridge
+        r0, r1 = max(0, sill_row - 3), min(h, sill_row + 5)
+        # 문턱 형태 (종퇴석 퇴적)
+        row_factor = 1 - np.abs(rr[r0:r1] - sill_row) / 4
+        ridge = sill_height * row_factor * cross_profile
+        slab = elevation[r0:r1]
+        np.add(slab, ridge.astype(_DTYPE), out=slab, where=valley & (row_factor > 0))
     
     # === 빙하 시각화 ===
     if glacier_front > glacier_rear and phase not in ["pre_glacial", "post_glacial"]:
         glacier_thickness = 50.0 if phase == "glacial_max" else 40.0
         
-        for r in range(glacier_rear, glacier_front):
-            # 빙하 두께 프로파일
-            relative_pos = (r - glacier_rear) / max(1, glacier_front - glacier_rear)
-            long_profile = 1.0 - abs(relative_pos - 0.4) * 0.5
-            
-            # 빙하 말단(snout)
-            if r > glacier_front - int(h * 0.10):
-                snout = (glacier_front - r) / (h * 0.10)
-                long_profile *= snout
-            
-            for c in range(w):
-                dx = abs(c - center)
-                if dx < valley_width:
-                    cross_profile = 1 - (dx / valley_width) ** 2
-                    ice_surface = glacier_thickness * cross_profile * long_profile
-                    elevation[r, c] += ice_surface
+        ice_rows = rr[glacier_rear:glacier_front]
+        
+        # 빙하 두께 프로파일
+        relative_pos = (ice_rows - glacier_rear) / max(1, glacier_front - glacier_rear)
+        long_profile = 1.0 - np.abs(relative_pos - 0.4) * 0.5
+        
+        # 빙하 말단(snout)
+        snout = ice_rows > glacier_front - int(h * 0.10)
+        long_profile = np.where(snout, long_profile * ((glacier_front - ice_rows) / (h * 0.10)), long_profile)
+        
+        ice_surface = glacier_thickness * cross_profile * long_profile
+        slab = elevation[glacier_rear:glacier_front]
+        np.add(slab, ice_surface.astype(_DTYPE), out=slab, where=valley)
     
     # === 바닷물 시각화 ===
     # 바다는 elevation < 0 인 구간에만 (실제로는 renderer에서 처리)
@@ -3041,7 +3168,7 @@ def create_drumlin(grid_size: int = 100, stage: float = 1.0,
     - 빙하 이동 방향 지시자
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 빙하 퇴적 평원
     elevation[:, :] = 5.0
@@ -3074,7 +3201,6 @@ def create_drumlin(grid_size: int = 100, stage: float = 1.0,
     
     # === 드럼린 생성 ===
     drumlin_positions = []
-    np.random.seed(42)  # 재현성
     
     for i in range(num_drumlins):
         # 드럼린 위치 (빙하 흐름 방향: 왼쪽→오른쪽)
@@ -3088,23 +3214,20 @@ def create_drumlin(grid_size: int = 100, stage: float = 1.0,
         height_val = 15.0 * drumlin_visible
         
         if length > 0 and width_val > 0:
-            for r in range(max(0, cy - width_val - 3), min(h, cy + width_val + 3)):
-                for c in range(max(0, cx - length), min(w, cx + length)):
-                    dy = (r - cy) / max(width_val, 1)  # Y축: 너비
-                    dx = (c - cx) / max(length, 1)  # X축: 길이 (빙하 방향)
-                    
-                    # 유선형 (stoss-lee 비대칭) - X방향
-                    if dx < 0:
-                        # Stoss (상류/왼쪽) - 둥글고 완만
-                        dist = np.sqrt(dy**2 + dx**2)
-                    else:
-                        # Lee (하류/오른쪽) - 뾰족하게 캐리
-                        dist = np.sqrt(dy**2 + (dx * 1.8)**2)
-                    
-                    if dist < 1.0:
-                        # 언덕 형태 - 부드러운 곡선
-                        z = height_val * (1 - dist ** 1.5) * (1 - abs(dy) * 0.3)
-                        elevation[r, c] = max(elevation[r, c], 5.0 + z)
+            # 드럼린 바운딩 박스 안에서만 타원 스탬프 계산
+            r0, r1 = max(0, cy - width_val - 3), min(h, cy + width_val + 3)
+            c0, c1 = max(0, cx - length), min(w, cx + length)
+            dy = ((np.arange(r0, r1) - cy) / max(width_val, 1))[:, None]  # Y축: 너비
+            dx = ((np.arange(c0, c1) - cx) / max(length, 1))[None, :]  # X축: 길이 (빙하 방향)
+            
+            # 유선형 (stoss-lee 비대칭) - X방향
+            # Stoss (상류/왼쪽) - 둥글고 완만, Lee (하류/오른쪽) - 뾰족하게 캐리
+            dist = np.sqrt(dy**2 + np.where(dx < 0, dx, dx * 1.8)**2)
+            
+            # 언덕 형태 - 부드러운 곡선
+            z = height_val * (1 - dist ** 1.5) * (1 - np.abs(dy) * 0.3)
+            slab = elevation[r0:r1, c0:c1]
+            np.maximum(slab, 5.0 + z, out=slab, where=dist < 1.0)
     
     # === 빙하 덮음 시각화 ===
     if glacier_cover > 0 and phase != "post_glacial":
@@ -3113,11 +3236,10 @@ def create_drumlin(grid_size: int = 100, stage: float = 1.0,
         # 빙하 전진 위치
         ice_front = int(h * glacier_cover * 0.95)
         
-        for r in range(ice_front):
-            for c in range(w):
-                # 빙하 표면 (약간 볼록)
-                ice_surface = ice_thickness * (1 - (r / max(1, ice_front)) * 0.2)
-                elevation[r, c] = max(elevation[r, c], 5.0 + ice_surface)
+        # 빙하 표면 (약간 볼록) - 행마다 하나
+        ice_surface = ice_thickness * (1 - (np.arange(ice_front) / max(1, ice_front)) * 0.2)
+        slab = elevation[:ice_front]
+        np.maximum(slab, (5.0 + ice_surface)[:, None], out=slab)
     
     if return_metadata:
         return elevation, {
@@ -3168,16 +3290,10 @@ def create_moraine(grid_size: int = 100, stage: float = 1.0,
     Reference: Benn & Evans (2010) Glaciers and Glaciation
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     glacier_mask = np.zeros((h, w), dtype=bool)  # 빙하 위치 마스크
     
-    # 빙하 계곡 배경 (산지)
-    for r in range(h):
-        for c in range(w):
-            # 양쪽 산지
-            base = 25.0
-            dist_from_center = abs(c - w // 2)
-            elevation[r, c] = base + dist_from_center * 0.3
+    # 빙하 계곡 배경 (양쪽 산지)
+    elevation = _moraine_background(h, w).copy()
     
     center = w // 2
     glacier_width = int(w * 0.3)
@@ -3208,70 +3324,70 @@ def create_moraine(grid_size: int = 100, stage: float = 1.0,
         moraine_visible = 1.0
         phase = "post_glacial"
     
+    # 열마다 달라지는 값 (중심에서의 거리)
+    dc = np.abs(np.arange(w) - center)
+    
     # === 빙하 바닥 (U자곡) ===
-    for r in range(h):
-        for c in range(w):
-            if abs(c - center) < glacier_width:
-                elevation[r, c] = 5.0  # U자곡 바닥
+    elevation[:, dc < glacier_width] = 5.0
     
     # === 빙하 본체 시각화 ===
-    if glacier_visible and glacier_front > int(h * 0.1):
+    # (glacier_width가 0인 아주 작은 격자에서는 빙하가 차지하는 열이 없음)
+    if glacier_visible and glacier_front > int(h * 0.1) and glacier_width > 0:
         glacier_rear = int(h * 0.05)
         glacier_thickness = 30.0 if phase == "maximum" else 20.0
         
-        for r in range(glacier_rear, glacier_front):
-            for c in range(w):
-                if abs(c - center) < glacier_width * 0.8:
-                    # 빙하 표면 높이
-                    rel_pos = (r - glacier_rear) / max(glacier_front - glacier_rear, 1)
-                    # 빙하 혀(tongue) 형태
-                    long_profile = 1.0 - abs(rel_pos - 0.5) * 0.5
-                    lateral_profile = 1.0 - (abs(c - center) / (glacier_width * 0.8)) ** 0.5
-                    
-                    ice_height = glacier_thickness * long_profile * lateral_profile
-                    if r > glacier_front - int(h * 0.1):
-                        # 빙하 말단 경사
-                        snout_factor = (glacier_front - r) / (h * 0.1)
-                        ice_height *= snout_factor
-                    
-                    if ice_height > 2.0:  # 빙하 두께가 충분할 때만
-                        elevation[r, c] = max(elevation[r, c], 5.0 + ice_height)
-                        glacier_mask[r, c] = True  # 빙하 위치 표시
+        rows = np.arange(glacier_rear, glacier_front)[:, None]
+        # 빙하 표면 높이 - 빙하 혀(tongue) 형태
+        rel_pos = (rows - glacier_rear) / max(glacier_front - glacier_rear, 1)
+        long_profile = 1.0 - np.abs(rel_pos - 0.5) * 0.5
+        lateral_profile = 1.0 - (dc / (glacier_width * 0.8)) ** 0.5
+        
+        ice_height = glacier_thickness * long_profile * lateral_profile
+        # 빙하 말단 경사
+        snout = rows > glacier_front - int(h * 0.1)
+        ice_height = np.where(snout, ice_height * ((glacier_front - rows) / (h * 0.1)), ice_height)
+        
+        # 빙하 두께가 충분할 때만
+        ice = (dc < glacier_width * 0.8) & (ice_height > 2.0)
+        slab = elevation[glacier_rear:glacier_front]
+        np.maximum(slab, 5.0 + ice_height, out=slab, where=ice)
+        glacier_mask[glacier_rear:glacier_front] |= ice  # 빙하 위치 표시
     
     # === 측퇴석 (Lateral Moraine) ===
     moraine_height = 15.0 * moraine_visible
-    lateral_length = 0
-    for r in range(min(glacier_front, int(h * 0.8))):
+    lateral_rows = max(0, min(glacier_front, int(h * 0.8)))
+    lateral_length = 2 * lateral_rows
+    if lateral_rows:
+        # 상류로 갈수록 높아지는 측퇴석
+        height_factor = (1.0 - np.arange(lateral_rows) / h * 0.3)[:, None]
+        offsets = np.arange(-5, 6)
+        z = moraine_height * height_factor * (1 - np.abs(offsets) / 6)
         for side in [-1, 1]:
-            moraine_c = center + side * glacier_width
-            # 상류로 갈수록 높아지는 측퇴석
-            height_factor = 1.0 - r / h * 0.3
-            for dc in range(-5, 6):
-                c = moraine_c + dc
-                if 0 <= c < w:
-                    z = moraine_height * height_factor * (1 - abs(dc) / 6)
-                    elevation[r, c] = max(elevation[r, c], z + 10)
-            lateral_length += 1
+            cols = center + side * glacier_width + offsets
+            inside = (cols >= 0) & (cols < w)
+            slab = elevation[:lateral_rows, cols[inside]]
+            elevation[:lateral_rows, cols[inside]] = np.maximum(slab, z[:, inside] + 10)
     
     # === 종퇴석 (Terminal Moraine) - 호형 ===
     terminal_r = int(h * 0.8)
     terminal_area = 0
     if moraine_visible > 0.5:
         arc_intensity = min(1.0, (moraine_visible - 0.5) * 2)
-        for r in range(terminal_r - 8, min(h, terminal_r + 8)):
-            for c in range(w):
-                # 호형(arc) 계산
-                dx = c - center
-                dy = r - terminal_r
-                
-                # 포물선 형태
-                arc_center = terminal_r + int(abs(dx) ** 1.5 / 20)
-                if abs(r - arc_center) < 5 and abs(dx) < glacier_width + 10:
-                    dr = abs(r - arc_center)
-                    lateral_decay = 1 - abs(dx) / (glacier_width + 10)
-                    z = moraine_height * 1.3 * arc_intensity * (1 - dr / 5) * lateral_decay
-                    elevation[r, c] = max(elevation[r, c], z + 5)
-                    terminal_area += 1
+        # 작은 격자에서는 terminal_r - 8이 음수가 되어 아래쪽 행을 가리킬 수 있으므로
+        # (기존 인덱싱과 동일하게) 행 인덱스를 그대로 쓰고 중복 행은 maximum.at으로 누적
+        rows = np.arange(terminal_r - 8, min(h, terminal_r + 8))[:, None]
+        dx = np.arange(w)[None, :] - center
+        
+        # 포물선 형태
+        arc_center = terminal_r + (np.abs(dx) ** 1.5 / 20).astype(int)
+        dr = np.abs(rows - arc_center)
+        arc = (dr < 5) & (np.abs(dx) < glacier_width + 10)
+        
+        lateral_decay = 1 - np.abs(dx) / (glacier_width + 10)
+        z = moraine_height * 1.3 * arc_intensity * (1 - dr / 5) * lateral_decay
+        arc_r, arc_c = np.nonzero(arc)
+        np.maximum.at(elevation, (rows[arc_r, 0], arc_c), z[arc] + 5)
+        terminal_area = arc_r.size
     
     if return_metadata:
         return elevation, {
@@ -3350,7 +3466,7 @@ def create_braided_river(grid_size: int = 100, stage: float = 1.0,
     - Bridge (2003) Rivers and Floodplains
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 넓은 하상
     elevation[:, :] = 10.0
@@ -3359,42 +3475,34 @@ def create_braided_river(grid_size: int = 100, stage: float = 1.0,
     river_width = int(w * 0.5)
     
     # 넓고 얕은 하상
-    for c in range(center - river_width // 2, center + river_width // 2):
-        if 0 <= c < w:
-            elevation[:, c] = 5.0
+    elevation[:, max(0, center - river_width // 2):max(0, center + river_width // 2)] = 5.0
             
     # 여러 수로와 사주 (모래섬)
     num_channels = int(3 + 4 * stage)
-    np.random.seed(42)
     
-    channel_positions = []
-    for r in range(h):
-        for i in range(num_channels):
-            channel_x = center - river_width // 3 + int((i / num_channels) * river_width * 0.7)
-            channel_x += int(10 * np.sin(r / 10 + i))
-            
-            for dc in range(-2, 3):
-                c = channel_x + dc
-                if 0 <= c < w:
-                    elevation[r, c] = 3.0
-            channel_positions.append(channel_x)
+    # 수로 중심선 (h, num_channels): 수로별 기준 위치 + 행마다 사인 곡류
+    rows, _ = _coord_grid(h, w)
+    i = np.arange(num_channels)[None, :]
+    channel_x = center - river_width // 3 + ((i / num_channels) * river_width * 0.7).astype(int)
+    channel_x = channel_x + (10 * np.sin(rows / 10 + i)).astype(int)
+    
+    # 수로 폭 5칸 (h, num_channels, 5) → 격자 안 셀만 한 번에 기록
+    cs = channel_x[:, :, None] + np.arange(-2, 3)
+    rs = np.broadcast_to(rows[:, :, None], cs.shape)
+    inside = (cs >= 0) & (cs < w)
+    elevation[rs[inside], cs[inside]] = 3.0
                     
-    # 사주 (모래섬)
+    # 사주 (모래섬) - 11x17 타원 스탬프
     bar_count = int(5 * stage)
     bar_info = []
+    dr, dc = np.ogrid[-5:6, -8:9]
+    bar_dist = np.sqrt((dr / 5)**2 + (dc / 8)**2)
+    bar_height = 6.0 * (1 - bar_dist)
+    bar_mask = bar_dist < 1.0
     for i in range(bar_count):
         bar_r = int(h * 0.2 + i * h * 0.15)
         bar_c = center + int((i - 2) * w * 0.1)
-        bar_area = 0
-        
-        for dr in range(-5, 6):
-            for dc in range(-8, 9):
-                r, c = bar_r + dr, bar_c + dc
-                if 0 <= r < h and 0 <= c < w:
-                    dist = np.sqrt((dr/5)**2 + (dc/8)**2)
-                    if dist < 1.0:
-                        elevation[r, c] = max(elevation[r, c], 6.0 * (1 - dist))
-                        bar_area += 1
+        bar_area = int(_stamp(elevation, bar_r, bar_c, bar_height, bar_mask, np.maximum).sum())
         
         bar_info.append({'center': (bar_r, bar_c), 'area': bar_area})
     
@@ -3456,7 +3564,7 @@ def create_waterfall(grid_size: int = 100, stage: float = 1.0,
     - 와류(vortex)에 의한 포트홀 형성
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     center = w // 2
     
     # 폭포 위치 (stage에 따라 상류로 후퇴)
@@ -3468,25 +3576,18 @@ def create_waterfall(grid_size: int = 100, stage: float = 1.0,
     # 상류 (높은 고원 - 경암층)
     hard_rock_height = drop_height + 30.0
     
-    for r in range(fall_r):
-        for c in range(w):
-            # 상류로 갈수록 높아짐
-            upstream_rise = (fall_r - r) * 0.3
-            elevation[r, c] = hard_rock_height + upstream_rise
+    # 고도는 행에만 의존 → 행 벡터를 열 방향으로 브로드캐스트 (상류로 갈수록 높아짐)
+    rows, _ = _coord_grid(h, w)
+    elevation[:fall_r] = hard_rock_height + (fall_r - rows[:fall_r]) * 0.3
     
     # 폭포 절벽 (거의 수직)
     cliff_width = max(3, int(5 * stage))
-    for r in range(fall_r, min(fall_r + cliff_width, h)):
-        for c in range(w):
-            t = (r - fall_r) / cliff_width
-            # 수직에 가까운 낙하
-            elevation[r, c] = hard_rock_height * (1 - t**0.5) + 10.0 * t**0.5
+    t = (rows[fall_r:fall_r + cliff_width] - fall_r) / cliff_width
+    # 수직에 가까운 낙하
+    elevation[fall_r:fall_r + cliff_width] = hard_rock_height * (1 - t**0.5) + 10.0 * t**0.5
     
     # 하류 (연암층 - 침식됨)
-    for r in range(fall_r + cliff_width, h):
-        for c in range(w):
-            downstream_drop = (r - fall_r - cliff_width) * 0.15
-            elevation[r, c] = 10.0 - downstream_drop
+    elevation[fall_r + cliff_width:] = 10.0 - (rows[fall_r + cliff_width:] - fall_r - cliff_width) * 0.15
     
     # 협곡 (폭포 후퇴 경로) - stage에 따라 발달
     gorge_start = fall_r + cliff_width
@@ -3494,36 +3595,30 @@ def create_waterfall(grid_size: int = 100, stage: float = 1.0,
     gorge_depth = 10.0 * stage
     gorge_width = int(6 + 4 * stage)
     
-    for r in range(gorge_start, min(gorge_end, h)):
-        for dc in range(-gorge_width, gorge_width + 1):
-            c = center + dc
-            if 0 <= c < w:
-                # V자 협곡 단면
-                depth = gorge_depth * (1 - abs(dc) / gorge_width)
-                elevation[r, c] -= depth
+    # V자 협곡 단면 (열 프로파일을 해당 행 구간에 일괄 차감)
+    c0, c1 = max(center - gorge_width, 0), min(center + gorge_width + 1, w)
+    dc = np.arange(c0, c1) - center
+    depth = gorge_depth * (1 - np.abs(dc) / gorge_width)
+    slab = elevation[gorge_start:min(gorge_end, h), c0:c1]
+    np.subtract(slab, depth.astype(_DTYPE), out=slab)
     
     # 하천 수로
     channel_width = 4
-    for r in range(h):
-        for dc in range(-channel_width, channel_width + 1):
-            c = center + dc
-            if 0 <= c < w:
-                channel_depth = 3.0 * (1 - abs(dc) / channel_width)
-                elevation[r, c] -= channel_depth
+    c0, c1 = max(center - channel_width, 0), min(center + channel_width + 1, w)
+    dc = np.arange(c0, c1) - center
+    channel_depth = 3.0 * (1 - np.abs(dc) / channel_width)
+    slab = elevation[:, c0:c1]
+    np.subtract(slab, channel_depth.astype(_DTYPE), out=slab)
     
     # 플런지풀 (폭호)
     pool_r = fall_r + cliff_width + 3
     pool_depth = 12.0 + 5.0 * stage
     pool_radius = 8
     
-    for dr in range(-pool_radius, pool_radius + 1):
-        for dc in range(-pool_radius, pool_radius + 1):
-            r_pos, c_pos = pool_r + dr, center + dc
-            if 0 <= r_pos < h and 0 <= c_pos < w:
-                dist = np.sqrt(dr**2 + dc**2)
-                if dist < pool_radius:
-                    pool_effect = pool_depth * (1 - (dist / pool_radius)**2)
-                    elevation[r_pos, c_pos] = min(elevation[r_pos, c_pos], 5.0 - pool_effect)
+    dist = _radial_distance(2 * pool_radius + 1, 2 * pool_radius + 1, pool_radius, pool_radius)
+    pool_effect = pool_depth * (1 - (dist / pool_radius)**2)
+    _stamp(elevation, pool_r, center, (5.0 - pool_effect).astype(_DTYPE), dist < pool_radius,
+           np.minimum)
     
     if return_metadata:
         return elevation, {
@@ -3588,21 +3683,21 @@ def create_karst_doline(grid_size: int = 100, stage: float = 1.0,
     - Waltham et al. (2005) Sinkholes and Subsidence
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 석회암 대지
     elevation[:, :] = 30.0
     
-    np.random.seed(42)
+    rng = np.random.RandomState(42)
     doline_info = []
     total_area = 0
     max_depth = 0
     
     for i in range(num_dolines):
-        dy = int(h * 0.2 + np.random.rand() * h * 0.6)
-        dx = int(w * 0.2 + np.random.rand() * w * 0.6)
-        radius = int(w * 0.08 * (0.5 + np.random.rand() * 0.5))
-        depth = 20.0 * stage * (0.5 + np.random.rand() * 0.5)
+        dy = int(h * 0.2 + rng.rand() * h * 0.6)
+        dx = int(w * 0.2 + rng.rand() * w * 0.6)
+        radius = int(w * 0.08 * (0.5 + rng.rand() * 0.5))
+        depth = 20.0 * stage * (0.5 + rng.rand() * 0.5)
         
         # 돌리네 유형 결정
         if stage < 0.4:
@@ -3615,13 +3710,16 @@ def create_karst_doline(grid_size: int = 100, stage: float = 1.0,
             doline_type = 'polygenetic'  # 복합형
             profile_exp = 1.5
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - dy)**2 + (c - dx)**2)
-                if dist < radius:
-                    z = depth * (1 - (dist / radius) ** profile_exp)
-                    elevation[r, c] = max(0, elevation[r, c] - z)
-                    total_area += 1
+        # 반경 안 경계 상자만 계산 (격자 전체 순회 대신)
+        window = _stamp_window(h, w, dy, dx, radius, radius)
+        if radius > 0 and window is not None:
+            rs, cs, kr, kc = window
+            dist = _radial_distance(2 * radius + 1, 2 * radius + 1, radius, radius)[kr, kc]
+            inside = dist < radius
+            z = depth * (1 - (dist / radius) ** profile_exp)
+            slab = elevation[rs, cs]
+            slab[inside] = np.maximum(0, slab[inside] - z[inside])
+            total_area += int(inside.sum())
         
         doline_info.append({
             'center': (dy, dx),
@@ -3638,18 +3736,17 @@ def create_karst_doline(grid_size: int = 100, stage: float = 1.0,
         cy1, cx1 = d1['center']
         cy2, cx2 = d2['center']
         
-        for r in range(h):
-            for c in range(w):
-                # 두 돌리네 사이의 골짜기
-                t = np.clip(((r - cy1) * (cy2 - cy1) + (c - cx1) * (cx2 - cx1)) / 
-                           max(1, (cy2 - cy1)**2 + (cx2 - cx1)**2), 0, 1)
-                closest_y = cy1 + t * (cy2 - cy1)
-                closest_x = cx1 + t * (cx2 - cx1)
-                dist_to_line = np.sqrt((r - closest_y)**2 + (c - closest_x)**2)
-                
-                if dist_to_line < 8:
-                    uvala_depth = 5.0 * (1 - dist_to_line / 8) * (stage - 0.8) / 0.2
-                    elevation[r, c] = max(0, elevation[r, c] - uvala_depth)
+        # 두 돌리네 사이의 골짜기 (선분까지의 거리)
+        rr, cc = _coord_grid(h, w)
+        t = np.clip(((rr - cy1) * (cy2 - cy1) + (cc - cx1) * (cx2 - cx1)) / 
+                    max(1, (cy2 - cy1)**2 + (cx2 - cx1)**2), 0, 1)
+        closest_y = cy1 + t * (cy2 - cy1)
+        closest_x = cx1 + t * (cx2 - cx1)
+        dist_to_line = np.sqrt((rr - closest_y)**2 + (cc - closest_x)**2)
+        
+        valley = dist_to_line < 8
+        uvala_depth = 5.0 * (1 - dist_to_line[valley] / 8) * (stage - 0.8) / 0.2
+        elevation[valley] = np.maximum(0, elevation[valley] - uvala_depth)
     
     if return_metadata:
         # 형성 단계 판정
@@ -3704,7 +3801,7 @@ def create_ria_coast(grid_size: int = 100, stage: float = 1.0) -> np.ndarray:
     - 좁고 깊은 만 (리아)
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 산지 배경 (높은 육지)
     elevation[:, :] = 50.0
@@ -3718,27 +3815,26 @@ def create_ria_coast(grid_size: int = 100, stage: float = 1.0) -> np.ndarray:
         valley_width = 12 + (i % 2) * 4  # 약간의 변화
         valley_depth = 40.0 + (i % 3) * 10
         
-        for r in range(h):
-            for c in range(w):
-                dx = abs(c - valley_x)
-                
-                if dx < valley_width:
-                    # V자곡 (상류로 갈수록 좁아짐)
-                    upstream_factor = 1 - r / h * 0.5
-                    effective_width = valley_width * upstream_factor
-                    
-                    if dx < effective_width:
-                        depth = valley_depth * (1 - dx / effective_width)
-                        elevation[r, c] = min(elevation[r, c], 50.0 - depth)
+        c0, c1 = max(valley_x - valley_width + 1, 0), min(valley_x + valley_width, w)
+        if c0 >= c1:
+            continue
+        dx = np.abs(np.arange(c0, c1) - valley_x)[None, :]
+        
+        # V자곡 (상류로 갈수록 좁아짐)
+        upstream_factor = 1 - _coord_grid(h, w)[0] / h * 0.5
+        effective_width = valley_width * upstream_factor
+        
+        valley = dx < effective_width
+        depth = valley_depth * (1 - dx / effective_width)
+        slab = elevation[:, c0:c1]
+        np.minimum(slab, (50.0 - depth).astype(_DTYPE), out=slab, where=valley)
     
     # 해수면 (stage에 따라 상승)
     sea_level = 15.0 * stage  # 높을수록 많이 침수
     
-    for r in range(h):
-        for c in range(w):
-            if elevation[r, c] < sea_level:
-                # 해수면 아래 = 바다 (리아)
-                elevation[r, c] = -10.0 - (sea_level - elevation[r, c]) * 0.3
+    # 해수면 아래 = 바다 (리아)
+    sea = elevation < sea_level
+    elevation[sea] = -10.0 - (sea_level - elevation[sea]) * 0.3
                 
     return elevation
 
@@ -3764,39 +3860,30 @@ def create_tombolo(grid_size: int = 100, stage: float = 1.0,
     Reference: Evans (1942) Tombolo Formation
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     
-    # 바다
-    elevation[:, :] = -5.0
-    
-    # 본토 (왼쪽)
-    for c in range(int(w * 0.3)):
-        elevation[:, c] = 15.0
-        
-    # 섬 (오른쪽)
+    # 바다 + 본토 (왼쪽) + 섬 (오른쪽)
     island_cy = h // 2
     island_cx = int(w * 0.75)
     island_radius = int(w * 0.12)
+    elevation = _tombolo_background(h, w, island_cy, island_cx, island_radius).copy()
     
-    for r in range(h):
-        for c in range(w):
-            dist = np.sqrt((r - island_cy)**2 + (c - island_cx)**2)
-            if dist < island_radius:
-                elevation[r, c] = 20.0 * (1 - dist / island_radius / 1.5)
-                
     # 육계사주 (연결)
     tombolo_start = int(w * 0.3)
     tombolo_end = island_cx - island_radius
     tombolo_length = tombolo_end - tombolo_start
     
-    for c in range(tombolo_start, tombolo_end):
-        t = (c - tombolo_start) / max(tombolo_length, 1)
-        width = int(5 * (1 - abs(t - 0.5) * 2) * stage)
+    # 열마다 반폭이 다른 삼각형 단면 → (행, 열) 마스크로 한 번에 기록
+    if tombolo_length > 0:
+        t = np.arange(tombolo_length) / max(tombolo_length, 1)
+        width = (5 * (1 - np.abs(t - 0.5) * 2) * stage).astype(int)
         
-        for dr in range(-width, width + 1):
-            r = island_cy + dr
-            if 0 <= r < h:
-                elevation[r, c] = 3.0 * (1 - abs(dr) / max(width, 1))
+        reach = int(np.abs(width).max())
+        r0, r1 = max(island_cy - reach, 0), min(island_cy + reach + 1, h)
+        dr = np.abs(np.arange(r0, r1) - island_cy)[:, None]
+        bar = dr <= width
+        z = 3.0 * (1 - dr / np.maximum(width, 1))
+        slab = elevation[r0:r1, tombolo_start:tombolo_end]
+        slab[bar] = z[bar]
     
     if return_metadata:
         return elevation, {
@@ -3858,32 +3945,15 @@ def create_sea_arch(grid_size: int = 100, stage: float = 1.0,
     Reference: Trenhaile (1987) The Geomorphology of Rock Coasts
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
     
-    # 바다 (하단)
+    # 바다 (하단) + 육지 절벽 + 돌출부 (곶 - headland)
     sea_line = int(h * 0.4)
-    elevation[sea_line:, :] = -8.0
-    
-    # 육지 절벽
     cliff_height = 35.0
-    for r in range(sea_line):
-        for c in range(w):
-            dist_from_edge = min(r, c, w - c - 1)
-            elevation[r, c] = cliff_height
-    
-    # 돌출부 (곶 - headland)
     headland_cx = w // 2
     headland_width = int(w * 0.35)
     headland_length = int(h * 0.4)
-    
-    for r in range(sea_line, sea_line + headland_length):
-        taper = 1 - (r - sea_line) / headland_length * 0.5
-        current_width = int(headland_width * taper)
-        
-        for c in range(headland_cx - current_width // 2, headland_cx + current_width // 2):
-            if 0 <= c < w:
-                height = cliff_height * (1 - (r - sea_line) / headland_length * 0.2)
-                elevation[r, c] = height
+    elevation = _sea_arch_background(h, w, sea_line, cliff_height,
+                                     headland_cx, headland_width, headland_length).copy()
     
     # 해식아치 (곶 중간에 관통)
     arch_r = sea_line + int(headland_length * 0.5)
@@ -3891,20 +3961,21 @@ def create_sea_arch(grid_size: int = 100, stage: float = 1.0,
     arch_width = int(headland_width * 0.3 * stage)
     arch_area = 0
     
-    for dr in range(-8, 9):
-        for dc in range(-arch_width, arch_width + 1):
-            r = arch_r + dr
-            c = headland_cx + dc
-            
-            if 0 <= r < h and 0 <= c < w:
-                arch_profile = arch_height * np.sqrt(max(0, 1 - (dc / max(arch_width, 1))**2))
-                
-                if abs(dr) < 3 and arch_profile > 5:
-                    elevation[r, c] = -5.0
-                    arch_area += 1
-                elif abs(dr) < 5:
-                    if elevation[r, c] > arch_profile:
-                        elevation[r, c] = min(elevation[r, c], cliff_height - arch_profile * 0.3)
+    # 아치 단면은 열에만 의존 → 아치 중심 ±4행 구간에 브로드캐스트
+    r0, r1 = max(arch_r - 4, 0), min(arch_r + 5, h)
+    c0, c1 = max(headland_cx - arch_width, 0), min(headland_cx + arch_width + 1, w)
+    if r0 < r1 and c0 < c1:
+        dr = np.abs(np.arange(r0, r1) - arch_r)[:, None]
+        dc = np.arange(c0, c1) - headland_cx
+        arch_profile = arch_height * np.sqrt(np.maximum(0, 1 - (dc / max(arch_width, 1))**2))
+        
+        slab = elevation[r0:r1, c0:c1]
+        tunnel = (dr < 3) & (arch_profile > 5)
+        # 터널 양옆 천장부는 아치 단면만큼 낮춤
+        roof = ~tunnel & (slab > arch_profile)
+        np.minimum(slab, (cliff_height - arch_profile * 0.3).astype(_DTYPE), out=slab, where=roof)
+        slab[tunnel] = -5.0
+        arch_area = int(tunnel.sum())
     
     if return_metadata:
         # 진화 단계 판정
@@ -3979,7 +4050,7 @@ def create_crater_lake(grid_size: int = 100, stage: float = 1.0,
     Reference: Simkin & Siebert (1994) Volcanoes of the World
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     center = (h // 2, w // 2)
     max_outer_radius = int(w * 0.4)
@@ -4025,37 +4096,32 @@ def create_crater_lake(grid_size: int = 100, stage: float = 1.0,
     
     lake_area = 0
     
-    for r in range(h):
-        for c in range(w):
-            dist = np.sqrt((r - center[0])**2 + (c - center[1])**2)
-            
-            if dist > outer_radius:
-                elevation[r, c] = 0
-            elif dist > crater_radius:
-                # 외륜산/화산 사면
-                t = (dist - crater_radius) / max(outer_radius - crater_radius, 1)
-                # 화산 사면 프로파일 (오목한 형태)
-                profile = (1 - t ** 0.7)
-                elevation[r, c] = volcano_height * profile
-            else:
-                # 화구/칼데라 내부
-                if water_level is not None and water_level > 5:
-                    # 호수 (물)
-                    base_depth = -crater_depth
-                    bowl_shape = (dist / max(crater_radius, 1)) ** 2 * crater_depth * 0.3
-                    floor_elev = base_depth + bowl_shape
-                    
-                    if floor_elev < -water_level:
-                        # 수면 아래
-                        elevation[r, c] = -water_level  # 수면
-                        lake_area += 1
-                    else:
-                        # 노출된 바닥
-                        elevation[r, c] = floor_elev
-                else:
-                    # 건조한 화구
-                    bowl_shape = (dist / max(crater_radius, 1)) ** 2 * crater_depth * 0.5
-                    elevation[r, c] = -crater_depth + bowl_shape
+    # 외륜산 바깥은 0 유지, 사면과 화구 내부만 마스크로 기록
+    dist = _radial_distance(h, w, center[0], center[1])
+    slope = (dist > crater_radius) & (dist <= outer_radius)
+    crater = dist <= crater_radius
+    
+    # 외륜산/화산 사면
+    t = (dist[slope] - crater_radius) / max(outer_radius - crater_radius, 1)
+    # 화산 사면 프로파일 (오목한 형태)
+    profile = (1 - t ** 0.7)
+    elevation[slope] = volcano_height * profile
+    
+    # 화구/칼데라 내부
+    d = dist[crater] / max(crater_radius, 1)
+    if water_level is not None and water_level > 5:
+        # 호수 (물): 수면 아래는 수면, 나머지는 노출된 바닥
+        base_depth = -crater_depth
+        bowl_shape = d ** 2 * crater_depth * 0.3
+        floor_elev = base_depth + bowl_shape
+        
+        lake = floor_elev < -water_level
+        elevation[crater] = np.where(lake, -water_level, floor_elev)
+        lake_area = int(lake.sum())
+    else:
+        # 건조한 화구
+        bowl_shape = d ** 2 * crater_depth * 0.5
+        elevation[crater] = -crater_depth + bowl_shape
     
     if return_metadata:
         return elevation, {
@@ -4116,25 +4182,25 @@ def create_lava_plateau(grid_size: int = 100, stage: float = 1.0,
     - 재침식(rejuvenation): 새 하천이 협곡 형성
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     lava_mask = np.zeros((h, w), dtype=bool)  # 용암 위치 표시
     center = w // 2
     
     # 기반 고원 높이
     plateau_base = 30.0
     
+    # 모든 단계의 단면이 열(중심으로부터의 거리)에만 의존 → 행 하나를 만들어 브로드캐스트
+    dx = np.abs(np.arange(w) - center)
+    
     if stage < 0.25:
         # Stage 0~0.25: 원래 V자곡 (하천 흐름)
         v_depth = 30.0
-        for r in range(h):
-            for c in range(w):
-                dx = abs(c - center)
-                elevation[r, c] = plateau_base
-                
-                # V자곡
-                if dx < 18:
-                    v_shape = v_depth * (1 - dx / 18) ** 1.2
-                    elevation[r, c] -= v_shape
+        profile = np.full(w, plateau_base, dtype=_DTYPE)
+        
+        # V자곡
+        v = dx < 18
+        profile[v] -= (v_depth * (1 - dx[v] / 18) ** 1.2).astype(_DTYPE)
+        elevation[:] = profile
                     
     elif stage < 0.5:
         # Stage 0.25~0.5: 용암 분출 → 골짜기 메움
@@ -4142,68 +4208,42 @@ def create_lava_plateau(grid_size: int = 100, stage: float = 1.0,
         v_depth = 30.0 * (1 - progress * 0.9)  # V자곡 점점 메워짐
         lava_thickness = 25.0 * progress
         
-        for r in range(h):
-            # 용암 흐름 범위 (상류에서 하류로 진행)
-            flow_reach = int(h * progress)
-            
-            for c in range(w):
-                dx = abs(c - center)
-                elevation[r, c] = plateau_base
-                
-                # 잔여 V자곡
-                if dx < 18:
-                    v_shape = v_depth * (1 - dx / 18) ** 1.2
-                    elevation[r, c] -= v_shape
-                
-                # 용암 채움
-                if r < flow_reach and dx < 20:
-                    lava_fill = lava_thickness * (1 - dx / 20) ** 0.8
-                    elevation[r, c] += lava_fill
-                    lava_mask[r, c] = True
-                    
-    elif stage < 0.75:
-        # Stage 0.5~0.75: 용암대지 평탄화
-        progress = (stage - 0.5) / 0.25
+        # 용암 흐름 범위 (상류에서 하류로 진행)
+        flow_reach = int(h * progress)
         
-        for r in range(h):
-            for c in range(w):
-                dx = abs(c - center)
-                
-                # 평탄한 용암대지
-                if dx < 25:
-                    elevation[r, c] = plateau_base + 5.0
-                    lava_mask[r, c] = True
-                else:
-                    # 가장자리 경사
-                    edge_t = (dx - 25) / (w // 2 - 25)
-                    elevation[r, c] = (plateau_base + 5.0) * (1 - edge_t ** 0.7)
+        # 잔여 V자곡
+        profile = np.full(w, plateau_base, dtype=_DTYPE)
+        v = dx < 18
+        profile[v] -= (v_depth * (1 - dx[v] / 18) ** 1.2).astype(_DTYPE)
+        elevation[:] = profile
+        
+        # 용암 채움
+        lava = dx < 20
+        lava_fill = (lava_thickness * (1 - dx[lava] / 20) ** 0.8).astype(_DTYPE)
+        elevation[:flow_reach, lava] += lava_fill
+        lava_mask[:flow_reach, lava] = True
                     
     else:
-        # Stage 0.75~1.0: 새 협곡 형성
-        progress = (stage - 0.75) / 0.25
-        gorge_width = int(6 + 6 * progress)
-        gorge_depth = 35.0 * progress
+        # Stage 0.5~: 평탄한 용암대지 + 가장자리 경사
+        lava = dx < 25
+        profile = np.full(w, plateau_base + 5.0, dtype=_DTYPE)
+        edge_t = (dx[~lava] - 25) / max(w // 2 - 25, 1)
+        profile[~lava] = (plateau_base + 5.0) * (1 - edge_t ** 0.7)
         
-        for r in range(h):
-            for c in range(w):
-                dx = abs(c - center)
-                
-                # 용암대지 기반
-                if dx < 25:
-                    elevation[r, c] = plateau_base + 5.0
-                    lava_mask[r, c] = True
-                else:
-                    edge_t = (dx - 25) / (w // 2 - 25)
-                    elevation[r, c] = (plateau_base + 5.0) * (1 - edge_t ** 0.7)
-                
-                # 새로운 협곡 (하천 재침식)
-                if dx < gorge_width:
-                    gorge_shape = gorge_depth * (1 - (dx / gorge_width) ** 2)
-                    elevation[r, c] -= gorge_shape
-                    
-                    # 수직 절벽 형성 (주상절리 효과)
-                    if dx > gorge_width * 0.7:
-                        elevation[r, c] -= 3.0  # 급경사
+        if stage >= 0.75:
+            # Stage 0.75~1.0: 새 협곡 형성 (하천 재침식)
+            progress = (stage - 0.75) / 0.25
+            gorge_width = int(6 + 6 * progress)
+            gorge_depth = 35.0 * progress
+            
+            gorge = dx < gorge_width
+            profile[gorge] -= (gorge_depth * (1 - (dx[gorge] / gorge_width) ** 2)).astype(_DTYPE)
+            
+            # 수직 절벽 형성 (주상절리 효과)
+            profile[gorge & (dx > gorge_width * 0.7)] -= 3.0  # 급경사
+        
+        elevation[:] = profile
+        lava_mask[:] = lava
     
     if return_metadata:
         return elevation, {
@@ -4232,7 +4272,7 @@ def create_coastal_dune(grid_size: int = 100, stage: float = 1.0,
                         num_dunes: int = 3) -> np.ndarray:
     """해안사구 (Coastal Dune) - 해안가 모래 언덕"""
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 바다 (아래)
     beach_line = int(h * 0.7)
@@ -4250,16 +4290,16 @@ def create_coastal_dune(grid_size: int = 100, stage: float = 1.0,
         dune_r = dune_zone_start + i * (dune_zone_end - dune_zone_start) // (num_dunes + 1)
         dune_height = 15.0 * stage * (1 - i * 0.2)
         
-        for r in range(h):
-            for c in range(w):
-                dr = abs(r - dune_r)
-                if dr < 10:
-                    # 사구 형태 (바람받이 완만, 바람그늘 급)
-                    if r < dune_r:
-                        z = dune_height * (1 - dr / 12)
-                    else:
-                        z = dune_height * (1 - dr / 8)
-                    elevation[r, c] = max(elevation[r, c], z)
+        # 사구 단면은 행에만 의존 → 사구 중심 ±9행 구간에 열 방향 브로드캐스트
+        r0, r1 = max(dune_r - 9, 0), min(dune_r + 10, h)
+        if r0 >= r1:
+            continue
+        rows = np.arange(r0, r1)
+        dr = np.abs(rows - dune_r)
+        # 사구 형태 (바람받이 완만, 바람그늘 급)
+        z = np.where(rows < dune_r, dune_height * (1 - dr / 12), dune_height * (1 - dr / 8))
+        slab = elevation[r0:r1]
+        np.maximum(slab, z.astype(_DTYPE)[:, None], out=slab)
                     
     return elevation
 
@@ -4277,7 +4317,7 @@ def create_uvala(grid_size: int = 100, stage: float = 1.0,
     Stage 0.5~1.0: 돌리네들이 합쳐짐
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 30.0  # 석회암 대지
     
     center = w // 2
@@ -4293,26 +4333,25 @@ def create_uvala(grid_size: int = 100, stage: float = 1.0,
     doline_radius = int(w * 0.15)
     doline_depth = 20.0 * stage
     
+    rows, cols = _coord_grid(h, w)
+    
     for i, (cy, cx) in enumerate(doline_positions[:num_dolines]):
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - cy)**2 + (c - cx)**2)
-                if dist < doline_radius:
-                    # 돌리네 형태 (가장자리 높고 중앙 낮음)
-                    depth = doline_depth * (1 - dist / doline_radius)
-                    elevation[r, c] = min(elevation[r, c], 30.0 - depth)
+        # 반경 판정은 제곱거리로, 제곱근은 돌리네 안쪽 셀에서만 계산
+        d2 = (rows - cy)**2 + (cols - cx)**2
+        inside = d2 < doline_radius**2
+        # 돌리네 형태 (가장자리 높고 중앙 낮음)
+        depth = doline_depth * (1 - np.sqrt(d2[inside]) / doline_radius)
+        elevation[inside] = np.minimum(elevation[inside], (30.0 - depth).astype(_DTYPE))
     
     # Stage > 0.5: 돌리네 사이 연결 (합쳐짐)
     if stage > 0.5:
         merge_factor = (stage - 0.5) / 0.5
         merge_depth = 10.0 * merge_factor
         
-        # 중앙 연결부
-        for r in range(h):
-            for c in range(w):
-                dist_center = np.sqrt((r - h//2)**2 + (c - center)**2)
-                if dist_center < doline_radius * 1.5:
-                    elevation[r, c] = min(elevation[r, c], 30.0 - merge_depth)
+        # 중앙 연결부 (깊이가 일정하므로 제곱근 없이 제곱거리만 비교)
+        d2 = (rows - h//2)**2 + (cols - center)**2
+        merge = d2 < (doline_radius * 1.5)**2
+        elevation[merge] = np.minimum(elevation[merge], _DTYPE(30.0 - merge_depth))
                     
     return elevation
 
@@ -4324,26 +4363,26 @@ def create_tower_karst(grid_size: int = 100, stage: float = 1.0,
     중국 구이린 같은 탑 모양 석회암 봉우리
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 5.0  # 저지대
     
-    np.random.seed(42)
+    rng = np.random.RandomState(42)
+    rows, cols = _coord_grid(h, w)
     
     for i in range(num_towers):
         cy = int(h * 0.2 + (i % 3) * h * 0.3)
-        cx = int(w * 0.2 + (i // 3) * w * 0.3 + np.random.randint(-10, 10))
+        cx = int(w * 0.2 + (i // 3) * w * 0.3 + rng.randint(-10, 10))
         
-        tower_height = (40.0 + np.random.rand() * 30) * stage
-        tower_radius = int(w * 0.08 + np.random.rand() * w * 0.04)
+        tower_height = (40.0 + rng.rand() * 30) * stage
+        tower_radius = int(w * 0.08 + rng.rand() * w * 0.04)
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - cy)**2 + (c - cx)**2)
-                if dist < tower_radius:
-                    # 수직 절벽 형태 (가파른 측면)
-                    edge_factor = 1 - (dist / tower_radius) ** 3
-                    z = tower_height * edge_factor
-                    elevation[r, c] = max(elevation[r, c], 5.0 + z)
+        # 반경 판정은 제곱거리로, 제곱근은 탑 안쪽 셀에서만 계산
+        d2 = (rows - cy)**2 + (cols - cx)**2
+        inside = d2 < tower_radius**2
+        # 수직 절벽 형태 (가파른 측면)
+        edge_factor = 1 - (np.sqrt(d2[inside]) / tower_radius) ** 3
+        z = tower_height * edge_factor
+        elevation[inside] = np.maximum(elevation[inside], (5.0 + z).astype(_DTYPE))
                     
     return elevation
 
@@ -4354,7 +4393,7 @@ def create_karren(grid_size: int = 100, stage: float = 1.0) -> np.ndarray:
     빗물에 의한 용식으로 형성된 홈과 릿지
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 20.0  # 석회암 표면
     
     # 용식 홈 (Rillenkarren) - 평행한 홈
@@ -4396,7 +4435,7 @@ def create_transverse_dune(grid_size: int = 100, stage: float = 1.0,
     Reference: Tsoar (2001) Types of Aeolian Sand Dunes
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 5.0  # 사막 기반
     
     # 횡사구 (바람 방향 상→하에 수직 = 좌우로 길게)
@@ -4407,20 +4446,18 @@ def create_transverse_dune(grid_size: int = 100, stage: float = 1.0,
     for i in range(num_ridges):
         ridge_r = ridge_spacing * (i + 1)
         
-        for r in range(h):
-            for c in range(w):
-                dr = r - ridge_r
-                
-                if abs(dr) < ridge_width:
-                    # 비대칭: 바람받이 완만, 바람그늘 급
-                    if dr < 0:
-                        # 바람받이
-                        z = ridge_height * (1 - abs(dr) / (ridge_width * 1.5))
-                    else:
-                        # 바람그늘
-                        z = ridge_height * (1 - dr / (ridge_width * 0.6))
-                    z = max(0, z)
-                    elevation[r, c] = max(elevation[r, c], 5.0 + z)
+        # 능선 단면은 행에만 의존 → 능선 폭 안의 행 구간에 행 프로파일을 브로드캐스트
+        r0, r1 = max(ridge_r - ridge_width + 1, 0), min(ridge_r + ridge_width, h)
+        if r0 >= r1:
+            continue
+        dr = np.arange(r0, r1) - ridge_r
+        # 비대칭: 바람받이 완만, 바람그늘 급
+        z = np.where(dr < 0,
+                     ridge_height * (1 - np.abs(dr) / (ridge_width * 1.5)),  # 바람받이
+                     ridge_height * (1 - dr / (ridge_width * 0.6)))          # 바람그늘
+        z = np.maximum(0, z)
+        slab = elevation[r0:r1]
+        np.maximum(slab, (5.0 + z)[:, None], out=slab)
     
     if return_metadata:
         return elevation, {
@@ -4455,6 +4492,54 @@ def _get_transverse_dune_stage_desc(stage: float) -> str:
         return "성숙 횡사구: 규칙적인 평행 사구열, 비대칭 단면 완성"
 
 
+# 타일 커널 블록 크기: 64x64 float32 타일(16KB)이 L1에 머무름
+_TILE = 64
+
+
+@jit(nopython=True, cache=True)
+def _star_dune_kernel(elevation, cy, cx, dune_height, arm_length, arm_width,
+                      arm_cos, arm_sin):
+    """
+    성사구 봉우리 + 방사상 팔 (타일 단위, 사구 범위 밖 타일은 건너뜀)
+    """
+    h, w = elevation.shape
+    
+    # 봉우리/팔이 닿는 최대 체비셰프 거리
+    reach = max(arm_width * 2, arm_length + arm_width)
+    n_tiles_r = (h + _TILE - 1) // _TILE
+    
+    for tr in range(n_tiles_r):
+        r0 = tr * _TILE
+        r1 = min(r0 + _TILE, h)
+        if r0 - cy >= reach or cy - (r1 - 1) >= reach:
+            continue
+        for c0 in range(0, w, _TILE):
+            c1 = min(c0 + _TILE, w)
+            if c0 - cx >= reach or cx - (c1 - 1) >= reach:
+                continue
+            for r in range(r0, r1):
+                dy = r - cy
+                for c in range(c0, c1):
+                    dx = c - cx
+                    dist = np.sqrt(dx**2 + dy**2)
+                    
+                    # 중앙 봉우리
+                    if dist < arm_width * 2:
+                        z = 5.0 + dune_height * (1 - dist / (arm_width * 2))
+                        if z > elevation[r, c]:
+                            elevation[r, c] = z
+                    
+                    # 팔 (방사상): 팔 방향 투영 거리와 수직 거리
+                    for arm in range(arm_cos.size):
+                        proj = dx * arm_cos[arm] + dy * arm_sin[arm]
+                        perp = abs(arm_cos[arm] * dy - arm_sin[arm] * dx)
+                        
+                        if proj > 0 and proj < arm_length and perp < arm_width:
+                            z = 5.0 + dune_height * 0.6 * (1 - proj / arm_length) * (1 - perp / arm_width)
+                            if z > elevation[r, c]:
+                                elevation[r, c] = z
+
+
 def create_star_dune(grid_size: int = 100, stage: float = 1.0,
                      num_dunes: int = 2, return_metadata: bool = False) -> np.ndarray:
     """성사구 (Star Dune) 형성과정 - 학술 자료 기반
@@ -4471,12 +4556,17 @@ def create_star_dune(grid_size: int = 100, stage: float = 1.0,
     Reference: Lancaster (1989) Star Dunes
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     elevation[:, :] = 5.0  # 사막 기반
     
     dune_info = []
     num_arms = 5  # 별 모양 팔 개수
     
+    # 팔 방향 단위벡터
+    angles = [arm * 2 * np.pi / num_arms for arm in range(num_arms)]
+    arm_cos = np.array([np.cos(a) for a in angles])
+    arm_sin = np.array([np.sin(a) for a in angles])
+    
     for d in range(num_dunes):
         cy = h // 3 + d * h // 3
         cx = w // 3 + d * w // 3
@@ -4491,28 +4581,8 @@ def create_star_dune(grid_size: int = 100, stage: float = 1.0,
             'arm_count': num_arms
         })
         
-        for r in range(h):
-            for c in range(w):
-                dx = c - cx
-                dy = r - cy
-                dist = np.sqrt(dx**2 + dy**2)
-                
-                # 중앙 봉우리
-                if dist < arm_width * 2:
-                    z = dune_height * (1 - dist / (arm_width * 2))
-                    elevation[r, c] = max(elevation[r, c], 5.0 + z)
-                
-                # 팔 (방사상)
-                for arm in range(num_arms):
-                    angle = arm * 2 * np.pi / num_arms
-                    arm_dir = np.array([np.cos(angle), np.sin(angle)])
-                    pos = np.array([dx, dy])
-                    proj = np.dot(pos, arm_dir)
-                    perp = np.abs(np.cross(arm_dir, pos))
-                    
-                    if proj > 0 and proj < arm_length and perp < arm_width:
-                        z = dune_height * 0.6 * (1 - proj / arm_length) * (1 - perp / arm_width)
-                        elevation[r, c] = max(elevation[r, c], 5.0 + z)
+        _star_dune_kernel(elevation, cy, cx, dune_height, arm_length, arm_width,
+                          arm_cos, arm_sin)
     
     if return_metadata:
         return elevation, {
@@ -4580,7 +4650,7 @@ def create_perched_river(grid_size: int = 100, stage: float = 1.0,
     - Hudson (2005) Natural Levee Formation
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 범람원 기본 높이
     base_height = 10.0
@@ -4620,7 +4690,6 @@ def create_perched_river(grid_size: int = 100, stage: float = 1.0,
     center = w // 2
     
     # 하천 사행 (약간의 곡선)
-    np.random.seed(42)
     meander_amp = int(w * 0.05)
     
     for r in range(h):
@@ -4718,7 +4787,7 @@ def create_arete(grid_size: int = 100, stage: float = 1.0):
     두 권곡 사이의 날카로운 능선
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 기본 고산 지형
     base_height = 100.0
@@ -4730,25 +4799,14 @@ def create_arete(grid_size: int = 100, stage: float = 1.0):
     cirque_depth = 60.0 * stage
     cirque_radius = int(w * 0.35)
     
-    for r in range(h):
-        for c in range(w):
-            # 왼쪽 권곡
-            left_cx = center - int(w * 0.25)
-            left_cy = int(h * 0.5)
-            dist_left = np.sqrt((r - left_cy)**2 + (c - left_cx)**2)
-            
-            # 오른쪽 권곡
-            right_cx = center + int(w * 0.25)
-            right_cy = int(h * 0.5)
-            dist_right = np.sqrt((r - right_cy)**2 + (c - right_cx)**2)
-            
-            if dist_left < cirque_radius:
-                bowl_depth = cirque_depth * (1 - (dist_left / cirque_radius)**2)
-                elevation[r, c] = min(elevation[r, c], base_height - bowl_depth)
-            
-            if dist_right < cirque_radius:
-                bowl_depth = cirque_depth * (1 - (dist_right / cirque_radius)**2)
-                elevation[r, c] = min(elevation[r, c], base_height - bowl_depth)
+    # 왼쪽/오른쪽 권곡 (반경 판정은 제곱거리로, 제곱근은 권곡 안쪽 셀에서만)
+    rows, cols = _coord_grid(h, w)
+    for cirque_cx in (center - int(w * 0.25), center + int(w * 0.25)):
+        cirque_cy = int(h * 0.5)
+        d2 = (rows - cirque_cy)**2 + (cols - cirque_cx)**2
+        inside = d2 < cirque_radius**2
+        bowl_depth = cirque_depth * (1 - (np.sqrt(d2[inside]) / cirque_radius)**2)
+        elevation[inside] = np.minimum(elevation[inside], (base_height - bowl_depth).astype(_DTYPE))
     
     # 중앙 능선 (아레트) 강조
     ridge_width = 5
@@ -4766,7 +4824,7 @@ def create_wadi(grid_size: int = 100, stage: float = 1.0):
     평상시 건조, 우기에만 물이 흐르는 계곡
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 건조 고원
     base_height = 50.0
@@ -4806,11 +4864,12 @@ def create_playa(grid_size: int = 100, stage: float = 1.0):
     건조지역에서 물이 증발하고 남은 평탄한 호수 바닥
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 분지 지형
     center_r, center_c = h // 2, w // 2
     basin_radius = int(min(h, w) * 0.4)
+    rng = np.random.RandomState(42)
     
     for r in range(h):
         for c in range(w):
@@ -4819,7 +4878,7 @@ def create_playa(grid_size: int = 100, stage: float = 1.0):
             if dist < basin_radius:
                 # 분지 내부 (플라야)
                 # 매우 평탄한 호수 바닥
-                elevation[r, c] = 10.0 + np.random.uniform(0, 0.5)  # 거의 평탄
+                elevation[r, c] = 10.0 + rng.uniform(0, 0.5)  # 거의 평탄
             else:
                 # 분지 외부 (산지)
                 rim_height = 50.0 * (1 - basin_radius / (dist + 1))
@@ -4828,9 +4887,9 @@ def create_playa(grid_size: int = 100, stage: float = 1.0):
     # 소금 결정 패턴 (다각형)
     if stage > 0.7:
         for i in range(10):
-            poly_r = center_r + np.random.randint(-basin_radius//2, basin_radius//2)
-            poly_c = center_c + np.random.randint(-basin_radius//2, basin_radius//2)
-            poly_size = np.random.randint(5, 15)
+            poly_r = center_r + rng.randint(-basin_radius//2, basin_radius//2)
+            poly_c = center_c + rng.randint(-basin_radius//2, basin_radius//2)
+            poly_size = rng.randint(5, 15)
             for dr in range(-poly_size, poly_size):
                 for dc in range(-poly_size, poly_size):
                     if 0 <= poly_r+dr < h and 0 <= poly_c+dc < w:
@@ -4848,11 +4907,12 @@ def create_pediment(grid_size: int = 100, stage: float = 1.0):
     하부에는 선상지 연합(Bajada)이 덮이기도 함.
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 1. 후면 산지 (급경사, Mountain Front)
     mountain_end = int(h * 0.25)
     mountain_height = 80.0
+    rng = np.random.RandomState(42)
     
     # 2. 페디먼트 경사 (Pediment Slope)
     # 상부는 암석 노출, 하부는 퇴적물 피복
@@ -4861,7 +4921,7 @@ def create_pediment(grid_size: int = 100, stage: float = 1.0):
         for c in range(w):
             if r < mountain_end:
                 # 산지: 급경사 및 불규칙
-                elevation[r, c] = mountain_height * (0.8 + 0.2 * np.random.rand())
+                elevation[r, c] = mountain_height * (0.8 + 0.2 * rng.rand())
             else:
                 # 페디먼트: 완만한 경사 (1~7도)
                 # 요형 사면 (Concave)
@@ -4890,6 +4950,41 @@ def create_pediment(grid_size: int = 100, stage: float = 1.0):
     return elevation
 
 
+@jit(nopython=True, cache=True)
+def _pedestal_rock_kernel(elevation, rock_r, rock_c, original_radius, rock_height,
+                          erosion_factor, base_height):
+    """버섯바위 하나 (셀마다 유효 반경 안에 드는 가장 높은 층을 찾아 기록)"""
+    h, w = elevation.shape
+    
+    for r in range(max(rock_r - original_radius, 0), min(rock_r + original_radius + 1, h)):
+        for c in range(max(rock_c - original_radius, 0), min(rock_c + original_radius + 1, w)):
+            dist = np.sqrt((r - rock_r)**2 + (c - rock_c)**2)
+            
+            if dist < original_radius:
+                # 바위 내부 - 높이에 따라 반경이 다름
+                # 상부: 원래 반경 유지
+                # 하부: stage에 따라 깎임
+                
+                # 꼭대기 층부터 내려가며 각 높이의 유효 반경 계산 (처음 걸린 층이 최고 높이)
+                for z_level in range(int(rock_height) - 1, -1, -1):
+                    # 지표에서의 높이 비율 (0=바닥, 1=꼭대기)
+                    height_ratio = z_level / rock_height
+                    
+                    # 하부일수록 바람 침식 심함 (지표 가까울수록)
+                    if height_ratio < 0.5:
+                        # 하부: 침식으로 반경 감소
+                        erosion_at_height = erosion_factor * (1 - height_ratio * 2)  # 바닥에서 최대
+                        current_radius = original_radius * (1 - erosion_at_height * 0.7)
+                    else:
+                        # 상부: 원래 반경 유지 (모자 부분)
+                        current_radius = original_radius
+                    
+                    if dist < current_radius:
+                        if base_height + z_level > elevation[r, c]:
+                            elevation[r, c] = base_height + z_level
+                        break
+
+
 def create_pedestal_rock(grid_size: int = 100, stage: float = 1.0):
     """버섯바위 (Pedestal Rock) - 바람에 의한 차별풍화 지형
     
@@ -4900,7 +4995,7 @@ def create_pedestal_rock(grid_size: int = 100, stage: float = 1.0):
     바람에 실려온 모래가 하부를 깎아냄 (지표 가까울수록 모래 농도 높음)
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 사막 평원
     base_height = 5.0
@@ -4908,45 +5003,22 @@ def create_pedestal_rock(grid_size: int = 100, stage: float = 1.0):
     
     # 버섯바위 여러 개
     num_rocks = 3
-    np.random.seed(42)
+    rng = np.random.RandomState(42)
     
     for i in range(num_rocks):
         # 위치
-        rock_r = np.random.randint(h // 4, 3 * h // 4)
-        rock_c = np.random.randint(w // 4, 3 * w // 4)
+        rock_r = rng.randint(h // 4, 3 * h // 4)
+        rock_c = rng.randint(w // 4, 3 * w // 4)
         
         # 원래 바위 크기 (stage 0에서의 크기)
-        original_radius = np.random.randint(10, 16)
-        rock_height = np.random.uniform(30, 50)  # 높이 상향 (25-40 -> 30-50)
+        original_radius = rng.randint(10, 16)
+        rock_height = rng.uniform(30, 50)  # 높이 상향 (25-40 -> 30-50)
         
         # stage에 따른 침식 정도 (stage 높을수록 하부 더 깎임)
         erosion_factor = stage  # 0~1
         
-        for r in range(h):
-            for c in range(w):
-                dist = np.sqrt((r - rock_r)**2 + (c - rock_c)**2)
-                
-                if dist < original_radius:
-                    # 바위 내부 - 높이에 따라 반경이 다름
-                    # 상부: 원래 반경 유지
-                    # 하부: stage에 따라 깎임
-                    
-                    # 각 높이에서의 유효 반경 계산
-                    for z_level in range(int(rock_height)):
-                        # 지표에서의 높이 비율 (0=바닥, 1=꼭대기)
-                        height_ratio = z_level / rock_height
-                        
-                        # 하부일수록 바람 침식 심함 (지표 가까울수록)
-                        if height_ratio < 0.5:
-                            # 하부: 침식으로 반경 감소
-                            erosion_at_height = erosion_factor * (1 - height_ratio * 2)  # 바닥에서 최대
-                            current_radius = original_radius * (1 - erosion_at_height * 0.7)
-                        else:
-                            # 상부: 원래 반경 유지 (모자 부분)
-                            current_radius = original_radius
-                        
-                        if dist < current_radius:
-                            elevation[r, c] = max(elevation[r, c], base_height + z_level)
+        _pedestal_rock_kernel(elevation, rock_r, rock_c, original_radius, rock_height,
+                              erosion_factor, base_height)
     
     return elevation
 
@@ -4957,7 +5029,7 @@ def create_estuary(grid_size: int = 100, stage: float = 1.0):
     조석의 영향을 받는 넓은 하구
     """
     h, w = grid_size, grid_size
-    elevation = np.zeros((h, w))
+    elevation = np.zeros((h, w), dtype=_DTYPE)
     
     # 육지 기본
     land_height = 20.0
@@ -4967,26 +5039,22 @@ def create_estuary(grid_size: int = 100, stage: float = 1.0):
     apex_row = int(h * 0.1)
     center = w // 2
     
-    for r in range(h):
-        # 하류로 갈수록 넓어짐
-        progress = (r - apex_row) / (h - apex_row) if r > apex_row else 0
-        estuary_width = int(5 + 40 * progress * stage)
-        
-        for c in range(w):
-            dist = abs(c - center)
-            
-            if r < apex_row:
-                # 상류 하천 (좁음)
-                if dist < 5:
-                    elevation[r, c] = -5.0
-            elif dist < estuary_width:
-                # 에스추어리 영역
-                depth = 10.0 * (1 - dist / estuary_width) * (0.5 + 0.5 * progress)
-                elevation[r, c] = -depth
-            
-            # 조간대 (tide flat)
-            if dist >= estuary_width - 10 and dist < estuary_width and r > apex_row:
-                elevation[r, c] = max(elevation[r, c], -1.0)  # 조간대 (얕음)
+    rows, cols = _coord_grid(h, w)
+    # 하류로 갈수록 넓어짐
+    progress = np.where(rows > apex_row, (rows - apex_row) / (h - apex_row), 0)
+    estuary_width = (5 + 40 * progress * stage).astype(int)
+    dist = np.abs(cols - center)
+    upstream = rows < apex_row
+    
+    # 상류 하천 (좁음)
+    np.copyto(elevation, -5.0, where=upstream & (dist < 5))
+    # 에스추어리 영역
+    depth = 10.0 * (1 - dist / estuary_width) * (0.5 + 0.5 * progress)
+    np.copyto(elevation, -depth, where=~upstream & (dist < estuary_width))
+    
+    # 조간대 (tide flat, 얕음)
+    tide_flat = (rows > apex_row) & (dist >= estuary_width - 10) & (dist < estuary_width)
+    np.maximum(elevation, -1.0, out=elevation, where=tide_flat)
     
     return elevation
 
@@ -5094,3 +5162,101 @@ IDEAL_LANDFORM_GENERATORS = {
     'pediment': lambda gs: create_pediment(gs, 1.0),  # 추가
 }
 
+
+# ============================================
+# 완성 지형 캐시 (UI 반복 호출용)
+# ============================================
+
+# stage 캐시 키 자릿수: UI 슬라이더 간격(0.02, 0.05)을 그대로 구분
+_STAGE_DECIMALS = 2
+
+
+@lru_cache(maxsize=128)
+def _cached_landform(name: str, grid_size: int, stage) -> np.ndarray:
+    """지형 하나 생성 후 읽기 전용으로 캐시 (stage가 None이면 완성 지형)"""
+    if stage is None:
+        elevation = IDEAL_LANDFORM_GENERATORS[name](grid_size)
+    else:
+        elevation = ANIMATED_LANDFORM_GENERATORS[name](grid_size, stage)
+    elevation.flags.writeable = False
+    return elevation
+
+
+def get_landform(name: str, grid_size: int, stage: float = None) -> np.ndarray:
+    """
+    등록된 지형을 캐시에서 반환
+    
+    UI는 같은 지형/해상도/단계를 반복 요청하므로 생성 결과 배열 자체를 캐시.
+    stage는 연속값이라 소수 둘째 자리로 반올림해 캐시 키로 사용.
+    
+    Args:
+        name: IDEAL/ANIMATED_LANDFORM_GENERATORS의 지형 키
+        grid_size: 그리드 크기
+        stage: None이면 완성 지형, 아니면 해당 형성 단계 (0~1)
+        
+    Returns:
+        elevation: 읽기 전용 고도 배열 (수정하려면 .copy() 후 사용)
+    """
+    if stage is not None:
+        stage = round(float(stage), _STAGE_DECIMALS)
+    return _cached_landform(name, int(grid_size), stage)
+
+
+# ============================================
+# 애니메이션 프레임 일괄 생성
+# ============================================
+
+def _render_frame(func: Callable, grid_size: int, kwargs: dict, stage: float) -> np.ndarray:
+    """프레임 하나 생성 (프로세스 풀에서 pickle 가능하도록 모듈 수준 함수)"""
+    return func(grid_size, stage, **kwargs)
+
+
+def render_frames(func: Callable, grid_size: int, stages: Iterable[float],
+                  max_workers: int = 1, use_processes: bool = False,
+                  dtype=np.float32, out: np.ndarray = None, **kwargs) -> np.ndarray:
+    """
+    여러 stage의 애니메이션 프레임을 생성 (선택적으로 병렬)
+    
+    프레임끼리 독립이므로 stage별로 나눠 생성 후 (n_frames, h, w)로 쌓음.
+    기본은 직렬. max_workers > 1이면 스레드 풀 (벡터화된 NumPy 연산은 GIL을 놓음),
+    순수 Python 루프가 남은 생성기는 use_processes=True로 프로세스 풀 사용.
+    
+    같은 크기의 애니메이션을 반복 생성할 때는 out에 이전 프레임 배열을 넘기면
+    새로 할당하지 않고 그 버퍼에 덮어씀. 각 프레임은 완성되는 대로 바로 기록되므로
+    중간 결과 목록을 따로 들고 있지 않음.
+    
+    Args:
+        func: ANIMATED_LANDFORM_GENERATORS의 생성 함수
+        grid_size: 그리드 크기
+        stages: 형성 단계 목록 (0~1)
+        max_workers: 작업자 수 (기본 1 = 직렬, None이면 CPU 코어 수)
+        use_processes: 프로세스 풀 사용 여부
+        dtype: 결과 배열 dtype (out을 주면 무시하고 out.dtype 사용)
+        out: 결과를 기록할 (n_frames, grid_size, grid_size) 배열 (재사용 버퍼)
+        **kwargs: 생성 함수에 그대로 전달 (return_metadata 제외)
+        
+    Returns:
+        frames: (n_frames, grid_size, grid_size) 고도 배열
+    """
+    stages = list(stages)
+    shape = (len(stages), grid_size, grid_size)
+    if out is None:
+        frames = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"out 배열 크기 {out.shape}가 프레임 크기 {shape}와 맞지 않습니다")
+    else:
+        frames = out
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(stages))
+    render = partial(_render_frame, func, grid_size, kwargs)
+    
+    if workers <= 1:
+        for i, elevation in enumerate(map(render, stages)):
+            frames[i] = elevation
+    else:
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            for i, elevation in enumerate(executor.map(render, stages)):
+                frames[i] = elevation
+    
+    return frames
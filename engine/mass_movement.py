@@ -31,14 +31,18 @@ class MassMovementKernel:
         # 임계 경사 (탄젠트 값)
         self.critical_slope = np.tan(np.radians(friction_angle))
         
-    def check_stability(self) -> np.ndarray:
+    def check_stability(self, slope: np.ndarray = None) -> np.ndarray:
         """
         경사 안정성 검사
         
+        Args:
+            slope: 미리 계산한 경사도 (없으면 새로 계산)
+            
         Returns:
             unstable_mask: 불안정한 셀 마스크 (True = 불안정)
         """
-        slope, _ = self.grid.get_gradient()
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         
         # 경사 > 임계 경사 → 불안정
         unstable = slope > self.critical_slope
@@ -46,7 +50,8 @@ class MassMovementKernel:
         return unstable
         
     def trigger_landslide(self, unstable_mask: np.ndarray, 
-                          efficiency: float = 0.5) -> np.ndarray:
+                          efficiency: float = 0.5,
+                          slope: np.ndarray = None) -> np.ndarray:
         """
         산사태 발생
         
@@ -55,6 +60,7 @@ class MassMovementKernel:
         Args:
             unstable_mask: 불안정 마스크
             efficiency: 이동 효율 (0.0~1.0, 1.0이면 완전 이동)
+            slope: 미리 계산한 경사도 (없으면 새로 계산)
             
         Returns:
             change: 지형 변화량
@@ -70,7 +76,8 @@ class MassMovementKernel:
         dc = np.array([-1,  0,  1, -1,  1, -1,  0,  1])
         
         elev = self.grid.elevation
-        slope, _ = self.grid.get_gradient()
+        if slope is None:
+            slope, _ = self.grid.get_gradient()
         
         # 불안정 셀 좌표
         unstable_coords = np.argwhere(unstable_mask)
@@ -137,10 +144,13 @@ class MassMovementKernel:
         Returns:
             change: 지형 변화량
         """
+        # 경사는 한 번만 계산하여 두 단계에서 공유
+        slope, _ = self.grid.get_gradient()
+        
         # 1. 안정성 검사
-        unstable = self.check_stability()
+        unstable = self.check_stability(slope)
         
         # 2. 불안정 지점에서 산사태 발생
-        change = self.trigger_landslide(unstable)
+        change = self.trigger_landslide(unstable, slope=slope)
         
         return change
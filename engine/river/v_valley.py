@@ -78,14 +78,18 @@ class VValleySimulator:
     def step(self, n_steps: int = 1) -> np.ndarray:
         """시뮬레이션 n스텝 진행"""
         for _ in range(n_steps):
+            # 경사는 지형이 바뀌기 전까지 한 번만 계산해 재사용
+            slope = self.terrain.get_slope()
+            
             # 1. 유량 계산
             self.water.add_precipitation(rate=0.001)
-            self.water.accumulate_flow()
+            self.water.accumulate_flow(slope=slope)
             
             # 2. 하방 침식
             v_erosion = vertical_erosion(
                 self.terrain, self.water,
-                k_erosion=self.k_vertical * (1 - self.rock_hardness)
+                k_erosion=self.k_vertical * (1 - self.rock_hardness),
+                slope=slope
             )
             apply_erosion(self.terrain, v_erosion)
             
@@ -80,9 +80,12 @@ class EarthSystem:
         # Route flow based on current topography + precip
         discharge = self.hydro.route_flow_d8(precipitation=precip_map)
         
+        # Slope is shared by water depth and transport (terrain unchanged in between)
+        slope, _ = self.grid.get_gradient()
+        
         # Update grid state
         self.grid.discharge = discharge
-        self.grid.water_depth = self.hydro.calculate_water_depth(discharge)
+        self.grid.water_depth = self.hydro.calculate_water_depth(discharge, slope=slope)
         
         # 4. Erosion / Deposition (지형 변화)
         # Using the ErosionKernel (ErosionProcess wrapper)
@@ -99,7 +102,8 @@ class EarthSystem:
              x_min, x_max = max(0, int(x-r)), min(self.grid.width, int(x+r+1))
              sediment_influx_map[y_min:y_max, x_min:x_max] += amount
              
-        self.erosion.simulate_transport(discharge, dt=dt, sediment_influx_map=sediment_influx_map)
+        self.erosion.simulate_transport(discharge, dt=dt, sediment_influx_map=sediment_influx_map,
+                                        slope=slope)
         
         # 5. Lateral Erosion (측방 침식) - 곡류 형성
         lateral_enabled = settings.get('lateral_erosion', True)
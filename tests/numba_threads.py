@@ -0,0 +1,11 @@
+
+import sys
+import os
+import subprocess
+
+# workqueue 레이어(tbb/omp 미설치 시 기본)는 parallel 커널에 여러 스레드가 동시에
+# 들어오면 프로세스를 종료시킴 → 별도 프로세스에서 실행해 종료 코드로 확인
+def run_with_workqueue(code):
+    env = dict(os.environ, NUMBA_THREADING_LAYER='workqueue')
+    return subprocess.run([sys.executable, '-c', code], cwd=os.getcwd(), env=env,
+                          capture_output=True, text=True, timeout=600)
@@ -0,0 +1,122 @@
+
+import sys
+import os
+import tempfile
+sys.path.append(os.getcwd())
+
+from engine.dem_io import load_dem_asc, save_dem_asc, create_export_bundle, get_dem_statistics
+import numpy as np
+
+ASC_SAMPLE = """ncols 3
+nrows 2
+xllcorner 0.0
+yllcorner 0.0
+cellsize 10.0
+nodata_value -9999
+1.0 2.0 3.0
+4.0 -9999 6.0
+"""
+
+def test_load_dem_asc():
+    print("Testing load_dem_asc...")
+
+    elevation, meta = load_dem_asc(ASC_SAMPLE)
+
+    assert elevation.shape == (2, 3)
+    assert meta['ncols'] == 3 and meta['nrows'] == 2
+    assert meta['cellsize'] == 10.0
+    assert np.isnan(elevation[1, 1])
+    assert elevation[0, 2] == 3.0 and elevation[1, 2] == 6.0
+    print("ASC Load OK")
+
+    # Windows 줄바꿈
+    elevation_crlf, _ = load_dem_asc(ASC_SAMPLE.replace('\n', '\r\n'))
+    assert np.array_equal(elevation, elevation_crlf, equal_nan=True)
+    print("CRLF OK")
+
+def test_load_dem_asc_corrupt():
+    print("Testing load_dem_asc with corrupt data...")
+
+    corrupt = [
+        ASC_SAMPLE.replace('2.0', 'abc'),                  # 숫자가 아닌 토큰
+        ASC_SAMPLE.replace('4.0 -9999 6.0\n', ''),        # 행 누락
+        ASC_SAMPLE + '7.0 8.0 9.0\n',                     # 헤더보다 행이 많음
+        ASC_SAMPLE.replace('4.0 -9999 6.0', '4.0 6.0'),    # 열 개수가 다른 행
+    ]
+    for content in corrupt:
+        try:
+            load_dem_asc(content)
+        except ValueError as e:
+            assert 'ASC 파싱 오류' in str(e)
+        else:
+            raise AssertionError("corrupt ASC should raise ValueError")
+    print("Corrupt ASC Rejected OK")
+
+def test_save_dem_asc_roundtrip():
+    print("Testing save_dem_asc round trip...")
+
+    elevation = np.arange(12, dtype=np.float64).reshape(3, 4) * 1.5
+    elevation[2, 1] = np.nan
+    original = elevation.copy()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dem.asc")
+        save_dem_asc(elevation, path, cellsize=5.0)
+        with open(path) as f:
+            loaded, meta = load_dem_asc(f.read())
+
+    # 입력 배열은 변경되지 않아야 함
+    assert np.array_equal(elevation, original, equal_nan=True)
+    assert np.array_equal(loaded, original, equal_nan=True)
+    assert meta['cellsize'] == 5.0
+    print("ASC Round Trip OK")
+
+def test_export_bundle():
+    print("Testing create_export_bundle...")
+
+    elevation = np.linspace(0.0, 50.0, 20).reshape(4, 5)
+    elevation[0, 0] = np.nan
+    original = elevation.copy()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = create_export_bundle(elevation, {'cell_size': 2.0}, tmp)
+        for key in ('csv', 'npy', 'asc', 'params'):
+            assert os.path.exists(paths[key])
+
+        with open(paths['asc']) as f:
+            loaded, meta = load_dem_asc(f.read())
+        npy = np.load(paths['npy'])
+
+    assert np.array_equal(elevation, original, equal_nan=True)
+    assert np.allclose(loaded, original, equal_nan=True, atol=1e-4)
+    assert np.array_equal(npy, original, equal_nan=True)
+    assert meta['cellsize'] == 2.0
+    print("Export Bundle OK")
+
+def test_dem_statistics():
+    print("Testing get_dem_statistics...")
+
+    rng = np.random.default_rng(0)
+    elevation = rng.normal(500.0, 20.0, size=(40, 30))
+    elevation[::7, ::5] = np.nan
+    valid = elevation[~np.isnan(elevation)]
+
+    stats = get_dem_statistics(elevation)
+    assert np.isclose(stats['min'], valid.min())
+    assert np.isclose(stats['max'], valid.max())
+    assert np.isclose(stats['mean'], valid.mean())
+    assert np.isclose(stats['std'], valid.std())
+    assert np.isclose(stats['median'], np.median(valid))
+    assert stats['valid_cells'] == valid.size
+    assert stats['nodata_cells'] == elevation.size - valid.size
+    print("Statistics OK")
+
+    assert 'error' in get_dem_statistics(np.full((3, 3), np.nan))
+    print("Empty DEM OK")
+
+if __name__ == "__main__":
+    test_load_dem_asc()
+    test_load_dem_asc_corrupt()
+    test_save_dem_asc_roundtrip()
+    test_export_bundle()
+    test_dem_statistics()
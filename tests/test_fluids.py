@@ -6,6 +6,7 @@ sys.path.append(os.getcwd())
 from engine.grid import WorldGrid
 from engine.fluids import HydroKernel
 import numpy as np
+from numba_threads import run_with_workqueue
 
 def test_hydro():
     print("Testing HydroKernel...")
@@ -36,6 +37,11 @@ def test_hydro():
     assert np.isclose(total_discharge_out, 2500.0), f"Expected 2500.0, got {total_discharge_out}"
     print("Flow Routing OK (Mass Conserved)")
     
+    discharge_mfd = hydro.route_flow_mfd(precipitation=1.0)
+    assert np.allclose(discharge_mfd[0, :], 100.0)
+    assert np.isclose(np.sum(discharge_mfd[4, :]), 2500.0)
+    print("MFD Routing OK (Mass Conserved)")
+    
     # 3. Test Water Depth
     depth = hydro.calculate_water_depth(discharge)
     assert np.all(depth > 0)
@@ -54,5 +60,83 @@ def test_hydro():
     print("Inundation OK")
     print("All HydroKernel tests passed!")
 
+def test_fill_sinks():
+    print("Testing fill_sinks...")
+    
+    grid = WorldGrid(width=7, height=7, cell_size=10.0, sea_level=-100.0)
+    grid.bedrock[:] = 10.0
+    grid.bedrock[1:6, 1:6] = 12.0
+    grid.bedrock[2:5, 2:5] = 5.0   # 가운데 웅덩이 (테두리 12m)
+    grid.bedrock[0, 3] = 8.0       # 낮은 경계 (유출구)
+    grid.update_elevation()
+    original = grid.elevation.copy()
+    
+    hydro = HydroKernel(grid)
+    fill = hydro.fill_sinks(tolerance=0.001)
+    filled = original + fill
+    
+    # 웅덩이는 테두리(월류) 고도 이상으로 채워짐
+    assert np.all(filled[2:5, 2:5] >= 12.0)
+    assert np.all(fill[2:5, 2:5] > 6.9)
+    # 경계와 테두리는 변하지 않음
+    assert np.all(fill[0, :] == 0) and np.all(fill[1, :] == 0)
+    assert np.allclose(grid.water_depth, np.maximum(fill, 0))
+    print("Sink Filled OK")
+    
+    # 모든 내부 셀은 더 낮거나 같은 이웃을 가짐 (하강 경로 존재)
+    for r in range(1, 6):
+        for c in range(1, 6):
+            assert filled[r-1:r+2, c-1:c+2].min() < filled[r, c] or np.isclose(filled[r-1:r+2, c-1:c+2].min(), filled[r, c])
+    
+    # 평탄면은 그대로 둠
+    grid2 = WorldGrid(width=6, height=6, cell_size=10.0, sea_level=-100.0)
+    grid2.bedrock[:] = 3.0
+    grid2.update_elevation()
+    assert np.all(HydroKernel(grid2).fill_sinks() == 0)
+    print("Flat Untouched OK")
+    
+    # 반복 방식: 단일 셀 싱크는 이웃 최소값 + tolerance로 올라감
+    grid3 = WorldGrid(width=5, height=5, cell_size=10.0, sea_level=-100.0)
+    grid3.bedrock[:] = 4.0
+    grid3.bedrock[2, 2] = 1.0
+    grid3.update_elevation()
+    fill3 = HydroKernel(grid3).fill_sinks(tolerance=0.01, method='iterative')
+    assert np.isclose(fill3[2, 2], 3.01)
+    assert np.count_nonzero(fill3) == 1
+    print("Iterative Fill OK")
+
+# Streamlit은 세션마다 스레드에서 실행 → 동시 흐름 계산이 직렬 결과와 같아야 함
+THREADED_ROUTING = """
+import sys, os
+sys.path.append(os.getcwd())
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from engine.grid import WorldGrid
+from engine.fluids import HydroKernel
+
+def route(seed):
+    grid = WorldGrid(width=64, height=64, cell_size=10.0, sea_level=0.0)
+    grid.bedrock[:] = np.random.default_rng(seed).random((64, 64)) * 50.0 + 10.0
+    grid.update_elevation()
+    hydro = HydroKernel(grid)
+    discharge = hydro.route_flow_d8(precipitation=1.0)
+    return discharge, hydro.calculate_water_depth(discharge)
+
+serial = [route(seed) for seed in range(8)]
+with ThreadPoolExecutor(max_workers=4) as pool:
+    threaded = list(pool.map(route, range(8)))
+for (q0, d0), (q1, d1) in zip(serial, threaded):
+    assert np.array_equal(q0, q1) and np.array_equal(d0, d1)
+"""
+
+def test_threaded_routing():
+    print("Testing concurrent route_flow_d8...")
+    
+    result = run_with_workqueue(THREADED_ROUTING)
+    assert result.returncode == 0, result.stderr
+    print("Threaded Routing OK")
+
 if __name__ == "__main__":
     test_hydro()
+    test_fill_sinks()
+    test_threaded_routing()
@@ -31,6 +31,45 @@ def test_grid():
     slope, aspect = grid.get_gradient()
     print(f"Max Slope: {np.max(slope):.2f}")
     
+    # Check flow order (descending elevation, reused while still valid)
+    order = grid.get_flow_order()
+    assert order[0] == 0  # 100m peak first
+    assert np.all(np.diff(grid.elevation.ravel()[order]) <= 0)
+    assert grid.get_flow_order() is order
+    print("Flow Order OK")
+    
+    # Check underwater cache (invalidated by sea level / elevation updates)
+    underwater = grid.is_underwater()
+    assert not underwater.any()
+    assert grid.is_underwater() is underwater
+    grid.sea_level = 20.0
+    assert grid.is_underwater().sum() == 99
+    grid.bedrock[:] = 30.0
+    grid.update_elevation()
+    assert not grid.is_underwater().any()
+    grid.elevation[5, 5] = 0.0
+    grid.invalidate_cache()
+    assert grid.is_underwater()[5, 5]
+    # 복합 대입(-=, +=)도 속성 대입이라 __setattr__에서 캐시가 비워짐
+    grid.elevation -= 100.0
+    assert grid.is_underwater().all()
+    grid.elevation += 100.0
+    assert grid.is_underwater().sum() == 1
+    print("Underwater Cache OK")
+    
+    land_order = grid.get_land_flow_order()
+    assert land_order.size == 99 and 55 not in land_order
+    assert grid.get_land_flow_order() is land_order
+    print("Land Flow Order OK")
+    
+    # Check single precision grid
+    grid32 = WorldGrid(width=8, height=6, dtype=np.float32)
+    grid32.apply_uplift(2.0)
+    grid32.add_sediment(np.ones((6, 8)))
+    assert grid32.elevation.dtype == np.float32
+    assert np.allclose(grid32.elevation, 3.0)
+    print("Float32 Grid OK")
+    
     print("All WorldGrid tests passed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from engine.ideal_landforms import (render_frames, create_star_dune, create_incised_meander,
+                                    get_landform, _cached_landform,
+                                    IDEAL_LANDFORM_GENERATORS, ANIMATED_LANDFORM_GENERATORS)
+import numpy as np
+from numba_threads import run_with_workqueue
+
+# 스레드 풀 프레임 생성이 직렬 생성과 같아야 함 (run_with_workqueue로 실행)
+THREADED_FRAMES = """
+import sys, os
+sys.path.append(os.getcwd())
+import numpy as np
+from engine.ideal_landforms import render_frames, {func}
+stages = np.linspace(0.0, 1.0, 16)
+serial = np.stack([{func}(48, float(s)) for s in stages])
+threaded = render_frames({func}, 48, stages, max_workers=8, dtype=serial.dtype)
+assert np.array_equal(serial, threaded)
+"""
+
+def test_render_frames():
+    print("Testing render_frames...")
+
+    stages = [0.0, 0.5, 1.0]
+    frames = render_frames(create_star_dune, 40, stages)
+    assert frames.shape == (3, 40, 40) and frames.dtype == np.float32
+    for frame, s in zip(frames, stages):
+        assert np.array_equal(frame, create_star_dune(40, s))
+    print("Serial Frames OK")
+
+    result = run_with_workqueue(THREADED_FRAMES.format(func='create_star_dune'))
+    assert result.returncode == 0, result.stderr
+    print("Threaded Numba Frames OK")
+
+def test_incised_meander_frames():
+    print("Testing create_incised_meander frames...")
+
+    # stage > 0.5: 하도 파기와 하안단구가 한 커널 순회에서 적용됨
+    elevation, meta = create_incised_meander(60, 1.0, return_metadata=True)
+    channel_floor = max(meta['base_level'], 80.0 - meta['current_depth'])
+    assert np.isclose(elevation.min(), channel_floor)
+    assert np.any(np.isclose(elevation, 80.0 - meta['current_depth'] * 0.3))  # 첫 단구면
+    print("Terraces OK")
+
+    result = run_with_workqueue(THREADED_FRAMES.format(func='create_incised_meander'))
+    assert result.returncode == 0, result.stderr
+    print("Threaded Incised Meander Frames OK")
+
+def test_get_landform_cache():
+    print("Testing get_landform cache...")
+    
+    _cached_landform.cache_clear()
+    
+    # 같은 지형/크기 반복 호출 → 같은 배열을 캐시에서 반환
+    first = get_landform('v_valley', 50)
+    assert np.array_equal(first, IDEAL_LANDFORM_GENERATORS['v_valley'](50))
+    assert get_landform('v_valley', 50) is first
+    info = _cached_landform.cache_info()
+    assert info.misses == 1 and info.hits == 1
+    print("Repeated Call Cached OK")
+    
+    # 0.01 미만으로 다른 stage는 같은 캐시 항목 (0.501, 0.504 → 0.50)
+    frame = get_landform('delta', 50, 0.501)
+    assert get_landform('delta', 50, 0.504) is frame
+    assert np.array_equal(frame, ANIMATED_LANDFORM_GENERATORS['delta'](50, 0.5))
+    assert get_landform('delta', 50, 0.52) is not frame
+    info = _cached_landform.cache_info()
+    assert info.misses == 3 and info.hits == 2
+    print("Stage Rounding OK")
+    
+    # 반환 배열은 읽기 전용 → 호출한 쪽에서 수정해도 캐시가 오염되지 않음
+    assert not first.flags.writeable
+    expected = first.copy()
+    try:
+        first[0, 0] = -1.0
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cached landform should be read-only")
+    edited = first.copy()
+    edited[:] = 0.0
+    assert np.array_equal(get_landform('v_valley', 50), expected)
+    print("Read-only Cache OK")
+
+if __name__ == "__main__":
+    test_render_frames()
+    test_incised_meander_frames()
+    test_get_landform_cache()
@@ -57,9 +57,41 @@ def test_transport():
     else:
         print("FAILED: No sediment on flat area")
 
+def test_transport_out():
+    print("Testing simulate_transport out buffer...")
+    
+    grid = WorldGrid(width=5, height=10, cell_size=10.0, sea_level=0.0)
+    grid.bedrock[:] = np.linspace(15.0, 5.0, 10)[:, None]
+    grid.update_elevation()
+    erosion = ErosionProcess(grid, K=0.01, m=1.0, n=1.0)
+    discharge = np.full((10, 5), 100.0)
+    
+    # 반환 배열은 호출마다 새 배열 (다음 호출이 덮어쓰지 않음)
+    first = erosion.simulate_transport(discharge, dt=1.0)
+    kept = first.copy()
+    second = erosion.simulate_transport(discharge, dt=1.0)
+    assert second is not first
+    assert np.array_equal(first, kept)
+    print("Fresh Result OK")
+    
+    # out을 넘기면 그 배열에 기록하고 그대로 반환
+    out = np.full((10, 5), 123.0)
+    result = erosion.simulate_transport(discharge, dt=1.0, out=out)
+    assert result is out
+    assert np.any(out != 0.0) and not np.any(out == 123.0)
+    print("Out Buffer OK")
+    
+    try:
+        erosion.simulate_transport(discharge, dt=1.0, out=np.zeros((5, 10)))
+    except ValueError:
+        print("Out Shape Check OK")
+    else:
+        raise AssertionError("mismatched out shape should raise ValueError")
+
 if __name__ == "__main__":
     # Redirect stdout to file
     import sys
     sys.stdout = open("debug_log.txt", "w", encoding="utf-8")
     test_transport()
+    test_transport_out()
     sys.stdout.close()